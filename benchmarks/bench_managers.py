@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the Inglês Autodidata content and user managers
+
+Generates synthetic datasets at each requested scale, times the hot calls,
+writes the results as JSON and optionally compares them with a stored
+baseline, exiting non-zero when something got slower than the threshold.
+
+Usage:
+    python benchmarks/bench_managers.py --scales 1k,100k --output results.json
+    python benchmarks/bench_managers.py --baseline benchmarks/baseline.json
+    python benchmarks/bench_managers.py --update-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.user_manager import UserManager
+from src.vocabulary_manager import VocabularyManager
+from src.grammar_manager import GrammarManager
+from benchmarks.synthetic import make_grammar, make_users, make_vocabulary, write_json
+
+SCALE_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+MIN_RUN_SECONDS = 0.2
+MAX_RUNS = 50
+DEFAULT_THRESHOLD = 1.25
+
+
+def parse_scale(text: str) -> int:
+    """Turn '1k' / '100k' / '1m' / '5000' into an integer"""
+    text = text.strip().lower()
+    if text[-1] in SCALE_SUFFIXES:
+        return int(float(text[:-1]) * SCALE_SUFFIXES[text[-1]])
+    return int(text)
+
+
+def measure(func: Callable, min_seconds: float = MIN_RUN_SECONDS,
+            max_runs: int = MAX_RUNS) -> Dict:
+    """Call `func` repeatedly and summarize its wall time"""
+    times: List[float] = []
+    budget_start = time.perf_counter()
+    while len(times) < max_runs:
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+        if time.perf_counter() - budget_start >= min_seconds:
+            break
+    return {
+        "runs": len(times),
+        "median_s": statistics.median(times),
+        "min_s": min(times),
+    }
+
+
+def bench_scale(count: int, work_dir: str) -> Dict:
+    """Run every benchmark at one dataset size"""
+    vocab_file = os.path.join(work_dir, "vocabulary.json")
+    grammar_file = os.path.join(work_dir, "grammar.json")
+    users_file = os.path.join(work_dir, "users.json")
+
+    write_json(vocab_file, make_vocabulary(count))
+    write_json(grammar_file, make_grammar(count))
+    write_json(users_file, make_users(count))
+
+    vocabulary = VocabularyManager(vocab_file, background=False)
+    grammar = GrammarManager(grammar_file)
+    users = UserManager(users_file)
+
+    some_user = users.users[next(iter(users.users))]
+    category = vocabulary.vocabulary["beginner"][0]["category"]
+    session_stats = {"correct": 7, "total": 10, "time_minutes": 3,
+                     "new_words": 7, "category": "vocabulary"}
+
+    # Indexes are built on first use; build them now so the cases time warm queries
+    vocabulary.search_index
+
+    # Slow whole-file operations only get a single run at large scales
+    io_runs = 5 if count <= 100_000 else 1
+
+    cases = {
+        "_load_vocabulary": (vocabulary._load_vocabulary, io_runs),
+        "_save_vocabulary": (vocabulary._save_vocabulary, io_runs),
+        "_load_exercises": (grammar._load_exercises, io_runs),
+        "_save_exercises": (grammar._save_exercises, io_runs),
+        "_load_users": (users._load_users, io_runs),
+        "_save_users": (users._save_users, io_runs),
+        "search_words": (lambda: vocabulary.search_words("qui"), MAX_RUNS),
+        "get_words_by_category": (lambda: vocabulary.get_words_by_category(category), MAX_RUNS),
+        "get_random_words": (lambda: vocabulary.get_random_words(10), MAX_RUNS),
+        "get_exercises_by_topic(mixed)": (lambda: grammar.get_exercises_by_topic("mixed"), MAX_RUNS),
+        "update_user_stats": (lambda: users.update_user_stats(some_user, session_stats), io_runs),
+        "get_user_stats": (lambda: users.get_user_stats(some_user), MAX_RUNS),
+    }
+
+    results = {}
+    for name, (func, max_runs) in cases.items():
+        results[name] = measure(func, max_runs=max_runs)
+        print(f"   {name:<32}{results[name]['median_s'] * 1000:>12.3f} ms"
+              f"  ({results[name]['runs']} runs)")
+
+    return results
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """List every benchmark whose median slowed down past the threshold"""
+    regressions = []
+    for scale, cases in current["results"].items():
+        base_cases = baseline.get("results", {}).get(scale, {})
+        for name, result in cases.items():
+            base = base_cases.get(name)
+            if not base or base["median_s"] <= 0:
+                continue
+            ratio = result["median_s"] / base["median_s"]
+            if ratio > threshold:
+                regressions.append(
+                    f"{name} @ {scale}: {base['median_s'] * 1000:.3f} ms -> "
+                    f"{result['median_s'] * 1000:.3f} ms ({ratio:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark manager hot paths")
+    parser.add_argument("--scales", default="1k,100k",
+                        help="comma-separated dataset sizes, e.g. 1k,100k,1m")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--update-baseline", metavar="PATH",
+                        help="store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown ratio that counts as a regression")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": {},
+    }
+
+    for scale_text in args.scales.split(","):
+        count = parse_scale(scale_text)
+        print(f"📏 Scale {count:,}")
+        work_dir = tempfile.mkdtemp(prefix="ingles-bench-")
+        try:
+            report["results"][str(count)] = bench_scale(count, work_dir)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    for path in (args.output, args.update_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) beyond {args.threshold:.2f}x:")
+            for line in regressions:
+                print(f"   {line}")
+            sys.exit(1)
+        print("✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
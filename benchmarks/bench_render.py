@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Screen rendering benchmark for Inglês Autodidata
+
+Compares screens per second of the legacy `os.system('clear')` + print
+approach against the buffered FrameRenderer (full redraw and diffed).
+
+Usage: python benchmarks/bench_render.py [--screens N]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.renderer import FrameRenderer
+
+
+class _TtyBuffer(io.StringIO):
+    """In-memory stream that claims to be a terminal"""
+
+    def isatty(self) -> bool:
+        return True
+
+
+def _question_screen(i: int) -> str:
+    """Build a typical grammar question screen"""
+    lines = [
+        f"📝 GRAMMAR PRACTICE - Question {i % 8 + 1}/8",
+        "-" * 60,
+        "🎯 QUESTION:",
+        "   She _____ English for five years.",
+        "",
+        "📋 OPTIONS:",
+        "   1. studies",
+        "   2. studied",
+        "   3. has studied",
+        "   4. studying",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def bench_legacy(screens: int) -> float:
+    """Spawn a clear process and print line by line, like the old clear_screen"""
+    clear_command = "cls" if os.name == "nt" else "clear > /dev/null 2>&1"
+    sink = io.StringIO()
+    start = time.perf_counter()
+    for i in range(screens):
+        os.system(clear_command)
+        with redirect_stdout(sink):
+            for line in _question_screen(i).splitlines():
+                print(line)
+    return time.perf_counter() - start
+
+
+def bench_renderer(screens: int, diff: bool) -> float:
+    """Draw frames through the buffered renderer"""
+    renderer = FrameRenderer(_TtyBuffer(), ansi=True)
+    start = time.perf_counter()
+    for i in range(screens):
+        if not diff:
+            renderer.invalidate()
+        renderer.present(_question_screen(i))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark screen rendering")
+    parser.add_argument("--screens", type=int, default=200, help="screens per run")
+    args = parser.parse_args()
+
+    # Diffing needs a terminal size; pin one so the run is reproducible
+    os.environ.setdefault("COLUMNS", "100")
+    os.environ.setdefault("LINES", "40")
+
+    results = [
+        ("os.system('clear') + print", bench_legacy(args.screens)),
+        ("FrameRenderer (full redraw)", bench_renderer(args.screens * 50, diff=False) / 50),
+        ("FrameRenderer (diffed)", bench_renderer(args.screens * 50, diff=True) / 50),
+    ]
+
+    baseline = args.screens / results[0][1]
+    print(f"{'approach':<32}{'screens/s':>14}{'speedup':>10}")
+    for name, elapsed in results:
+        rate = args.screens / elapsed
+        print(f"{name:<32}{rate:>14,.0f}{rate / baseline:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Synthetic classroom load for Inglês Autodidata
+
+Simulates many learners using the app at once against a shared data
+directory. Each learner behaves like its own copy of the terminal app:
+it loads the JSON stores, logs in, runs vocabulary and grammar sessions
+with scripted answers and log-normal think times, and saves its stats.
+
+Reports throughput, p50/p95/p99 latency per operation, and lost or
+corrupted writes found by comparing users.json with what each learner
+actually recorded.
+
+Usage: python benchmarks/load_harness.py --learners 50 --sessions 5 [--processes]
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.user_manager import UserManager
+from src.vocabulary_manager import VocabularyManager
+from src.grammar_manager import GrammarManager
+from src.learning_session import LearningSession
+from benchmarks.synthetic import GRAMMAR_TOPICS, LEVELS, new_profile
+
+
+def seed_data(data_dir: str, learners: int) -> List[str]:
+    """Create users.json, vocabulary.json and grammar.json for the run"""
+    os.makedirs(data_dir, exist_ok=True)
+    users = {}
+    for i in range(learners):
+        email = f"learner{i}@example.com"
+        users[email] = new_profile(f"Learner {i}", email, LEVELS[i % len(LEVELS)])
+
+    with open(os.path.join(data_dir, "users.json"), "w", encoding="utf-8") as f:
+        json.dump(users, f, indent=2, ensure_ascii=False)
+
+    # Materialize the default content packs so every learner parses real files
+    vocabulary = VocabularyManager(os.path.join(data_dir, "vocabulary.json"))
+    vocabulary._save_vocabulary()
+    grammar = GrammarManager(os.path.join(data_dir, "grammar.json"))
+    grammar._save_exercises()
+
+    return list(users.keys())
+
+
+class Recorder:
+    """Collects operation latencies for one learner"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+
+    def time(self, operation: str, func, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.samples.setdefault(operation, []).append(time.perf_counter() - start)
+
+
+def think(rng: random.Random, median: float):
+    """Pause like a learner reading a question (log-normal think time)"""
+    if median > 0:
+        time.sleep(rng.lognormvariate(0, 0.6) * median)
+
+
+def simulate_learner(data_dir: str, email: str, sessions: int, think_median: float,
+                     seed: int) -> Dict:
+    """Run one learner's scripted sessions and report what it recorded"""
+    rng = random.Random(seed)
+    accuracy = rng.uniform(0.4, 0.95)
+    recorder = Recorder()
+    expected = {"sessions": 0, "answers": 0, "correct": 0}
+
+    users = recorder.time("load_users", UserManager, os.path.join(data_dir, "users.json"))
+    vocabulary = recorder.time("load_vocabulary", VocabularyManager,
+                               os.path.join(data_dir, "vocabulary.json"))
+    grammar = recorder.time("load_grammar", GrammarManager,
+                            os.path.join(data_dir, "grammar.json"))
+
+    # An empty store means we read users.json while another learner was rewriting it
+    torn_reads = 0 if users.users else 1
+
+    user = recorder.time("login", users.login_by_email, email)
+    if user is None:
+        reason = "users.json was torn mid-write" if torn_reads else "profile missing"
+        return {"email": email, "samples": recorder.samples, "expected": expected,
+                "torn_reads": torn_reads, "errors": [f"login failed: {reason}"]}
+
+    session = LearningSession(user, users, vocabulary, grammar)
+    errors = []
+
+    for n in range(sessions):
+        started = time.perf_counter()
+        correct = 0
+
+        if n % 2 == 0:
+            items = recorder.time("select_vocabulary", session.select_vocabulary_words,
+                                  user["level"])
+            for word_data in items:
+                think(rng, think_median)
+                answer = word_data["word"] if rng.random() < accuracy else "???"
+                if recorder.time("answer", session.check_vocabulary_answer, word_data, answer):
+                    correct += 1
+            category, new_words = "vocabulary", correct
+        else:
+            topic = rng.choice(GRAMMAR_TOPICS)
+            items = recorder.time("select_grammar", session.select_grammar_exercises, topic)
+            for exercise in items:
+                think(rng, think_median)
+                answer = exercise["correct"] if rng.random() < accuracy else ""
+                if recorder.time("answer", session.check_grammar_answer, exercise, answer):
+                    correct += 1
+            category, new_words = "grammar", 0
+
+        if rng.random() < 0.3:
+            recorder.time("search_words", vocabulary.search_words, rng.choice("aeiou"))
+
+        elapsed = int(time.perf_counter() - started)
+        try:
+            recorder.time("update_stats", session.finish_session, category, correct,
+                          len(items), elapsed, new_words)
+        except (OSError, ValueError) as e:
+            errors.append(f"save failed: {e}")
+            continue
+
+        expected["sessions"] += 1
+        expected["answers"] += len(items)
+        expected["correct"] += correct
+        recorder.time("get_stats", users.get_user_stats, user)
+
+    return {"email": email, "samples": recorder.samples, "expected": expected,
+            "torn_reads": torn_reads, "errors": errors}
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def verify_writes(data_dir: str, results: List[Dict]) -> Dict:
+    """Compare the final users.json with what every learner believes it saved"""
+    path = os.path.join(data_dir, "users.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            users = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        return {"corrupted_file": True, "error": str(e), "lost_sessions": None,
+                "lost_answers": None, "missing_profiles": None}
+
+    lost_sessions = lost_answers = missing = 0
+    for result in results:
+        profile = users.get(result["email"])
+        if profile is None:
+            missing += 1
+            lost_sessions += result["expected"]["sessions"]
+            lost_answers += result["expected"]["answers"]
+            continue
+        stats = profile["stats"]
+        lost_sessions += max(0, result["expected"]["sessions"] - stats["total_sessions"])
+        lost_answers += max(0, result["expected"]["answers"] - stats["total_answers"])
+
+    return {"corrupted_file": False, "lost_sessions": lost_sessions,
+            "lost_answers": lost_answers, "missing_profiles": missing}
+
+
+def run(learners: int, sessions: int, think_median: float, processes: bool,
+        data_dir: str, seed: int) -> Dict:
+    """Drive the whole simulated classroom and aggregate the results"""
+    emails = seed_data(data_dir, learners)
+    pool_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+
+    started = time.perf_counter()
+    with pool_class(max_workers=learners) as pool:
+        futures = [
+            pool.submit(simulate_learner, data_dir, email, sessions, think_median, seed + i)
+            for i, email in enumerate(emails)
+        ]
+        results = [future.result() for future in futures]
+    wall = time.perf_counter() - started
+
+    merged: Dict[str, List[float]] = {}
+    for result in results:
+        for operation, samples in result["samples"].items():
+            merged.setdefault(operation, []).extend(samples)
+
+    operations = {}
+    total_ops = 0
+    for operation, samples in sorted(merged.items()):
+        samples.sort()
+        total_ops += len(samples)
+        operations[operation] = {
+            "count": len(samples),
+            "p50_ms": percentile(samples, 0.50) * 1000,
+            "p95_ms": percentile(samples, 0.95) * 1000,
+            "p99_ms": percentile(samples, 0.99) * 1000,
+            "max_ms": samples[-1] * 1000,
+        }
+
+    return {
+        "learners": learners,
+        "sessions_per_learner": sessions,
+        "workers": "processes" if processes else "threads",
+        "wall_seconds": wall,
+        "throughput_ops_per_second": total_ops / wall if wall else 0.0,
+        "sessions_per_second": sum(r["expected"]["sessions"] for r in results) / wall if wall else 0.0,
+        "operations": operations,
+        "integrity": verify_writes(data_dir, results),
+        "torn_reads": sum(r["torn_reads"] for r in results),
+        "errors": [e for r in results for e in r["errors"]],
+    }
+
+
+def print_report(report: Dict):
+    """Print a human-readable summary"""
+    print(f"👥 {report['learners']} learners x {report['sessions_per_learner']} sessions "
+          f"({report['workers']}) in {report['wall_seconds']:.2f}s")
+    print(f"⚡ Throughput: {report['throughput_ops_per_second']:,.0f} ops/s, "
+          f"{report['sessions_per_second']:,.1f} sessions/s")
+    print("-" * 72)
+    print(f"{'operation':<20}{'count':>8}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}{'max ms':>11}")
+    for name, op in report["operations"].items():
+        print(f"{name:<20}{op['count']:>8}{op['p50_ms']:>11.3f}{op['p95_ms']:>11.3f}"
+              f"{op['p99_ms']:>11.3f}{op['max_ms']:>11.3f}")
+    print("-" * 72)
+
+    integrity = report["integrity"]
+    if integrity["corrupted_file"]:
+        print(f"❌ users.json is corrupted: {integrity['error']}")
+    else:
+        print(f"🧾 Lost sessions: {integrity['lost_sessions']}  "
+              f"Lost answers: {integrity['lost_answers']}  "
+              f"Missing profiles: {integrity['missing_profiles']}")
+    print(f"🧩 Torn reads of users.json: {report['torn_reads']}")
+    if report["errors"]:
+        print(f"⚠️  {len(report['errors'])} learner errors, e.g. {report['errors'][0]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent learners")
+    parser.add_argument("--learners", type=int, default=20)
+    parser.add_argument("--sessions", type=int, default=4, help="sessions per learner")
+    parser.add_argument("--think", type=float, default=0.05,
+                        help="median think time per question in seconds (0 = no pauses)")
+    parser.add_argument("--processes", action="store_true",
+                        help="run learners in separate processes instead of threads")
+    parser.add_argument("--data-dir", help="directory for the data files (default: temporary)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="also write the report to this JSON file")
+    args = parser.parse_args()
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="ingles-load-")
+    try:
+        report = run(args.learners, args.sessions, args.think, args.processes,
+                     data_dir, args.seed)
+    finally:
+        if not args.data_dir:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
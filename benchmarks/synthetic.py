@@ -0,0 +1,126 @@
+"""
+Synthetic content generator for Inglês Autodidata benchmarks
+
+Builds vocabulary, grammar and user datasets of any size in the same shape
+the managers read and write, using a seeded RNG so runs are repeatable.
+"""
+
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+LEVELS = ["beginner", "intermediate", "advanced"]
+CATEGORIES = [
+    "greetings", "objects", "emotions", "nature", "places", "actions",
+    "abstract", "descriptive", "food", "travel", "business", "family"
+]
+GRAMMAR_TOPICS = ["verbs", "articles", "prepositions", "questions", "mixed"]
+_DEFINITION_WORDS = [
+    "a", "the", "feeling", "place", "person", "used", "when", "something", "very",
+    "large", "small", "quickly", "careful", "object", "idea", "work", "living",
+    "water", "light", "sound", "move", "make", "show", "group", "part", "time"
+]
+_SYLLABLES = ["ba", "ce", "di", "fo", "gu", "ha", "jo", "ki", "lu", "me", "na",
+              "po", "qui", "ra", "se", "ti", "vo", "wa", "xe", "zu", "st", "tion"]
+
+
+def new_profile(name: str, email: str, level: str) -> Dict:
+    """Build a fresh profile in the same shape UserManager.create_user writes"""
+    now = datetime.now().isoformat()
+    return {
+        "name": name,
+        "email": email,
+        "level": level,
+        "goals": ["vocabulary", "grammar"],
+        "created_at": now,
+        "last_login": now,
+        "stats": {
+            "total_sessions": 0,
+            "words_learned": 0,
+            "correct_answers": 0,
+            "total_answers": 0,
+            "study_time_minutes": 0,
+            "streak_days": 0,
+            "last_study_date": None
+        },
+        "progress": {
+            "vocabulary": {level: 0 for level in LEVELS},
+            "grammar": {level: 0 for level in LEVELS}
+        }
+    }
+
+
+def _make_word(rng: random.Random, i: int) -> str:
+    """Build a pronounceable, unique pseudo-word"""
+    syllables = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+    return f"{syllables}{i}"
+
+
+def make_vocabulary(count: int, seed: int = 0) -> Dict[str, List[Dict]]:
+    """Generate `count` vocabulary entries spread across the three levels"""
+    rng = random.Random(seed)
+    vocabulary = {level: [] for level in LEVELS}
+
+    for i in range(count):
+        word = _make_word(rng, i)
+        definition = " ".join(rng.choice(_DEFINITION_WORDS) for _ in range(rng.randint(4, 10)))
+        vocabulary[LEVELS[i % len(LEVELS)]].append({
+            "word": word,
+            "definition": definition.capitalize(),
+            "pronunciation": f"/{word}/",
+            "examples": [
+                f"I saw the {word} yesterday.",
+                f"This {word} is {rng.choice(_DEFINITION_WORDS)}."
+            ],
+            "category": rng.choice(CATEGORIES)
+        })
+
+    return vocabulary
+
+
+def make_grammar(count: int, seed: int = 0) -> Dict[str, List[Dict]]:
+    """Generate `count` grammar exercises spread across the topics"""
+    rng = random.Random(seed)
+    exercises = {topic: [] for topic in GRAMMAR_TOPICS}
+
+    for i in range(count):
+        options = [_make_word(rng, i * 4 + j) for j in range(4)]
+        exercises[GRAMMAR_TOPICS[i % len(GRAMMAR_TOPICS)]].append({
+            "question": f"The {rng.choice(_DEFINITION_WORDS)} _____ {rng.choice(_DEFINITION_WORDS)} #{i}.",
+            "options": options,
+            "correct": rng.choice(options),
+            "explanation": "Synthetic exercise generated for benchmarking."
+        })
+
+    return exercises
+
+
+def make_users(count: int, seed: int = 0) -> Dict[str, Dict]:
+    """Generate `count` user profiles with some study history"""
+    rng = random.Random(seed)
+    users = {}
+    today = datetime.now().date()
+
+    for i in range(count):
+        email = f"learner{i}@example.com"
+        profile = new_profile(f"Learner {i}", email, LEVELS[i % len(LEVELS)])
+        stats = profile["stats"]
+        stats["total_sessions"] = rng.randint(0, 200)
+        stats["total_answers"] = stats["total_sessions"] * 9
+        stats["correct_answers"] = int(stats["total_answers"] * rng.uniform(0.3, 0.95))
+        stats["words_learned"] = rng.randint(0, 500)
+        stats["study_time_minutes"] = stats["total_sessions"] * rng.randint(2, 10)
+        stats["streak_days"] = rng.randint(0, 30)
+        stats["last_study_date"] = (today - timedelta(days=rng.randint(0, 3))).isoformat()
+        users[email] = profile
+
+    return users
+
+
+def write_json(path: str, data: Dict):
+    """Write a dataset the same way the managers do"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
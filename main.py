@@ -4,43 +4,100 @@ Inglês Autodidata - Self-Taught English Learning App
 Main application entry point
 """
 
+import time
+_STARTED = time.perf_counter()
+
+import argparse
+import atexit
 import sys
 import os
 from datetime import datetime
 from src.menu_manager import MenuManager
 from src.user_manager import UserManager
-from src.learning_session import LearningSession
+from src.answer_history import migrate_user_files
 from src.utils import clear_screen, print_banner
+from src.startup import trace
+from src import metrics
+
+_IMPORTED = time.perf_counter()
+
+def parse_args(argv=None):
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description="Inglês Autodidata - Self-Taught English Learning")
+    parser.add_argument("--serve", action="store_true",
+                        help="run the HTTP/JSON service for many learners instead of the terminal app")
+    parser.add_argument("--host", default="127.0.0.1", help="service mode bind address")
+    parser.add_argument("--port", type=int, default=8080, help="service mode port")
+    parser.add_argument("--profile", action="store_true",
+                        help="time load/save paths, screens and sessions and print a summary at exit")
+    parser.add_argument("--startup-trace", action="store_true",
+                        help="report per-phase import and load times at exit")
+    return parser.parse_args(argv)
+
+def report_shared_files(paths):
+    """Warn about per-user files that several users were writing to"""
+    for path in paths:
+        print(f"⚠️  {path} mixes the answers of several users and was left as it is.")
+
+def print_profile():
+    """Print the collected timing summary"""
+    print("\n📊 PROFILE SUMMARY")
+    print(metrics.registry.summary())
+
+def print_startup_trace():
+    """Print the startup timeline"""
+    print("\n🚀 STARTUP TRACE")
+    print(trace.report())
 
 def main():
     """Main application function"""
-    clear_screen()
-    print_banner()
+    args = parse_args()
     
-    # Initialize user manager
-    user_manager = UserManager()
+    if args.profile:
+        metrics.enable()
+        atexit.register(print_profile)
     
-    # Check if user exists or create new user
-    if not user_manager.has_users():
-        print("🎉 Welcome to Inglês Autodidata!")
-        print("Let's start your English learning journey!\n")
-        user_manager.create_user()
+    if args.startup_trace:
+        trace.enable(origin=_STARTED)
+        trace.record("import app modules", _STARTED, _IMPORTED)
+        atexit.register(print_startup_trace)
     
-    # Login user
-    current_user = user_manager.login()
-    if not current_user:
-        print("❌ Unable to login. Exiting...")
+    if args.serve:
+        from src.api_server import run_server
+        run_server(args.host, args.port)
         return
     
-    print(f"👋 Welcome back, {current_user['name']}!")
+    clear_screen()
+    print_banner()
     
-    # Initialize menu manager with current user
-    menu_manager = MenuManager(current_user, user_manager)
+    # Initialize user manager
+    with trace.phase("load users"):
+        user_manager = UserManager()
+    report_shared_files(migrate_user_files(user_manager.users))
     
-    # Start main application loop
     try:
+        # Check if user exists or create new user
+        if not user_manager.has_users():
+            print("🎉 Welcome to Inglês Autodidata!")
+            print("Let's start your English learning journey!\n")
+            user_manager.create_user()
+        
+        # Login user
+        with trace.phase("login"):
+            current_user = user_manager.login()
+        if not current_user:
+            print("❌ Unable to login. Exiting...")
+            return
+        
+        print(f"👋 Welcome back, {current_user['name']}!")
+        
+        # Initialize menu manager with current user
+        menu_manager = MenuManager(current_user, user_manager)
+        
+        # Start main application loop
         menu_manager.run()
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, EOFError):
+        # Ctrl+C, Ctrl+D or the end of piped input
         print("\n\n👋 Thanks for using Inglês Autodidata!")
         print("Keep practicing and see you soon! 🌟")
     except Exception as e:
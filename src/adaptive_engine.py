@@ -0,0 +1,227 @@
+"""
+Adaptive Item Selection for Inglês Autodidata
+
+Picks each next question so the learner succeeds about 80% of the time.
+The engine keeps an Elo-style ability for the learner and, for every item
+they have answered, a personal difficulty offset plus rolling accuracy and
+latency. The bank of items sorted by calibrated difficulty is built once
+per vocabulary and shared by every learner (`ItemBank`); each learner
+only keeps the items they have answered, sorted by personal difficulty
+in short buckets (`SortedBuckets`). The best next question is found by
+bisecting both to the target difficulty and stepping outward, and an
+answer re-files only the one item it touched: a bisect over the bucket
+bounds plus a shift inside one bucket of at most 2 * BUCKET_SIZE entries,
+so the cost stays flat however large the bank grows.
+
+State lives in the profile under user["adaptive"][kind] and is saved with
+the rest of the profile.
+"""
+
+import heapq
+import math
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+TARGET_SUCCESS = 0.8
+LEVEL_DIFFICULTY = {"beginner": -1.0, "intermediate": 0.0, "advanced": 1.0}
+LEARNER_RATE = 0.3
+ITEM_RATE = 0.4
+ROLLING_WEIGHT = 0.3
+# A correct answer this slow suggests the word is not yet automatic; learners
+# with enough history use their own pace instead (see latency_histogram)
+SLOW_ANSWER_MS = 8000
+SLOW_ANSWER_CREDIT = 0.7
+BUCKET_SIZE = 64
+
+Entry = Tuple[float, str]  # (difficulty, key)
+
+
+def _logit(p: float) -> float:
+    return math.log(p / (1.0 - p))
+
+
+def _sigmoid(x: float) -> float:
+    return 1.0 / (1.0 + math.exp(-x))
+
+
+def base_difficulty(item: Dict, level: str) -> float:
+    """Calibrated difficulty if there is one, otherwise the level's default"""
+    if "irt_difficulty" in item:
+        return float(item["irt_difficulty"])
+    return LEVEL_DIFFICULTY.get(level, 0.0)
+
+
+class ItemBank:
+    """Every item of a kind sorted by base difficulty; read-only, so learners share it"""
+
+    __slots__ = ("items", "base", "ordered")
+
+    def __init__(self, entries: Iterable[Tuple[str, Dict, float]]):
+        self.items: Dict[str, Dict] = {}
+        self.base: Dict[str, float] = {}
+        for key, item, base in entries:
+            self.items[key] = item
+            self.base[key] = base
+        self.ordered: List[Entry] = sorted((base, key) for key, base in self.base.items())
+
+    def __len__(self) -> int:
+        return len(self.ordered)
+
+
+class SortedBuckets:
+    """A sorted list kept as short sorted buckets, so an update only shifts one bucket"""
+
+    __slots__ = ("buckets", "maxes")
+
+    def __init__(self):
+        self.buckets: List[List[Entry]] = []
+        self.maxes: List[Entry] = []
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self.buckets)
+
+    def add(self, entry: Entry):
+        if not self.buckets:
+            self.buckets.append([entry])
+            self.maxes.append(entry)
+            return
+        i = min(bisect_left(self.maxes, entry), len(self.buckets) - 1)
+        bucket = self.buckets[i]
+        insort(bucket, entry)
+        self.maxes[i] = bucket[-1]
+        if len(bucket) > 2 * BUCKET_SIZE:
+            self.buckets[i:i + 1] = [bucket[:BUCKET_SIZE], bucket[BUCKET_SIZE:]]
+            self.maxes[i:i + 1] = [bucket[BUCKET_SIZE - 1], bucket[-1]]
+
+    def remove(self, entry: Entry):
+        i = bisect_left(self.maxes, entry)
+        bucket = self.buckets[i]
+        del bucket[bisect_left(bucket, entry)]
+        if bucket:
+            self.maxes[i] = bucket[-1]
+        else:
+            del self.buckets[i], self.maxes[i]
+
+    def _locate(self, entry: Entry) -> Tuple[int, int]:
+        i = bisect_left(self.maxes, entry)
+        if i == len(self.buckets):
+            return i, 0
+        return i, bisect_left(self.buckets[i], entry)
+
+    def walk_up(self, entry: Entry) -> Iterator[Entry]:
+        """Entries >= `entry`, ascending"""
+        i, j = self._locate(entry)
+        for bucket in self.buckets[i:]:
+            yield from bucket[j:]
+            j = 0
+
+    def walk_down(self, entry: Entry) -> Iterator[Entry]:
+        """Entries < `entry`, descending"""
+        i, j = self._locate(entry)
+        if i < len(self.buckets):
+            yield from reversed(self.buckets[i][:j])
+        for bucket in reversed(self.buckets[:i]):
+            yield from reversed(bucket)
+
+
+class AdaptiveEngine:
+    def __init__(self, profile: Dict, kind: str, bank: ItemBank, level: str = "beginner",
+                 target: float = TARGET_SUCCESS, slow_answer_ms: int = SLOW_ANSWER_MS):
+        self.bank = bank
+        self.target = target
+        self.slow_answer_ms = slow_answer_ms
+        adaptive = profile.setdefault("adaptive", {})
+        if kind not in adaptive:
+            # Start out pitched so items at the learner's own level hit the target
+            adaptive[kind] = {"ability": LEVEL_DIFFICULTY.get(level, 0.0) + _logit(target),
+                              "items": {}}
+        self.state = adaptive[kind]
+        self.stats: Dict[str, Dict] = self.state["items"]
+
+        # Personal difficulty of the items this learner has answered; the rest use the bank's
+        self.difficulty: Dict[str, float] = {}
+        self.personal = SortedBuckets()
+        for key, stats in self.stats.items():
+            if key in bank.base:
+                self.difficulty[key] = bank.base[key] + stats.get("offset", 0.0)
+                self.personal.add((self.difficulty[key], key))
+        self.asked: Set[str] = set()
+
+    @property
+    def items(self) -> Dict[str, Dict]:
+        return self.bank.items
+
+    @property
+    def ability(self) -> float:
+        return self.state["ability"]
+
+    def difficulty_of(self, key: str) -> float:
+        """The learner's effective difficulty for an item"""
+        return self.difficulty.get(key, self.bank.base[key])
+
+    def target_difficulty(self) -> float:
+        """The effective difficulty the learner answers correctly `target` of the time"""
+        return self.ability - _logit(self.target)
+
+    def predicted_success(self, key: str) -> float:
+        """Chance the learner answers an item correctly"""
+        return _sigmoid(self.ability - self.difficulty_of(key))
+
+    def start_session(self):
+        """Allow every item to be asked again"""
+        self.asked.clear()
+
+    def next_item(self) -> Optional[Dict]:
+        """Choose the unasked item closest to the target difficulty"""
+        target = self.target_difficulty()
+        probe = (target, "")
+        ordered = self.bank.ordered
+        split = bisect_left(ordered, probe)
+        personal = self.difficulty
+        # Bank entries are skipped for items the learner has a personal difficulty for
+        shared_up = (ordered[i] for i in range(split, len(ordered)) if ordered[i][1] not in personal)
+        shared_down = (ordered[i] for i in range(split - 1, -1, -1) if ordered[i][1] not in personal)
+        up = heapq.merge(shared_up, self.personal.walk_up(probe))
+        down = heapq.merge(shared_down, self.personal.walk_down(probe), reverse=True)
+
+        left, right = next(down, None), next(up, None)
+        while left is not None or right is not None:
+            if right is None or (left is not None and target - left[0] <= right[0] - target):
+                key = left[1]
+                left = next(down, None)
+            else:
+                key = right[1]
+                right = next(up, None)
+            if key not in self.asked:
+                self.asked.add(key)
+                return self.bank.items[key]
+
+        return None
+
+    def record(self, key: str, correct: bool, latency_ms: Optional[int] = None):
+        """Update the learner, the item's personal difficulty and its rolling stats"""
+        if key not in self.bank.base:
+            return
+
+        score = 1.0 if correct else 0.0
+        if correct and latency_ms is not None and latency_ms > self.slow_answer_ms:
+            score = SLOW_ANSWER_CREDIT
+        surprise = score - self.predicted_success(key)
+
+        self.state["ability"] += LEARNER_RATE * surprise
+        stats = self.stats.setdefault(key, {"offset": 0.0, "accuracy": score,
+                                            "latency_ms": latency_ms, "attempts": 0})
+        stats["offset"] -= ITEM_RATE * surprise
+        stats["attempts"] += 1
+        stats["accuracy"] += ROLLING_WEIGHT * (score - stats["accuracy"])
+        if latency_ms is not None:
+            previous = stats["latency_ms"]
+            stats["latency_ms"] = latency_ms if previous is None else round(
+                previous + ROLLING_WEIGHT * (latency_ms - previous))
+
+        # Re-file just this item under its new difficulty
+        old = self.difficulty_of(key)
+        if key in self.difficulty:
+            self.personal.remove((old, key))
+        self.difficulty[key] = old - ITEM_RATE * surprise
+        self.personal.add((self.difficulty[key], key))
@@ -0,0 +1,100 @@
+"""
+Answer History Storage for Inglês Autodidata
+
+Every graded answer is appended to a per-user JSON Lines file, so history
+grows without rewriting anything and can be streamed back one event at a
+time for exports and offline analysis.
+
+Per-user files (history, journal, plans) are named by percent-escaping the
+email, so two addresses never share a file, even on case-insensitive file
+systems. Files named by the old scheme, which replaced every unsafe
+character with "_", are renamed by `migrate_user_files` at startup.
+"""
+
+import json
+import os
+import re
+from typing import Dict, Iterable, Iterator, List
+from . import metrics
+
+USER_DIRS = ("data/history", "data/journal", "data/plans")
+_SAFE_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789@.-")
+_LEGACY_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9@._-]")
+
+
+def user_filename(email: str) -> str:
+    """A filesystem-safe file name stem for a user, distinct for every email"""
+    return "".join(c if c in _SAFE_CHARS else "".join(f"%{byte:02X}" for byte in c.encode())
+                   for c in email)
+
+
+def _legacy_filename(email: str) -> str:
+    return _LEGACY_UNSAFE_CHARS.sub("_", email)
+
+
+def migrate_user_files(emails: Iterable[str], data_dirs: Iterable[str] = USER_DIRS) -> List[str]:
+    """Rename old-scheme files; returns the ones left alone because several users shared them"""
+    renames: Dict[str, List[str]] = {}
+    for email in emails:
+        legacy = _legacy_filename(email)
+        if legacy != user_filename(email):
+            renames.setdefault(legacy, []).append(email)
+    if not renames:
+        return []
+
+    shared = []
+    for data_dir in data_dirs:
+        if not os.path.isdir(data_dir):
+            continue
+        for name in os.listdir(data_dir):
+            stem, extension = os.path.splitext(name)
+            owners = renames.get(stem)
+            if not owners:
+                continue
+            if len(owners) > 1:
+                # Answers of several users are mixed in one file; no owner can be picked
+                shared.append(os.path.join(data_dir, name))
+                continue
+            target = os.path.join(data_dir, user_filename(owners[0]) + extension)
+            if not os.path.exists(target):
+                os.replace(os.path.join(data_dir, name), target)
+    return shared
+
+
+class AnswerHistory:
+    def __init__(self, data_dir: str = "data/history"):
+        self.data_dir = data_dir
+
+    def _path(self, email: str) -> str:
+        """Get the history file for a user"""
+        return os.path.join(self.data_dir, user_filename(email) + ".jsonl")
+
+    @metrics.timed("history.append")
+    def append(self, email: str, events: List[Dict]):
+        """Append answer events to a user's history"""
+        if not events:
+            return
+        os.makedirs(self.data_dir, exist_ok=True)
+        lines = "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events)
+        with open(self._path(email), 'a', encoding='utf-8') as f:
+            f.write(lines)
+
+    def iter_events(self, email: str) -> Iterator[Dict]:
+        """Stream a user's answer events, oldest first"""
+        path = self._path(email)
+        if not os.path.exists(path):
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # A torn last line from an interrupted write
+
+    def delete(self, email: str) -> bool:
+        """Delete a user's history"""
+        path = self._path(email)
+        if os.path.exists(path):
+            os.remove(path)
+            return True
+        return False
@@ -0,0 +1,539 @@
+"""
+HTTP/JSON Service Mode for Inglês Autodidata
+
+Serves many learners from one process on a single asyncio event loop.
+Sessions live in memory keyed by a bearer token; profile changes are
+written back to disk by a periodic flush rather than on every request.
+
+Endpoints:
+    POST /login             {"email"}                         -> {"token", "user"}
+    POST /session/start     {"type", "difficulty" | "topic", "mode"?} -> {"question"}
+                            mode: "typing" (default), "choice" or "cloze"
+                            difficulty "adaptive" picks each word after the last answer
+    POST /session/answer    {"answer"}                        -> {"correct", "expected", ...}
+    GET  /progress                                            -> {"stats", "progress"}
+    GET  /items/hardest?kind=grammar&limit=10                 -> {"items"}
+                            the items learners miss most, across all learners
+    GET  /metrics                                             -> Prometheus text format
+"""
+
+import asyncio
+import json
+import random
+import secrets
+import sys
+import time
+import traceback
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl
+from .user_manager import UserManager
+from .vocabulary_manager import VocabularyManager
+from .grammar_manager import GrammarManager
+from .conversation_manager import ConversationManager
+from .learning_session import ADAPTIVE, VOCABULARY_SESSION_SIZE, LearningSession
+from .answer_history import AnswerHistory, migrate_user_files
+from .session_journal import SessionJournal
+from .content_packs import ContentPacks
+from .item_stats import ItemStats
+from . import metrics
+
+FLUSH_INTERVAL_SECONDS = 5
+SESSION_IDLE_SECONDS = 30 * 60
+MAX_BODY_BYTES = 64 * 1024
+# Profiles encoded between yields to the event loop while snapshotting users.json
+SNAPSHOT_BATCH = 200
+
+STATUS_TEXT = {
+    200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+    405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large",
+    500: "Internal Server Error"
+}
+
+
+class ApiError(Exception):
+    """An error reported to the client as a JSON response"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class FramingError(ApiError):
+    """A request that cannot be delimited; the rest of the stream cannot be trusted"""
+
+
+def _log_exception(message: str):
+    """Report an unexpected error on stderr, with its traceback"""
+    print(f"⚠️ {message}", file=sys.stderr)
+    traceback.print_exc()
+
+
+class Quiz:
+    """An in-progress vocabulary or grammar session for one learner"""
+
+    __slots__ = ("kind", "label", "mode", "items", "item", "total", "position", "correct",
+                 "new_words", "started", "cloze", "asked_at")
+
+    def __init__(self, kind: str, label: str, mode: str, items: Iterator[Dict], total: int):
+        self.kind = kind
+        self.label = label
+        self.mode = mode
+        # Drawn one at a time, so adaptive sessions pick each item after the previous answer
+        self.items = items
+        self.item: Optional[Dict] = next(items, None)
+        self.total = total
+        self.position = 0
+        self.correct = 0
+        self.new_words = 0
+        self.started = time.time()
+        self.cloze: Optional[Dict] = None
+        self.asked_at = time.perf_counter_ns()
+
+
+class Learner:
+    """Per-token state: the learner's session logic and current quiz"""
+
+    __slots__ = ("session", "quiz", "last_seen")
+
+    def __init__(self, session: LearningSession):
+        self.session = session
+        self.quiz: Optional[Quiz] = None
+        self.last_seen = time.monotonic()
+
+
+class LearnerService:
+    def __init__(self, user_manager: UserManager = None,
+                 vocabulary_manager: VocabularyManager = None,
+                 grammar_manager: GrammarManager = None,
+                 conversation_manager: ConversationManager = None,
+                 answer_history: AnswerHistory = None, journal: SessionJournal = None,
+                 content_packs: ContentPacks = None, item_stats: ItemStats = None):
+        self.user_manager = user_manager or UserManager(autosave=False)
+        self.user_manager.autosave = False
+        self.vocabulary_manager = vocabulary_manager or VocabularyManager()
+        self.grammar_manager = grammar_manager or GrammarManager()
+        self.conversation_manager = conversation_manager or ConversationManager()
+        self.content_packs = content_packs or ContentPacks()
+        self.item_stats = item_stats or ItemStats(autosave=False)
+        self.item_stats.autosave = False
+        self.sync_packs()
+        self.answer_history = answer_history or AnswerHistory()
+        self.journal = journal or SessionJournal()
+        self.learners: Dict[str, Learner] = {}
+        if answer_history is None and journal is None:
+            # Only the default data directories can hold files from the old naming scheme
+            for path in migrate_user_files(self.user_manager.users):
+                print(f"⚠️ {path} mixes the answers of several users and was left as it is.")
+
+    def login(self, email: str) -> Dict:
+        """Log a learner in and issue a session token"""
+        user = self.user_manager.login_by_email(email)
+        if user is None:
+            raise ApiError(404, f"Unknown user: {email}")
+
+        session = LearningSession(user, self.user_manager, self.vocabulary_manager,
+                                  self.grammar_manager, self.conversation_manager,
+                                  self.answer_history, journal=self.journal,
+                                  content_packs=self.content_packs, item_stats=self.item_stats)
+        recovered = session.recover_interrupted_session()
+        token = secrets.token_urlsafe(24)
+        self.learners[token] = Learner(session)
+
+        result = {
+            "token": token,
+            "user": {"name": user["name"], "email": email, "level": user["level"]}
+        }
+        if recovered:
+            result["recovered"] = recovered
+        return result
+
+    @property
+    def pack_managers(self) -> Dict:
+        return {"vocabulary": self.vocabulary_manager, "grammar": self.grammar_manager}
+
+    def sync_packs(self):
+        """Merge new or changed content packs and drop disabled ones"""
+        self.content_packs.sync(self.pack_managers)
+
+    def get_learner(self, token: Optional[str]) -> Learner:
+        """Look up the learner behind a token"""
+        learner = self.learners.get(token or "")
+        if learner is None:
+            raise ApiError(401, "Missing or expired token")
+        learner.last_seen = time.monotonic()
+        return learner
+
+    def start_session(self, token: str, payload: Dict) -> Dict:
+        """Start a vocabulary or grammar session"""
+        learner = self.get_learner(token)
+        session = learner.session
+        kind = payload.get("type")
+
+        if kind == "vocabulary":
+            label = payload.get("difficulty") or session.user["level"]
+            mode = payload.get("mode", "typing")
+            if label == ADAPTIVE:
+                total = min(VOCABULARY_SESSION_SIZE, len(session.vocabulary_engine.items))
+                quiz = Quiz(kind, label, mode, session.adaptive_words(total), total)
+            else:
+                items = session.select_vocabulary_words(label)
+                quiz = Quiz(kind, label, mode, iter(items), len(items))
+        elif kind == "grammar":
+            label = payload.get("topic", "mixed")
+            items = session.select_grammar_exercises(label)
+            quiz = Quiz(kind, label, "choice", iter(items), len(items))
+        else:
+            raise ApiError(400, "type must be 'vocabulary' or 'grammar'")
+
+        if quiz.item is None:
+            raise ApiError(404, f"No {kind} content for '{label}'")
+
+        learner.quiz = quiz
+        return {"question": self._question(learner.quiz)}
+
+    def answer(self, token: str, payload: Dict) -> Dict:
+        """Grade an answer and move to the next question"""
+        learner = self.get_learner(token)
+        quiz = learner.quiz
+        if quiz is None:
+            raise ApiError(409, "No session in progress")
+
+        answer = payload.get("answer")
+        if not isinstance(answer, str):
+            raise ApiError(400, "answer must be a string")
+
+        session = learner.session
+        item = quiz.item
+        # Measured from sending the question, so it includes the client's round trip
+        latency_ms = (time.perf_counter_ns() - quiz.asked_at) // 1_000_000
+
+        if quiz.kind == "vocabulary" and quiz.cloze:
+            correct = session.check_cloze_answer(quiz.cloze, answer, latency_ms)
+            expected = quiz.cloze["answer"]
+            if correct:
+                quiz.new_words += 1
+        elif quiz.kind == "vocabulary":
+            correct = session.check_vocabulary_answer(item, answer, latency_ms)
+            expected = item["word"]
+            if correct:
+                quiz.new_words += 1
+        else:
+            options = item["options"]
+            if answer.isdigit() and 1 <= int(answer) <= len(options):
+                answer = options[int(answer) - 1]
+            correct = session.check_grammar_answer(item, answer, latency_ms)
+            expected = item["correct"]
+
+        if correct:
+            quiz.correct += 1
+        quiz.position += 1
+
+        result = {"correct": correct, "expected": expected}
+        if quiz.kind == "grammar" and item.get("explanation"):
+            result["explanation"] = item["explanation"]
+
+        # Drawn after the answer is recorded, so an adaptive pick reflects it
+        quiz.item = next(quiz.items, None) if quiz.position < quiz.total else None
+        if quiz.item is not None:
+            result["question"] = self._question(quiz)
+        else:
+            session_time = int(time.time() - quiz.started)
+            session.finish_session(quiz.kind, quiz.correct, quiz.position,
+                                   session_time, quiz.new_words, quiz.label)
+            learner.quiz = None
+            result["summary"] = {
+                "topic": quiz.label,
+                "correct": quiz.correct,
+                "total": quiz.position,
+                "time_seconds": session_time
+            }
+
+        return result
+
+    def progress(self, token: str) -> Dict:
+        """Get a learner's stats and per-category progress"""
+        learner = self.get_learner(token)
+        user = learner.session.user
+        return {
+            "stats": self.user_manager.get_user_stats(user),
+            "progress": user.get("progress", {})
+        }
+
+    def hardest_items(self, token: str, payload: Dict) -> Dict:
+        """The items with the highest recent error rate across all learners"""
+        self.get_learner(token)
+        kind = payload.get("kind", "vocabulary")
+        if kind not in ("vocabulary", "grammar", "conversation"):
+            raise ApiError(400, "kind must be 'vocabulary', 'grammar' or 'conversation'")
+        try:
+            limit = min(int(payload.get("limit", 10)), 100)
+        except (TypeError, ValueError):
+            raise ApiError(400, "limit must be a number")
+        return {"items": self.item_stats.hardest(kind, limit)}
+
+    def expire_idle(self, max_idle: float = SESSION_IDLE_SECONDS) -> int:
+        """Drop learners that have been idle too long"""
+        cutoff = time.monotonic() - max_idle
+        stale = [token for token, learner in self.learners.items() if learner.last_seen < cutoff]
+        for token in stale:
+            learner = self.learners.pop(token)
+            if learner.quiz is not None:
+                # Leave the abandoned quiz's answers for recovery at the next login
+                self.journal.release(learner.session.user["email"])
+        return len(stale)
+
+    def _question(self, quiz: Quiz) -> Dict:
+        """Build the client-facing view of the current question"""
+        item = quiz.item
+        question = {"number": quiz.position + 1, "total": quiz.total, "type": quiz.kind}
+
+        quiz.cloze = None
+        quiz.asked_at = time.perf_counter_ns()
+        if quiz.kind == "vocabulary":
+            question["definition"] = item["definition"]
+            if quiz.mode == "cloze":
+                quiz.cloze = self.vocabulary_manager.get_cloze_question(item)
+            if quiz.cloze:
+                question["sentence"] = quiz.cloze["sentence"]
+            elif item.get("examples"):
+                question["example"] = random.choice(item["examples"])
+            if quiz.mode == "choice":
+                mc = self.vocabulary_manager.get_multiple_choice_question(item)
+                question["options"] = mc["options"]
+        else:
+            question["question"] = item["question"]
+            question["options"] = item["options"]
+
+        return question
+
+    def route(self, method: str, path: str, token: Optional[str], payload: Dict) -> Dict:
+        """Dispatch a request to the matching service call"""
+        routes = {
+            ("POST", "/login"): lambda: self.login(payload.get("email", "")),
+            ("POST", "/session/start"): lambda: self.start_session(token, payload),
+            ("POST", "/session/answer"): lambda: self.answer(token, payload),
+            ("GET", "/progress"): lambda: self.progress(token),
+            ("GET", "/items/hardest"): lambda: self.hardest_items(token, payload),
+        }
+
+        handler = routes.get((method, path))
+        if handler is None:
+            # Client-supplied paths never become metric names
+            metrics.increment("api.unmatched")
+            if any(p == path for _, p in routes):
+                raise ApiError(405, f"{method} not allowed on {path}")
+            raise ApiError(404, f"No route for {path}")
+        with metrics.timer(f"api {method} {path}"):
+            return handler()
+
+
+async def _read_request(
+        reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict, bytes, Dict]]:
+    """Read one HTTP/1.1 request as (method, path, headers, body, query); None once closed"""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+
+    try:
+        method, target, _ = request_line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise FramingError(400, "Malformed request line")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", "0") or 0)
+    except ValueError:
+        raise FramingError(400, "Content-Length must be a number")
+    if length < 0:
+        raise FramingError(400, "Content-Length must not be negative")
+    if length > MAX_BODY_BYTES:
+        raise FramingError(413, "Request body too large")
+    body = await reader.readexactly(length) if length else b""
+
+    path, _, query = target.partition("?")
+    return method.upper(), path, headers, body, dict(parse_qsl(query))
+
+
+def _encode_response(status: int, payload: Dict, keep_alive: bool) -> bytes:
+    """Serialize a JSON response"""
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return _encode_body(status, body, "application/json; charset=utf-8", keep_alive)
+
+
+def _encode_body(status: int, body: bytes, content_type: str, keep_alive: bool) -> bytes:
+    """Frame an already-encoded body as an HTTP response"""
+    head = (
+        f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'Unknown')}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+class ApiServer:
+    def __init__(self, service: LearnerService, host: str = "127.0.0.1", port: int = 8080):
+        self.service = service
+        self.host = host
+        self.port = port
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter):
+        """Serve requests on one keep-alive connection"""
+        try:
+            while True:
+                keep_alive = True
+                try:
+                    request = await _read_request(reader)
+                    if request is None:
+                        break
+                    method, path, headers, body, query = request
+                    keep_alive = headers.get("connection", "").lower() != "close"
+
+                    if method == "GET" and path == "/metrics":
+                        writer.write(_encode_body(
+                            200, metrics.registry.prometheus_text().encode("utf-8"),
+                            "text/plain; version=0.0.4; charset=utf-8", keep_alive))
+                        await writer.drain()
+                        if not keep_alive:
+                            break
+                        continue
+
+                    auth = headers.get("authorization", "")
+                    token = auth[7:] if auth.lower().startswith("bearer ") else None
+
+                    try:
+                        payload = json.loads(body) if body else {}
+                    except json.JSONDecodeError:
+                        raise ApiError(400, "Body is not valid JSON")
+                    if not isinstance(payload, dict):
+                        raise ApiError(400, "Body must be a JSON object")
+                    if method == "GET":
+                        payload = {**query, **payload}
+
+                    status, result = 200, self.service.route(method, path, token, payload)
+                except ApiError as e:
+                    status, result = e.status, {"error": e.message}
+                    if isinstance(e, FramingError):
+                        keep_alive = False  # an unread body would be taken as the next request
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except Exception:
+                    _log_exception("Unhandled error while serving a request")
+                    status, result = 500, {"error": STATUS_TEXT[500]}
+                    keep_alive = False
+
+                metrics.increment(f"api.status.{status}")
+                writer.write(_encode_response(status, result, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def _flush_users(self):
+        """Snapshot profiles on the loop in small batches and write the file on a thread"""
+        user_manager = self.service.user_manager
+        if not user_manager.dirty:
+            return
+        # Changes made while the snapshot is taken mark it dirty again for the next flush
+        user_manager.dirty = False
+        entries = []
+        for done, email in enumerate(list(user_manager.users), 1):
+            if email in user_manager.users:
+                entries.append(user_manager.encode_profile(email))
+            if done % SNAPSHOT_BATCH == 0:
+                await asyncio.sleep(0)
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, user_manager.write_profiles, entries)
+        except Exception:
+            user_manager.dirty = True  # retried at the next flush
+            metrics.increment("users.save_failed")
+            _log_exception("Could not save users")
+
+    async def _flush_item_stats(self):
+        """Merge answer counts into the shared snapshot on a thread"""
+        item_stats = self.service.item_stats
+        if not item_stats.dirty:
+            return
+        pending = item_stats.take_pending()
+        try:
+            merged = await asyncio.get_running_loop().run_in_executor(
+                None, item_stats.write_merged, pending)
+        except Exception:
+            item_stats.restore_pending(pending)
+            metrics.increment("item_stats.save_failed")
+            _log_exception("Could not save item stats")
+            return
+        item_stats.adopt(merged)
+
+    async def _expire_idle(self):
+        self.service.expire_idle()
+
+    async def _sync_packs(self):
+        """Read pack files on a thread and merge them on the loop with the requests"""
+        content_packs = self.service.content_packs
+        managers = self.service.pack_managers
+        changes = await asyncio.get_running_loop().run_in_executor(
+            None, content_packs.read_changes, list(managers))
+        content_packs.apply_changes(managers, changes)
+        for path in content_packs.failed:
+            print(f"⚠️ Could not read content pack {path}", file=sys.stderr)
+        for message in content_packs.skipped:
+            print(f"⚠️ Skipped invalid item in {message}", file=sys.stderr)
+
+    async def _flush_periodically(self):
+        """Write dirty profiles to disk, expire idle learners and pick up pack changes"""
+        steps = (("flush users", self._flush_users),
+                 ("flush item stats", self._flush_item_stats),
+                 ("expire idle sessions", self._expire_idle),
+                 ("sync content packs", self._sync_packs))
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+            # One failing step must not stop the others or end the loop
+            for name, step in steps:
+                running = asyncio.ensure_future(step())
+                try:
+                    await asyncio.shield(running)
+                except asyncio.CancelledError:
+                    # Finish a half-done merge so taken answers are restored or saved
+                    await asyncio.gather(running, return_exceptions=True)
+                    raise
+                except Exception:
+                    metrics.increment("api.flush_failed")
+                    _log_exception(f"Could not {name}")
+
+    async def serve(self):
+        """Run the server until cancelled"""
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port,
+                                            backlog=4096)
+        flusher = asyncio.create_task(self._flush_periodically())
+        print(f"🌐 Serving Inglês Autodidata API on http://{self.host}:{self.port}")
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            flusher.cancel()
+            await asyncio.gather(flusher, return_exceptions=True)
+            self.service.user_manager.flush()
+            self.service.item_stats.flush()
+
+
+def run_server(host: str = "127.0.0.1", port: int = 8080):
+    """Start service mode and block until interrupted"""
+    metrics.enable()
+    server = ApiServer(LearnerService(), host, port)
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped.")
@@ -0,0 +1,203 @@
+"""
+Asynchronous Terminal I/O for Inglês Autodidata
+
+Animations run as asyncio tasks that a keypress can skip, and line input
+can be given a deadline for timed quizzes. Stdin is watched with the event
+loop's reader callbacks, so waiting never busy-loops, and every answer is
+stamped with its response latency in milliseconds. Input is buffered by
+the shared LineInput, so untimed prompts see anything typed ahead here.
+"""
+
+import asyncio
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+from .line_input import LineInput, get_line_input
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
+    tty = None
+
+
+class TimedResponse:
+    """A line of input together with how long the learner took to answer"""
+
+    __slots__ = ("text", "latency_ms", "timed_out")
+
+    def __init__(self, text: Optional[str], latency_ms: int, timed_out: bool = False):
+        self.text = text
+        self.latency_ms = latency_ms
+        self.timed_out = timed_out
+
+    def __repr__(self) -> str:
+        return f"TimedResponse({self.text!r}, {self.latency_ms}ms, timed_out={self.timed_out})"
+
+
+class AsyncTerminal:
+    def __init__(self, stdin=None, stdout=None):
+        self.input = LineInput(stdin) if stdin else get_line_input()
+        self.stdin = self.input.stdin
+        self._stdout = stdout
+        self.latencies_ms: List[int] = []
+
+    @property
+    def stdout(self):
+        return self._stdout or sys.stdout
+
+    def _fileno(self) -> Optional[int]:
+        return self.input.fileno()
+
+    def _is_tty(self) -> bool:
+        return termios is not None and hasattr(self.stdin, "isatty") and self.stdin.isatty()
+
+    @contextmanager
+    def _cbreak(self):
+        """Deliver single keypresses instead of whole lines while active"""
+        if not self._is_tty():
+            yield
+            return
+
+        fd = self._fileno()
+        saved = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            yield
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+    def _watch(self, callback) -> bool:
+        """Register a stdin reader callback; False if the loop can't watch stdin"""
+        fd = self._fileno()
+        if fd is None:
+            return False
+        try:
+            asyncio.get_running_loop().add_reader(fd, callback)
+            return True
+        except (NotImplementedError, RuntimeError, ValueError, OSError):
+            return False  # e.g. Windows consoles, or stdin redirected from a file
+
+    def _unwatch(self):
+        fd = self._fileno()
+        if fd is not None:
+            asyncio.get_running_loop().remove_reader(fd)
+
+    async def animate(self, text: str, delay: float = 0.03) -> bool:
+        """Type text out character by character; any key shows the rest at once"""
+        skip = asyncio.Event()
+
+        def on_key():
+            self.input.read_available()
+            skip.set()
+
+        async def typewriter():
+            for i, char in enumerate(text):
+                if skip.is_set():
+                    self.stdout.write(text[i:])
+                    break
+                self.stdout.write(char)
+                self.stdout.flush()
+                await asyncio.sleep(delay)
+            self.stdout.write("\n")
+            self.stdout.flush()
+
+        with self._cbreak():
+            # Only a real keyboard can skip; piped input is left for the next read
+            watching = self._is_tty() and self._watch(on_key)
+            try:
+                await asyncio.create_task(typewriter())
+            finally:
+                if watching:
+                    self._unwatch()
+
+        return skip.is_set()
+
+    async def read_line(self, prompt: str, timeout: Optional[float] = None) -> TimedResponse:
+        """Read one line of input, giving up after `timeout` seconds"""
+        loop = asyncio.get_running_loop()
+        line = loop.create_future()
+
+        def on_readable():
+            if line.done():
+                return
+            chunk = self.input.read_available()
+            if chunk is None:
+                if self.input.pending:
+                    line.set_result(self.input.pending)
+                    self.input.pending = ""
+                else:
+                    line.set_exception(EOFError())
+                return
+            self.input.pending += chunk
+            typed = self.input.take_line()
+            if typed is not None:
+                line.set_result(typed)
+
+        self.stdout.write(prompt)
+        self.stdout.flush()
+        started = time.perf_counter_ns()
+
+        typed = self.input.take_line()
+        if typed is not None:
+            # A line typed ahead of the prompt is already buffered
+            line.set_result(typed)
+            watching = False
+        else:
+            watching = self._watch(on_readable)
+
+        if line.done() or watching:
+            try:
+                text = await asyncio.wait_for(line, timeout)
+            except asyncio.TimeoutError:
+                text = None
+            finally:
+                if watching:
+                    self._unwatch()
+        else:
+            # Fall back to a worker thread where stdin can't be polled (Windows, files)
+            try:
+                text = await asyncio.wait_for(
+                    loop.run_in_executor(None, self.input.read_line), timeout)
+            except asyncio.TimeoutError:
+                text = None
+
+        latency_ms = (time.perf_counter_ns() - started) // 1_000_000
+
+        if text is None:
+            self._discard_typeahead()
+            self.stdout.write("\n")
+            self.stdout.flush()
+            return TimedResponse(None, latency_ms, timed_out=True)
+
+        self.latencies_ms.append(latency_ms)
+        return TimedResponse(text, latency_ms)
+
+    def _discard_typeahead(self):
+        """Drop a half-typed answer so it doesn't leak into the next prompt"""
+        self.input.pending = ""
+        if self._is_tty():
+            termios.tcflush(self._fileno(), termios.TCIFLUSH)
+
+
+_terminal: Optional[AsyncTerminal] = None
+
+
+def get_terminal() -> AsyncTerminal:
+    """Get the shared terminal bound to the process stdin/stdout"""
+    global _terminal
+    if _terminal is None or _terminal.input is not get_line_input():
+        _terminal = AsyncTerminal()
+    return _terminal
+
+
+def animate_text(text: str, delay: float = 0.03) -> bool:
+    """Run a skippable animation from synchronous code"""
+    return asyncio.run(get_terminal().animate(text, delay))
+
+
+def read_line(prompt: str, timeout: Optional[float] = None) -> TimedResponse:
+    """Read a line with an optional deadline from synchronous code"""
+    return asyncio.run(get_terminal().read_line(prompt, timeout))
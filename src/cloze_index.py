@@ -0,0 +1,150 @@
+"""
+Cloze Index for Inglês Autodidata fill-in-the-blank questions
+
+Each headword is expanded once into the inflected forms it can take (a few
+suffix rules plus common irregular forms), or the forms listed under its
+"inflections" field, and example sentences are matched against those forms
+token by token. "She accomplished her goal" yields a cloze for
+"accomplish", while "cares" is not taken for "car". Multi-word entries
+match whole tokens in sequence, with only the first word inflected. The
+blank positions are stored up front; building a question is then a
+dictionary lookup and a slice.
+"""
+
+import random
+import re
+from typing import Dict, List, Optional, Set, Tuple
+from . import metrics
+
+BLANK = "_____"
+_TOKEN_RE = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)?")
+_VOWELS = set("aeiou")
+_VOWEL_GROUP_RE = re.compile(r"[aeiou]+")
+
+IRREGULAR_FORMS = {
+    "was": "be", "were": "be", "been": "be", "is": "be", "are": "be", "am": "be",
+    "had": "have", "has": "have", "did": "do", "done": "do", "does": "do",
+    "went": "go", "gone": "go", "goes": "go", "made": "make", "said": "say",
+    "took": "take", "taken": "take", "came": "come", "saw": "see", "seen": "see",
+    "got": "get", "gotten": "get", "knew": "know", "known": "know",
+    "thought": "think", "found": "find", "gave": "give", "given": "give",
+    "told": "tell", "felt": "feel", "left": "leave", "brought": "bring",
+    "began": "begin", "begun": "begin", "kept": "keep", "wrote": "write",
+    "written": "write", "ran": "run", "met": "meet", "ate": "eat", "eaten": "eat",
+    "bought": "buy", "spoke": "speak", "spoken": "speak", "taught": "teach",
+    "understood": "understand", "built": "build", "sent": "send", "spent": "spend",
+    "stood": "stand", "heard": "hear", "held": "hold", "lost": "lose", "paid": "pay",
+    "sold": "sell", "sat": "sit", "slept": "sleep", "won": "win", "chose": "choose",
+    "chosen": "choose", "drove": "drive", "driven": "drive", "flew": "fly",
+    "flown": "fly", "forgot": "forget", "forgotten": "forget", "grew": "grow",
+    "grown": "grow", "better": "good", "best": "good", "worse": "bad", "worst": "bad",
+    "children": "child", "people": "person", "men": "man", "women": "woman",
+    "feet": "foot", "teeth": "tooth", "mice": "mouse",
+}
+
+
+_IRREGULAR_BY_LEMMA: Dict[str, Set[str]] = {}
+for _form, _lemma in IRREGULAR_FORMS.items():
+    _IRREGULAR_BY_LEMMA.setdefault(_lemma, set()).add(_form)
+
+
+def _doubles_final_consonant(word: str) -> bool:
+    """stop -> stopped, but visit -> visited and show -> showed"""
+    return (len(_VOWEL_GROUP_RE.findall(word)) == 1 and word[-1] not in _VOWELS
+            and word[-1] not in "wxy" and word[-2] in _VOWELS and word[-3] not in _VOWELS)
+
+
+def _present_participle(word: str) -> str:
+    if len(word) > 2 and word[-1] == "e" and not word.endswith(("ee", "ye", "oe")):
+        return word[:-1] + "ing"
+    if len(word) > 2 and _doubles_final_consonant(word):
+        return word + word[-1] + "ing"
+    return word + "ing"
+
+
+def inflections(word: str) -> Set[str]:
+    """Forms a lowercase headword can take in a sentence, the headword included"""
+    forms = {word} | _IRREGULAR_BY_LEMMA.get(word, set())
+    if len(word) < 3 or not word.isalpha():
+        # Short words only take their irregular forms ("as" is not a plural of "a")
+        if word in _IRREGULAR_BY_LEMMA:
+            forms.add(_present_participle(word))
+        return forms
+
+    forms.add(word + "'s")
+    if word.endswith(("s", "x", "z", "ch", "sh")):
+        forms.add(word + "es")
+    elif word[-1] == "y" and word[-2] not in _VOWELS:
+        forms.add(word[:-1] + "ies")
+    else:
+        forms.add(word + "s")
+        if word.endswith("o"):
+            forms.add(word + "es")
+
+    if word in _IRREGULAR_BY_LEMMA:
+        # see -> saw, not "seed"; good -> better, not "gooder"
+        forms.add(_present_participle(word))
+    elif word[-1] == "e":
+        forms.update((word + "d", word + "r", word + "st", _present_participle(word)))
+    elif word[-1] == "y" and word[-2] not in _VOWELS:
+        stem = word[:-1]
+        forms.update((stem + "ied", stem + "ier", stem + "iest", word + "ing"))
+    else:
+        # No -er/-est here: "mat" would claim "matter" and "let" "letter"
+        stem = word + word[-1] if _doubles_final_consonant(word) else word
+        forms.update((stem + "ed", stem + "ing"))
+    return forms
+
+
+class ClozeIndex:
+    def __init__(self):
+        # word (lowercase) -> [(sentence, blank start, blank end)]
+        self.blanks: Dict[str, List[Tuple[str, int, int]]] = {}
+
+    @metrics.timed("vocabulary.cloze_index")
+    def build(self, vocabulary: Dict):
+        """Index the example sentences of a whole vocabulary"""
+        self.blanks = {}
+        for level in vocabulary.values():
+            for word_data in level:
+                self.add(word_data)
+
+    def add(self, word_data: Dict):
+        """Index one word's example sentences"""
+        target = word_data["word"].lower()
+        first, *rest = target.split()
+        listed = word_data.get("inflections")
+        forms = {first} | {form.lower() for form in listed} if listed else inflections(first)
+        spans = []
+        for sentence in word_data.get("examples", []):
+            tokens = list(_TOKEN_RE.finditer(sentence))
+            # Multi-word entries ("look after") need the rest of the phrase right after
+            for i in range(len(tokens) - len(rest)):
+                if tokens[i].group().lower() not in forms:
+                    continue
+                following = tokens[i + 1:i + 1 + len(rest)]
+                if [token.group().lower() for token in following] == rest and all(
+                        sentence[a.end():b.start()].isspace() for a, b in zip(tokens[i:], following)):
+                    spans.append((sentence, tokens[i].start(), tokens[i + len(rest)].end()))
+        if spans:
+            self.blanks[target] = spans
+
+    def count(self) -> int:
+        """Total number of cloze questions available"""
+        return sum(len(spans) for spans in self.blanks.values())
+
+    def has_cloze(self, word: str) -> bool:
+        return word.lower() in self.blanks
+
+    def get_question(self, word_data: Dict, rng: random.Random = random) -> Optional[Dict]:
+        """Build a fill-in-the-blank question for a word, if it has a usable example"""
+        spans = self.blanks.get(word_data["word"].lower())
+        if not spans:
+            return None
+        sentence, start, end = rng.choice(spans)
+        return {
+            "word": word_data["word"],
+            "sentence": sentence[:start] + BLANK + sentence[end:],
+            "answer": sentence[start:end],
+            "definition": word_data["definition"]
+        }
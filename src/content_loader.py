@@ -0,0 +1,55 @@
+"""
+Background Content Loading for Inglês Autodidata
+
+Streams a {group: [items]} content file on a daemon thread, appending each
+entry to `groups` as soon as it is decoded. Callers that only need a few
+items from one level or topic wait for just those with `wait_for`; anything
+that needs the whole file calls `wait`.
+"""
+
+import threading
+from typing import Dict, List, Optional
+from .json_stream import iter_grouped_items
+
+NOTIFY_EVERY = 32
+
+
+class BackgroundLoader:
+    def __init__(self, path: str):
+        self.path = path
+        self.groups: Dict[str, List] = {}
+        self.error: Optional[Exception] = None
+        self.done = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name=f"load {path}", daemon=True)
+
+    def start(self) -> "BackgroundLoader":
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            for group, _, item in iter_grouped_items(self.path):
+                items = self.groups.get(group)
+                if items is None:
+                    items = self.groups[group] = []
+                items.append(item)
+                if len(items) % NOTIFY_EVERY == 0:
+                    with self._condition:
+                        self._condition.notify_all()
+        except (ValueError, IOError) as e:
+            self.error = e
+        finally:
+            with self._condition:
+                self.done = True
+                self._condition.notify_all()
+
+    def wait_for(self, group: str, count: int):
+        """Block until `group` has at least `count` items or the file is fully read"""
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self.done or len(self.groups.get(group, ())) >= count)
+
+    def wait(self):
+        """Block until the whole file has been read"""
+        self._thread.join()
@@ -0,0 +1,150 @@
+"""
+Content Packs for Inglês Autodidata
+
+Extra vocabulary and grammar ship as packs: one directory per pack under
+data/packs, holding a vocabulary.json and/or grammar.json in the same
+format as the main files (e.g. data/packs/business/vocabulary.json).
+Enabled packs are read and decoded concurrently on a thread pool and
+merged into the managers after the main content. Each pack file is
+tracked by its modification time, so a sync only reads packs that are
+new or changed and only unmerges packs that were disabled, changed or
+removed; the rest stay in memory as they are. Every item is checked with
+the content validator as it is read, and items with errors are skipped
+and reported rather than merged. Reading never touches the managers, so
+a server can read on a worker thread and merge on its own.
+
+Which packs are disabled is kept in data/packs/packs.json.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from .content_validator import ERROR, check_exercise, check_word
+from . import metrics
+
+KINDS = ("vocabulary", "grammar")
+STATE_FILE = "packs.json"
+CHECKS = {"vocabulary": check_word, "grammar": check_exercise}
+
+# ([(name, kind) to unmerge],
+#  [(name, kind, path, mtime, valid content or None, [skipped item messages])])
+PackChanges = Tuple[List[Tuple[str, str]],
+                    List[Tuple[str, str, str, float, Optional[Dict], List[str]]]]
+
+
+def _read_pack_file(path: str, kind: str) -> Tuple[Optional[Dict], List[str]]:
+    """Read one pack file and keep its valid items; (None, []) if it is unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = json.load(f)
+    except (json.JSONDecodeError, IOError, UnicodeDecodeError):
+        return None, []
+    if not isinstance(content, dict):
+        return None, []
+
+    check = CHECKS[kind]
+    valid: Dict[str, List[Dict]] = {}
+    skipped = []
+    for group, items in content.items():
+        if not isinstance(items, list):
+            skipped.append(f"{path}: {group} is not a list")
+            continue
+        kept = []
+        for index, item in enumerate(items):
+            errors = [message for severity, message in check(item) if severity == ERROR]
+            if errors:
+                skipped.append(f"{path}: {group}[{index}]: {'; '.join(errors)}")
+            else:
+                kept.append(item)
+        if kept:
+            valid[group] = kept
+    return valid, skipped
+
+
+class ContentPacks:
+    def __init__(self, pack_dir: str = "data/packs"):
+        self.pack_dir = pack_dir
+        # Kind -> {pack name: modification time of the merged file}
+        self.applied: Dict[str, Dict[str, float]] = {kind: {} for kind in KINDS}
+        self.failed: List[str] = []
+        # Items left out of the last sync because they failed validation
+        self.skipped: List[str] = []
+
+    def discover(self) -> List[str]:
+        """Names of the installed packs"""
+        if not os.path.isdir(self.pack_dir):
+            return []
+        return sorted(name for name in os.listdir(self.pack_dir)
+                      if any(os.path.isfile(os.path.join(self.pack_dir, name, kind + ".json"))
+                             for kind in KINDS))
+
+    def _state_path(self) -> str:
+        return os.path.join(self.pack_dir, STATE_FILE)
+
+    def disabled(self) -> List[str]:
+        """Names of the packs the learner switched off"""
+        try:
+            with open(self._state_path(), 'r', encoding='utf-8') as f:
+                return json.load(f).get("disabled", [])
+        except (json.JSONDecodeError, IOError):
+            return []
+
+    def set_enabled(self, name: str, enabled: bool):
+        """Switch a pack on or off; takes effect at the next sync"""
+        disabled = set(self.disabled())
+        if enabled:
+            disabled.discard(name)
+        else:
+            disabled.add(name)
+        os.makedirs(self.pack_dir, exist_ok=True)
+        with open(self._state_path(), 'w', encoding='utf-8') as f:
+            json.dump({"disabled": sorted(disabled)}, f, indent=2, ensure_ascii=False)
+
+    def enabled_packs(self) -> List[str]:
+        disabled = set(self.disabled())
+        return [name for name in self.discover() if name not in disabled]
+
+    @metrics.timed("packs.read")
+    def read_changes(self, kinds, workers: Optional[int] = None) -> PackChanges:
+        """Find packs to unmerge and read the new or changed ones; touches no manager"""
+        wanted: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        for name in self.enabled_packs():
+            for kind in kinds:
+                path = os.path.join(self.pack_dir, name, kind + ".json")
+                if os.path.isfile(path):
+                    wanted[(name, kind)] = (path, os.path.getmtime(path))
+
+        stale = [(name, kind) for kind in kinds for name, mtime in self.applied[kind].items()
+                 if wanted.get((name, kind), (None, None))[1] != mtime]
+        to_load = [(name, kind, path, mtime) for (name, kind), (path, mtime) in wanted.items()
+                   if (name, kind) in stale or name not in self.applied[kind]]
+        if not to_load:
+            return stale, []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_read_pack_file, [path for _, _, path, _ in to_load],
+                               [kind for _, kind, _, _ in to_load])
+            return stale, [entry + result for entry, result in zip(to_load, results)]
+
+    def apply_changes(self, managers: Dict, changes: PackChanges) -> Tuple[int, int]:
+        """Unmerge stale packs and merge the ones read; returns (files merged, removed)"""
+        stale, loaded = changes
+        for name, kind in stale:
+            managers[kind].remove_pack(name)
+            del self.applied[kind][name]
+
+        self.failed = []
+        self.skipped = []
+        for name, kind, path, mtime, content, skipped in loaded:
+            self.skipped.extend(skipped)
+            if content is None:
+                self.failed.append(path)
+                continue
+            managers[kind].add_pack(name, content)
+            self.applied[kind][name] = mtime
+        return len(loaded) - len(self.failed), len(stale)
+
+    @metrics.timed("packs.sync")
+    def sync(self, managers: Dict, workers: Optional[int] = None) -> Tuple[int, int]:
+        """Match managers ({kind: manager}) to the enabled packs; returns (files merged, removed)"""
+        return self.apply_changes(managers, self.read_changes(list(managers), workers))
@@ -0,0 +1,215 @@
+"""
+Content Validation for Inglês Autodidata
+
+Lints vocabulary, grammar and conversation packs before they ship:
+
+    python -m src.content_validator [--vocabulary PATH] [--grammar PATH]
+                                    [--conversations PATH]
+
+Files are streamed item by item and each item is checked as soon as it
+is decoded, in a single process: decoding is the bulk of the work and
+has to happen in the reader anyway to track duplicates, so a worker pool
+would only decode everything twice. Items are not kept, but memory still
+grows with the pack: one duplicate key per item and every issue found
+are held until the report is printed. Exits non-zero when any errors are
+found.
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+from .json_stream import iter_grouped_items
+from .dialog_engine import DialogCompileError, compile_dialog
+
+BLANK = "___"
+
+ERROR = "error"
+WARNING = "warning"
+
+# (kind, group, index, severity, message)
+Issue = Tuple[str, str, int, str, str]
+
+
+def _is_text(value) -> bool:
+    return isinstance(value, str) and value.strip() != ""
+
+
+def check_word(word_data) -> List[Tuple[str, str]]:
+    """Check one vocabulary entry"""
+    if not isinstance(word_data, dict):
+        return [(ERROR, "entry is not an object")]
+
+    problems = []
+    for field in ("word", "definition"):
+        if not _is_text(word_data.get(field)):
+            problems.append((ERROR, f"missing or empty '{field}'"))
+
+    examples = word_data.get("examples", [])
+    if not isinstance(examples, list) or not all(isinstance(e, str) for e in examples):
+        problems.append((ERROR, "'examples' must be a list of strings"))
+    inflections = word_data.get("inflections", [])
+    if not isinstance(inflections, list) or not all(_is_text(form) for form in inflections):
+        problems.append((ERROR, "'inflections' must be a list of non-empty strings"))
+    for field in ("pronunciation", "category"):
+        if field in word_data and not isinstance(word_data[field], str):
+            problems.append((ERROR, f"'{field}' must be a string"))
+    if not examples:
+        problems.append((WARNING, "no example sentences"))
+    return problems
+
+
+def check_exercise(exercise) -> List[Tuple[str, str]]:
+    """Check one grammar exercise"""
+    if not isinstance(exercise, dict):
+        return [(ERROR, "exercise is not an object")]
+
+    problems = []
+    question = exercise.get("question")
+    if not _is_text(question):
+        problems.append((ERROR, "missing or empty 'question'"))
+    elif BLANK not in question:
+        problems.append((WARNING, "question has no blank"))
+
+    options = exercise.get("options")
+    if not isinstance(options, list) or len(options) < 2 or not all(_is_text(o) for o in options):
+        problems.append((ERROR, "'options' must list at least two non-empty strings"))
+        options = []
+    elif len(set(options)) != len(options):
+        problems.append((ERROR, "duplicate options"))
+
+    correct = exercise.get("correct")
+    if not _is_text(correct):
+        problems.append((ERROR, "missing or empty 'correct'"))
+    elif options and correct not in options:
+        problems.append((ERROR, f"correct answer {correct!r} is not one of the options"))
+
+    if "explanation" in exercise and not isinstance(exercise["explanation"], str):
+        problems.append((ERROR, "'explanation' must be a string"))
+    return problems
+
+
+def check_conversation(conversation) -> List[Tuple[str, str]]:
+    """Check one conversation, linear or branching"""
+    if not isinstance(conversation, dict):
+        return [(ERROR, "conversation is not an object")]
+
+    problems = []
+    if not _is_text(conversation.get("title")):
+        problems.append((ERROR, "missing or empty 'title'"))
+
+    interactions = conversation.get("interactions")
+    if "nodes" not in conversation:
+        if not isinstance(interactions, list) or not interactions:
+            return problems + [(ERROR, "needs a non-empty 'interactions' list or a 'nodes' graph")]
+        for step, interaction in enumerate(interactions, 1):
+            if not isinstance(interaction, dict):
+                problems.append((ERROR, f"interaction {step} is not an object"))
+                continue
+            for field in ("speaker", "prompt"):
+                if not _is_text(interaction.get(field)):
+                    problems.append((ERROR, f"interaction {step}: missing '{field}'"))
+            responses = interaction.get("responses")
+            if not isinstance(responses, list) or len(responses) < 2:
+                problems.append((ERROR, f"interaction {step}: needs at least two responses"))
+            elif interaction.get("correct") not in responses:
+                problems.append((ERROR, f"interaction {step}: 'correct' is not one of the responses"))
+
+    if not problems:
+        # The dialog compiler checks graph structure: targets, reachability, dead ends
+        try:
+            compile_dialog(conversation)
+        except (DialogCompileError, AttributeError, KeyError, TypeError) as e:
+            problems.append((ERROR, f"dialog does not compile: {e}"))
+    return problems
+
+
+CHECKS = {
+    "vocabulary": check_word,
+    "grammar": check_exercise,
+    "conversations": check_conversation,
+}
+
+
+def _duplicate_key(kind: str, item) -> Optional[str]:
+    """The field that must be unique within a pack"""
+    if not isinstance(item, dict):
+        return None
+    key = {"vocabulary": "word", "grammar": "question"}.get(kind)
+    value = item.get(key) if key else None
+    return value.strip().lower() if isinstance(value, str) else None
+
+
+def _check_file(kind: str, path: str, issues: List[Issue], counts: Dict[str, int]):
+    """Stream one pack, checking each item and recording duplicates"""
+    check = CHECKS[kind]
+    seen: Dict[str, Tuple[str, int]] = {}
+    try:
+        for group, index, item in iter_grouped_items(path):
+            counts[kind] += 1
+            key = _duplicate_key(kind, item)
+            if key is not None:
+                if key in seen:
+                    first_group, first_index = seen[key]
+                    issues.append((kind, group, index, WARNING,
+                                   f"duplicate of {first_group}[{first_index}]"))
+                else:
+                    seen[key] = (group, index)
+            issues.extend((kind, group, index, severity, message)
+                          for severity, message in check(item))
+    except ValueError as e:
+        issues.append((kind, "", -1, ERROR, f"{path} is not a valid content file: {e}"))
+
+
+def validate(files: Dict[str, str]) -> Tuple[List[Issue], Dict]:
+    """Validate content files ({kind: path}); returns (issues, item counts)"""
+    issues: List[Issue] = []
+    counts = {kind: 0 for kind in files}
+    for kind, path in files.items():
+        _check_file(kind, path, issues, counts)
+    return issues, counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate Inglês Autodidata content packs")
+    parser.add_argument("--vocabulary", default="data/vocabulary.json")
+    parser.add_argument("--grammar", default="data/grammar.json")
+    parser.add_argument("--conversations", default="data/conversations.json")
+    parser.add_argument("--max-issues", type=int, default=50,
+                        help="how many issues to list (all are counted)")
+    parser.add_argument("--no-warnings", action="store_true", help="only report errors")
+    args = parser.parse_args(argv)
+
+    files = {}
+    for kind in CHECKS:
+        path = getattr(args, kind)
+        if os.path.exists(path):
+            files[kind] = path
+        else:
+            print(f"⚪ Skipping {kind}: {path} not found")
+
+    started = time.perf_counter()
+    issues, counts = validate(files)
+    elapsed = time.perf_counter() - started
+
+    if args.no_warnings:
+        issues = [issue for issue in issues if issue[3] == ERROR]
+    issues.sort(key=lambda issue: (issue[0], issue[1], issue[2]))
+
+    for kind, group, index, severity, message in issues[:args.max_issues]:
+        icon = "❌" if severity == ERROR else "⚠️ "
+        location = f"{kind}:{group}[{index}]" if index >= 0 else kind
+        print(f"{icon} {location}: {message}")
+    if len(issues) > args.max_issues:
+        print(f"   ... and {len(issues) - args.max_issues} more")
+
+    errors = sum(1 for issue in issues if issue[3] == ERROR)
+    checked = ", ".join(f"{count} {kind}" for kind, count in counts.items())
+    print(f"\n📋 Checked {checked} in {elapsed:.2f}s: "
+          f"{errors} errors, {len(issues) - errors} warnings")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
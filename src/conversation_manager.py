@@ -0,0 +1,256 @@
+"""
+Conversation Management System for Inglês Autodidata
+"""
+
+import json
+import os
+from typing import List, Dict
+from .dialog_engine import CompiledDialog, compile_dialog
+from . import metrics
+
+class ConversationManager:
+    def __init__(self, data_file: str = "data/conversations.json"):
+        self.data_file = data_file
+        self.conversations = self._load_conversations()
+        self._compiled: Dict[int, CompiledDialog] = {}
+
+    @metrics.timed("conversations.load")
+    def _load_conversations(self) -> Dict:
+        """Load conversations from JSON file"""
+        if os.path.exists(self.data_file):
+            try:
+                with open(self.data_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, IOError):
+                return self._create_default_conversations()
+        return self._create_default_conversations()
+
+    def _create_default_conversations(self) -> Dict:
+        """Create default conversation scenarios"""
+        return {
+            "shopping": [
+                {
+                    "title": "Buying a Jacket",
+                    "setting": "A clothing store downtown",
+                    "interactions": [
+                        {
+                            "situation": "You walk into the store and a clerk approaches you.",
+                            "speaker": "Clerk",
+                            "prompt": "Hi there! Can I help you find anything?",
+                            "responses": [
+                                "Yes, I'm looking for a winter jacket.",
+                                "Give me a jacket.",
+                                "I am find jacket."
+                            ],
+                            "correct": "Yes, I'm looking for a winter jacket.",
+                            "explanation": "'I'm looking for...' is a polite, natural way to say what you want."
+                        },
+                        {
+                            "situation": "The clerk shows you a jacket.",
+                            "speaker": "Clerk",
+                            "prompt": "What size do you wear?",
+                            "responses": [
+                                "I wear size medium.",
+                                "Medium is me.",
+                                "I am medium wearing."
+                            ],
+                            "correct": "I wear size medium.",
+                            "explanation": "Answer with 'I wear...' or simply 'Medium, please.'"
+                        },
+                        {
+                            "situation": "You like the jacket and want to know the price.",
+                            "speaker": "Clerk",
+                            "prompt": "Would you like to try it on?",
+                            "responses": [
+                                "Sure! How much does it cost?",
+                                "How much it costs?",
+                                "What the price?"
+                            ],
+                            "correct": "Sure! How much does it cost?",
+                            "explanation": "Questions with 'does' keep the main verb in its base form: 'does it cost'."
+                        }
+                    ]
+                }
+            ],
+            "restaurant": [
+                {
+                    "title": "Ordering Dinner",
+                    "setting": "A busy Italian restaurant",
+                    "start": "greeting",
+                    "nodes": {
+                        "greeting": {
+                            "situation": "The waiter comes to your table.",
+                            "speaker": "Waiter",
+                            "prompt": "Good evening! Are you ready to order?",
+                            "explanation": "Asking for more time politely is perfectly natural.",
+                            "responses": [
+                                {"text": "Yes, I'd like the lasagna, please.", "next": "drink", "correct": True},
+                                {"text": "Could we have a few more minutes, please?", "next": "wait", "correct": True},
+                                {"text": "Bring food.", "next": "drink",
+                                 "feedback": "This sounds rude. Try 'I'd like...' instead."}
+                            ]
+                        },
+                        "wait": {
+                            "situation": "A few minutes later, the waiter returns.",
+                            "speaker": "Waiter",
+                            "prompt": "Have you decided?",
+                            "responses": [
+                                {"text": "Yes, I'll have the lasagna, please.", "next": "drink", "correct": True},
+                                {"text": "I decide lasagna.", "next": "drink",
+                                 "feedback": "Use 'I'll have...' to order."}
+                            ]
+                        },
+                        "drink": {
+                            "situation": "The waiter writes down your order.",
+                            "speaker": "Waiter",
+                            "prompt": "Great choice. And anything to drink?",
+                            "responses": [
+                                {"text": "Just water, please.", "next": "bill", "correct": True},
+                                {"text": "Water is for me.", "next": "bill",
+                                 "feedback": "Simply say 'Just water, please.'"}
+                            ]
+                        },
+                        "bill": {
+                            "situation": "You have finished your meal.",
+                            "speaker": "Waiter",
+                            "prompt": "How was everything?",
+                            "explanation": "'Could I have the check?' is the usual way to ask for the bill in the US.",
+                            "responses": [
+                                {"text": "Delicious, thank you! Could I have the check, please?", "next": None, "correct": True},
+                                {"text": "Good. Money now.", "next": None,
+                                 "feedback": "Be polite: 'Could I have the check, please?'"}
+                            ]
+                        }
+                    }
+                }
+            ],
+            "travel": [
+                {
+                    "title": "Checking In at the Airport",
+                    "setting": "An airline check-in counter",
+                    "interactions": [
+                        {
+                            "situation": "You arrive at the counter.",
+                            "speaker": "Agent",
+                            "prompt": "Good morning. May I see your passport, please?",
+                            "responses": [
+                                "Of course, here you are.",
+                                "Take it.",
+                                "Yes, passport is here for you to see it."
+                            ],
+                            "correct": "Of course, here you are.",
+                            "explanation": "'Here you are' is the natural phrase when handing something over."
+                        },
+                        {
+                            "situation": "The agent checks your booking.",
+                            "speaker": "Agent",
+                            "prompt": "Would you prefer a window or an aisle seat?",
+                            "responses": [
+                                "A window seat, please.",
+                                "Window I want.",
+                                "I prefer the window one seat."
+                            ],
+                            "correct": "A window seat, please.",
+                            "explanation": "Short answers with 'please' are polite and natural."
+                        }
+                    ]
+                }
+            ],
+            "business": [
+                {
+                    "title": "Scheduling a Meeting",
+                    "setting": "A phone call with a client",
+                    "interactions": [
+                        {
+                            "situation": "A client calls to arrange a meeting.",
+                            "speaker": "Client",
+                            "prompt": "Are you available to meet next week?",
+                            "responses": [
+                                "Yes, I'm free on Tuesday afternoon.",
+                                "Tuesday afternoon I am free of time.",
+                                "Yes, in Tuesday."
+                            ],
+                            "correct": "Yes, I'm free on Tuesday afternoon.",
+                            "explanation": "Use 'on' with days: 'on Tuesday'."
+                        },
+                        {
+                            "situation": "The client agrees on the day.",
+                            "speaker": "Client",
+                            "prompt": "Great. Should we meet at your office?",
+                            "responses": [
+                                "That works for me. I'll send you the address.",
+                                "Is good. I send address.",
+                                "Yes office."
+                            ],
+                            "correct": "That works for me. I'll send you the address.",
+                            "explanation": "'That works for me' is a common way to agree to a plan."
+                        }
+                    ]
+                }
+            ],
+            "smalltalk": [
+                {
+                    "title": "Meeting a Neighbor",
+                    "setting": "The elevator of your apartment building",
+                    "interactions": [
+                        {
+                            "situation": "A neighbor greets you in the elevator.",
+                            "speaker": "Neighbor",
+                            "prompt": "Hi! I don't think we've met. I'm Sarah.",
+                            "responses": [
+                                "Nice to meet you, Sarah! I'm new here.",
+                                "Yes. Hello.",
+                                "I am meet you, Sarah."
+                            ],
+                            "correct": "Nice to meet you, Sarah! I'm new here.",
+                            "explanation": "'Nice to meet you' is the standard reply to an introduction."
+                        },
+                        {
+                            "situation": "She asks you a question.",
+                            "speaker": "Neighbor",
+                            "prompt": "How do you like the neighborhood so far?",
+                            "responses": [
+                                "I really like it. It's very quiet.",
+                                "Is quiet, I like.",
+                                "I am liking very much it."
+                            ],
+                            "correct": "I really like it. It's very quiet.",
+                            "explanation": "Keep small talk positive and use complete sentences."
+                        }
+                    ]
+                }
+            ]
+        }
+
+    def get_conversations_by_scenario(self, scenario: str) -> List[Dict]:
+        """Get conversations by scenario"""
+        return self.conversations.get(scenario, [])
+
+    def get_compiled_dialog(self, conversation: Dict) -> CompiledDialog:
+        """Get the compiled dialog graph for a conversation, compiling it once"""
+        key = id(conversation)
+        if key not in self._compiled:
+            self._compiled[key] = compile_dialog(conversation)
+        return self._compiled[key]
+
+    def add_conversation(self, scenario: str, conversation: Dict):
+        """Add a new conversation after validating its dialog graph"""
+        compiled = compile_dialog(conversation)
+
+        if scenario not in self.conversations:
+            self.conversations[scenario] = []
+
+        self.conversations[scenario].append(conversation)
+        self._compiled[id(conversation)] = compiled
+        self._save_conversations()
+
+    @metrics.timed("conversations.save")
+    def _save_conversations(self):
+        """Save conversations to JSON file"""
+        os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump(self.conversations, f, indent=2, ensure_ascii=False)
+
+    def get_scenarios(self) -> List[str]:
+        """Get all available conversation scenarios"""
+        return list(self.conversations.keys())
@@ -0,0 +1,179 @@
+"""
+Data Export for Inglês Autodidata
+
+Writes a learner's profile, stats, progress and full answer history to
+JSON Lines or CSV, optionally gzip-compressed. Records are written one at
+a time as they are read, and users.json itself is read one profile at a
+time, so memory use stays flat no matter how long the answer history or
+how many users are exported.
+
+Usage (admin export of every user):
+    python -m src.data_export --all exports/all-users.jsonl.gz
+    python -m src.data_export --user ana@example.com --format csv ana.csv
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+from .answer_history import AnswerHistory, migrate_user_files
+from .json_stream import iter_object_items
+from . import metrics
+
+FORMATS = ("jsonl", "csv")
+CSV_COLUMNS = ["email", "record", "field", "value", "ts", "type", "item", "answer", "correct",
+               "latency_ms"]
+PROGRESS_EVERY_USERS = 100
+
+
+def _open_output(path: str, compress: bool):
+    """Open an export file for text writing, gzip-compressed if requested"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if compress:
+        return gzip.open(path, 'wt', encoding='utf-8', newline='')
+    return open(path, 'w', encoding='utf-8', newline='')
+
+
+def iter_user_records(user: Dict, history: AnswerHistory) -> Iterator[Dict]:
+    """Yield a user's export records: profile, stats, progress, then every answer"""
+    email = user["email"]
+    profile = {key: value for key, value in user.items() if key not in ("stats", "progress")}
+
+    yield {"email": email, "record": "profile", "data": profile}
+    yield {"email": email, "record": "stats", "data": user.get("stats", {})}
+    yield {"email": email, "record": "progress", "data": user.get("progress", {})}
+
+    for event in history.iter_events(email):
+        yield {"email": email, "record": "answer", **event}
+
+
+def _csv_rows(record: Dict) -> Iterator[Dict]:
+    """Flatten one export record into CSV rows"""
+    if record["record"] == "answer":
+        yield record
+        return
+
+    data = record["data"]
+    for field, value in data.items():
+        if record["record"] == "progress" and isinstance(value, dict):
+            # Progress is nested by category, then level
+            for level, points in value.items():
+                yield {"email": record["email"], "record": "progress",
+                       "field": f"{field}.{level}", "value": points}
+        else:
+            if isinstance(value, (list, dict)):
+                value = json.dumps(value, ensure_ascii=False)
+            yield {"email": record["email"], "record": record["record"],
+                   "field": field, "value": value}
+
+
+@metrics.timed("export.write")
+def write_records(records: Iterable[Dict], path: str, fmt: str = "jsonl",
+                  compress: Optional[bool] = None) -> int:
+    """Stream records to a file; returns how many records were written"""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    if compress is None:
+        compress = path.endswith(".gz")
+
+    written = 0
+    with _open_output(path, compress) as f:
+        if fmt == "jsonl":
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                written += 1
+        else:
+            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            for record in records:
+                writer.writerows(_csv_rows(record))
+                written += 1
+
+    return written
+
+
+def export_filename(email: str, fmt: str, compress: bool, directory: str = "exports") -> str:
+    """Build a timestamped export path for a user"""
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    name = email.replace("@", "_at_")
+    suffix = f".{fmt}.gz" if compress else f".{fmt}"
+    return os.path.join(directory, f"{name}-{stamp}{suffix}")
+
+
+def export_user(user: Dict, path: str, fmt: str = "jsonl", compress: Optional[bool] = None,
+                history: AnswerHistory = None) -> int:
+    """Export one user's data"""
+    history = history or AnswerHistory()
+    return write_records(iter_user_records(user, history), path, fmt, compress)
+
+
+def iter_users(users_file: str) -> Iterator[Tuple[str, Dict]]:
+    """Read (email, profile) pairs from users.json one at a time"""
+    if os.path.exists(users_file):
+        yield from iter_object_items(users_file)
+
+
+def export_all_users(users_file: str, path: str, fmt: str = "jsonl",
+                     compress: Optional[bool] = None, history: AnswerHistory = None,
+                     on_progress: Callable[[int], None] = None) -> int:
+    """Export every user's data into a single file"""
+    history = history or AnswerHistory()
+
+    def records() -> Iterator[Dict]:
+        done = 0
+        for done, (_, user) in enumerate(iter_users(users_file), 1):
+            yield from iter_user_records(user, history)
+            if on_progress and done % PROGRESS_EVERY_USERS == 0:
+                on_progress(done)
+        if on_progress:
+            on_progress(done)
+
+    return write_records(records(), path, fmt, compress)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export Inglês Autodidata user data")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--all", action="store_true", help="export every user")
+    target.add_argument("--user", metavar="EMAIL", help="export a single user")
+    parser.add_argument("output", help="output file (a .gz suffix enables compression)")
+    parser.add_argument("--format", choices=FORMATS, default="jsonl")
+    parser.add_argument("--gzip", action="store_true", help="compress even without a .gz suffix")
+    parser.add_argument("--users-file", default="data/users.json")
+    parser.add_argument("--history-dir", default="data/history")
+    args = parser.parse_args(argv)
+
+    history = AnswerHistory(args.history_dir)
+    for path in migrate_user_files((email for email, _ in iter_users(args.users_file)),
+                                   [args.history_dir]):
+        print(f"⚠️  {path} mixes the answers of several users and is not exported.",
+              file=sys.stderr)
+    compress = True if args.gzip else None
+    started = time.perf_counter()
+
+    if args.all:
+        def report(done: int):
+            print(f"\r📤 Exported {done} users", end="", file=sys.stderr, flush=True)
+
+        count = export_all_users(args.users_file, args.output, args.format, compress,
+                                 history, on_progress=report)
+        print(file=sys.stderr)
+    else:
+        user = next((user for email, user in iter_users(args.users_file)
+                     if email == args.user), None)
+        if user is None:
+            parser.error(f"unknown user: {args.user}")
+        count = export_user(user, args.output, args.format, compress, history)
+
+    print(f"✅ Wrote {count} records to {args.output} in {time.perf_counter() - started:.1f}s",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+Branching Dialog Engine for Inglês Autodidata
+
+Conversation graphs are compiled once into flat, integer-indexed transition
+tables (CSR layout: node -> slice of outgoing responses), so every turn of a
+conversation is a couple of array lookups regardless of graph size.
+"""
+
+from array import array
+from collections import deque
+from typing import Dict, List, Tuple
+from . import metrics
+
+END = -1  # Transition target meaning "the conversation is over"
+
+
+class DialogCompileError(ValueError):
+    """Raised when a dialog graph is malformed"""
+
+    def __init__(self, title: str, problems: List[str]):
+        self.title = title
+        self.problems = problems
+        super().__init__(f"Dialog '{title}' is invalid: " + "; ".join(problems))
+
+
+class CompiledDialog:
+    """Immutable, integer-indexed form of a conversation graph"""
+
+    __slots__ = (
+        "title", "setting", "start", "node_ids",
+        "situations", "speakers", "prompts", "explanations",
+        "offsets", "targets", "scores", "responses", "feedback"
+    )
+
+    def __init__(self, title: str, setting: str, start: int, node_ids: List[str],
+                 situations: List[str], speakers: List[str], prompts: List[str],
+                 explanations: List[str], offsets: array, targets: array,
+                 scores: array, responses: List[str], feedback: List[str]):
+        self.title = title
+        self.setting = setting
+        self.start = start
+        self.node_ids = node_ids
+        self.situations = situations
+        self.speakers = speakers
+        self.prompts = prompts
+        self.explanations = explanations
+        self.offsets = offsets
+        self.targets = targets
+        self.scores = scores
+        self.responses = responses
+        self.feedback = feedback
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    def get_responses(self, node: int) -> List[str]:
+        """Get the response texts offered at a node"""
+        return self.responses[self.offsets[node]:self.offsets[node + 1]]
+
+    def response_count(self, node: int) -> int:
+        """Get the number of responses offered at a node"""
+        return self.offsets[node + 1] - self.offsets[node]
+
+    def is_end(self, node: int) -> bool:
+        """Check whether a node closes the conversation"""
+        return self.offsets[node] == self.offsets[node + 1]
+
+    def choose(self, node: int, choice: int) -> Tuple[int, int, str]:
+        """Follow a response from a node, returning (next node, score, feedback)"""
+        edge = self.offsets[node] + choice
+        return self.targets[edge], self.scores[edge], self.feedback[edge]
+
+    def best_response(self, node: int) -> str:
+        """Get the highest-scoring response text at a node"""
+        first, last = self.offsets[node], self.offsets[node + 1]
+        best = max(range(first, last), key=self.scores.__getitem__)
+        return self.responses[best]
+
+
+def linear_to_graph(conversation: Dict) -> Dict:
+    """Convert a legacy linear `interactions` conversation into graph form"""
+    interactions = conversation.get("interactions", [])
+    nodes = {}
+
+    for i, interaction in enumerate(interactions):
+        next_id = str(i + 1) if i + 1 < len(interactions) else None
+        nodes[str(i)] = {
+            "situation": interaction.get("situation", ""),
+            "speaker": interaction.get("speaker", ""),
+            "prompt": interaction.get("prompt", ""),
+            "explanation": interaction.get("explanation", ""),
+            "responses": [
+                {
+                    "text": response,
+                    "next": next_id,
+                    "correct": response == interaction.get("correct")
+                }
+                for response in interaction.get("responses", [])
+            ]
+        }
+
+    return {
+        "title": conversation.get("title", ""),
+        "setting": conversation.get("setting", ""),
+        "start": "0",
+        "nodes": nodes
+    }
+
+
+@metrics.timed("dialog.compile")
+def compile_dialog(conversation: Dict) -> CompiledDialog:
+    """Compile a conversation (graph or linear form) into transition tables"""
+    title = conversation.get("title", "untitled")
+    if "nodes" not in conversation:
+        interactions = conversation.get("interactions", [])
+        if not isinstance(interactions, list) or not all(
+                isinstance(interaction, dict) and isinstance(interaction.get("responses", []), list)
+                for interaction in interactions):
+            raise DialogCompileError(title, ["'interactions' must be a list of objects "
+                                             "with a 'responses' list"])
+        conversation = linear_to_graph(conversation)
+
+    nodes = conversation.get("nodes", {})
+    problems = []
+
+    if not nodes:
+        raise DialogCompileError(title, ["dialog has no nodes"])
+    if not isinstance(nodes, dict):
+        raise DialogCompileError(title, ["'nodes' must be an object"])
+
+    node_ids = list(nodes.keys())
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
+
+    start_id = conversation.get("start", node_ids[0])
+    if not isinstance(start_id, str) or start_id not in index:
+        raise DialogCompileError(title, [f"start node '{start_id}' does not exist"])
+
+    situations, speakers, prompts, explanations = [], [], [], []
+    offsets = array("I", [0])
+    targets = array("i")
+    scores = array("b")
+    responses, feedback = [], []
+
+    for node_id in node_ids:
+        node = nodes[node_id]
+        if not isinstance(node, dict):
+            problems.append(f"node '{node_id}' is not an object")
+            node = {}
+        node_responses = node.get("responses", [])
+        if not isinstance(node_responses, list):
+            problems.append(f"node '{node_id}': 'responses' must be a list")
+            node_responses = []
+        situations.append(node.get("situation", ""))
+        speakers.append(node.get("speaker", ""))
+        prompts.append(node.get("prompt", ""))
+        explanations.append(node.get("explanation", ""))
+
+        for response in node_responses:
+            if not isinstance(response, dict):
+                problems.append(f"node '{node_id}' has a response that is not an object")
+                continue
+            next_id = response.get("next")
+            if next_id is None:
+                target = END
+            elif isinstance(next_id, str) and next_id in index:
+                target = index[next_id]
+            else:
+                problems.append(f"node '{node_id}' points to unknown node '{next_id}'")
+                target = END
+
+            targets.append(target)
+            scores.append(1 if response.get("correct") else 0)
+            responses.append(response.get("text", ""))
+            feedback.append(response.get("feedback", ""))
+
+        offsets.append(len(targets))
+
+    problems.extend(_check_graph(node_ids, index[start_id], offsets, targets))
+    if problems:
+        raise DialogCompileError(title, problems)
+
+    return CompiledDialog(
+        title, conversation.get("setting", ""), index[start_id], node_ids,
+        situations, speakers, prompts, explanations,
+        offsets, targets, scores, responses, feedback
+    )
+
+
+def _check_graph(node_ids: List[str], start: int, offsets: array,
+                 targets: array) -> List[str]:
+    """Find unreachable nodes and nodes that can never reach an ending"""
+    node_count = len(node_ids)
+    problems = []
+
+    # Forward reachability from the start node
+    reachable = bytearray(node_count)
+    reachable[start] = 1
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for edge in range(offsets[node], offsets[node + 1]):
+            target = targets[edge]
+            if target != END and not reachable[target]:
+                reachable[target] = 1
+                queue.append(target)
+
+    # Backward reachability from every ending (END edge or response-less node)
+    incoming: List[List[int]] = [[] for _ in range(node_count)]
+    finishes = bytearray(node_count)
+    queue = deque()
+    for node in range(node_count):
+        first, last = offsets[node], offsets[node + 1]
+        if first == last:
+            finishes[node] = 1
+        for edge in range(first, last):
+            target = targets[edge]
+            if target == END:
+                finishes[node] = 1
+            else:
+                incoming[target].append(node)
+        if finishes[node]:
+            queue.append(node)
+
+    while queue:
+        node = queue.popleft()
+        for source in incoming[node]:
+            if not finishes[source]:
+                finishes[source] = 1
+                queue.append(source)
+
+    unreachable = [node_ids[i] for i in range(node_count) if not reachable[i]]
+    dead_ends = [node_ids[i] for i in range(node_count) if reachable[i] and not finishes[i]]
+
+    if unreachable:
+        problems.append(f"unreachable nodes: {', '.join(unreachable[:10])}")
+    if dead_ends:
+        problems.append(f"nodes that never reach an ending: {', '.join(dead_ends[:10])}")
+
+    return problems
@@ -0,0 +1,183 @@
+"""
+Distractor Index for Inglês Autodidata multiple-choice questions
+
+Each word gets a short, precomputed list of plausible wrong answers: words
+from the same category, of similar length, with close spelling or sharing
+rare definition terms. Candidates come from small buckets (never a full
+scan), so building the index is roughly linear and a question is O(1).
+Scores are symmetric, so a word added later is scored once against its
+candidates and offered to each of their bounded, ranked lists, replacing
+the weakest neighbour when it is more plausible.
+"""
+
+import heapq
+import re
+import zlib
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Dict, List, Tuple
+from . import metrics
+
+NEIGHBOURS_PER_WORD = 6
+CANDIDATES_PER_SOURCE = 6
+_TOKEN_RE = re.compile(r"[a-z]+")
+_STOPWORDS = {
+    "a", "an", "the", "or", "and", "of", "to", "in", "on", "for", "with",
+    "by", "at", "from", "that", "which", "something", "someone", "very"
+}
+
+
+def _definition_terms(definition: str) -> List[str]:
+    """Get the content words of a definition"""
+    return [t for t in _TOKEN_RE.findall(definition.lower())
+            if len(t) > 2 and t not in _STOPWORDS]
+
+
+def _shared_edges(a: str, b: str) -> int:
+    """Count shared leading and trailing characters, up to three each"""
+    return ((a[:1] == b[:1]) + (a[:2] == b[:2]) + (a[:3] == b[:3]) +
+            (a[-1:] == b[-1:]) + (a[-2:] == b[-2:]) + (a[-3:] == b[-3:]))
+
+
+class DistractorIndex:
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        """Drop all indexed data"""
+        self.entries: Dict[str, Dict] = {}
+        self.neighbours: Dict[str, List[str]] = {}
+        # Word -> its neighbours as (-score, key), best first; keys mirror `neighbours`
+        self._ranked: Dict[str, List[Tuple[float, str]]] = {}
+        self._terms: Dict[str, frozenset] = {}
+        self._by_category: Dict[str, List[str]] = defaultdict(list)
+        self._by_length: Dict[int, List[str]] = defaultdict(list)
+        self._by_term: Dict[str, List[str]] = defaultdict(list)
+        self._sorted: List[str] = []
+        self._sorted_reversed: List[str] = []
+
+    @metrics.timed("vocabulary.distractor_index")
+    def build(self, vocabulary: Dict):
+        """Build the index for a whole vocabulary"""
+        self._reset()
+
+        for level in vocabulary.values():
+            for word_data in level:
+                self._register(word_data)
+
+        self._sorted.sort()
+        self._sorted_reversed.sort()
+
+        for key in self.entries:
+            self._set_ranked(key, heapq.nsmallest(NEIGHBOURS_PER_WORD, self._score_candidates(key)))
+
+    def add(self, word_data: Dict):
+        """Index a single new word and offer it to the words it was scored against"""
+        key = word_data["word"].lower()
+        if key in self.entries:
+            self.entries[key] = word_data
+            return
+
+        self._register(word_data, keep_sorted=True)
+        scored = self._score_candidates(key)
+        self._set_ranked(key, heapq.nsmallest(NEIGHBOURS_PER_WORD, scored))
+
+        for neg_points, other in scored:
+            ranked = self._ranked[other]
+            entry = (neg_points, key)
+            if len(ranked) < NEIGHBOURS_PER_WORD:
+                insort(ranked, entry)
+            elif entry < ranked[-1]:
+                ranked.pop()
+                insort(ranked, entry)
+            else:
+                continue
+            self.neighbours[other] = [k for _, k in ranked]
+
+    def _set_ranked(self, key: str, ranked: List[Tuple[float, str]]):
+        self._ranked[key] = ranked
+        self.neighbours[key] = [other for _, other in ranked]
+
+    def get_distractors(self, word: str, count: int) -> List[Dict]:
+        """Get up to `count` precomputed distractors for a word"""
+        keys = self.neighbours.get(word.lower(), [])
+        return [self.entries[k] for k in keys[:count]]
+
+    def get_neighbour_words(self, word: str) -> List[str]:
+        """Get all precomputed neighbour keys for a word"""
+        return self.neighbours.get(word.lower(), [])
+
+    def _register(self, word_data: Dict, keep_sorted: bool = False):
+        """Add a word to the candidate buckets"""
+        key = word_data["word"].lower()
+        if key in self.entries:
+            return
+
+        terms = frozenset(_definition_terms(word_data.get("definition", "")))
+        self.entries[key] = word_data
+        self._terms[key] = terms
+        self._by_category[word_data.get("category", "general")].append(key)
+        self._by_length[len(key)].append(key)
+
+        for term in terms:
+            self._by_term[term].append(key)
+
+        if keep_sorted:
+            insort(self._sorted, key)
+            insort(self._sorted_reversed, key[::-1])
+        else:
+            self._sorted.append(key)
+            self._sorted_reversed.append(key[::-1])
+
+    def _window(self, keys: List[str], probe: str, reverse: bool = False) -> List[str]:
+        """Get the keys surrounding `probe` in a sorted list"""
+        pos = bisect_left(keys, probe)
+        half = CANDIDATES_PER_SOURCE // 2
+        window = keys[max(0, pos - half):pos + half + 1]
+        return [k[::-1] for k in window] if reverse else window
+
+    def _bucket_sample(self, bucket: List[str], key: str,
+                       limit: int = CANDIDATES_PER_SOURCE) -> List[str]:
+        """Get a bounded slice of a bucket, starting at a key-dependent offset"""
+        if len(bucket) <= limit + 1:
+            return bucket
+        # crc32, unlike the salted hash(), gives the same neighbours in every process
+        start = zlib.crc32(key.encode()) % len(bucket)
+        sample = bucket[start:start + limit]
+        if len(sample) < limit:
+            sample += bucket[:limit - len(sample)]
+        return sample
+
+    def _score_candidates(self, key: str) -> List[Tuple[float, str]]:
+        """Collect bounded candidates for a word as (-plausibility, key)"""
+        category = self.entries[key].get("category", "general")
+        terms = self._terms[key]
+
+        candidates = set(self._window(self._sorted, key))
+        candidates.update(self._window(self._sorted_reversed, key[::-1], reverse=True))
+        candidates.update(self._bucket_sample(self._by_category[category], key))
+        for length in (len(key) - 1, len(key), len(key) + 1):
+            candidates.update(self._bucket_sample(self._by_length.get(length, []), key,
+                                                  CANDIDATES_PER_SOURCE // 2))
+
+        # Rarest definition terms are the most telling ones
+        rare_terms = sorted(terms, key=lambda t: len(self._by_term[t]))[:2]
+        for term in rare_terms:
+            candidates.update(self._bucket_sample(self._by_term[term], key,
+                                                  CANDIDATES_PER_SOURCE // 2))
+
+        candidates.discard(key)
+        entries = self.entries
+        term_sets = self._terms
+        length = len(key)
+
+        scored = []
+        for other in candidates:
+            points = _shared_edges(key, other) * 0.5
+            if entries[other].get("category", "general") == category:
+                points += 2
+            if abs(len(other) - length) <= 1:
+                points += 1
+            points += len(terms & term_sets[other]) * 0.75
+            scored.append((-points, other))
+        return scored
@@ -0,0 +1,240 @@
+"""
+Forgetting Model for Inglês Autodidata
+
+Half-life regression (Settles & Meeder, 2016): the chance a learner still
+recalls a word decays as p = 2^(-Δ/h), where Δ is the time since they last
+practised it and the half-life h = 2^(θ·x) grows with the feature vector x
+of their review history for that word (how often they got it right and
+wrong). Training fits θ over every past review with full-batch, vectorized
+gradient descent and needs NumPy. Scoring a learner's words is one batched
+matrix product when NumPy is installed and a plain Python loop otherwise,
+so review sessions work without it.
+
+Train with:
+    python -m src.forgetting_model [--iterations 500]
+"""
+
+import argparse
+import json
+import math
+import os
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # only training needs NumPy
+    np = None
+
+from .user_manager import UserManager
+from .answer_history import AnswerHistory
+from . import metrics
+
+FEATURES = ("bias", "right", "wrong")
+# Untrained fallback: about a two-day half-life that grows with each success
+DEFAULT_WEIGHTS = (1.0, 1.0, -0.5)
+SECONDS_PER_DAY = 86400.0
+MIN_HALF_LIFE_DAYS = 15 / (24 * 60)
+MAX_HALF_LIFE_DAYS = 274.0
+HALF_LIFE_WEIGHT = 0.01
+L2_PENALTY = 0.1
+LEARNING_RATE = 0.05
+MAX_ITERATIONS = 500
+LN2 = math.log(2.0)
+
+
+class WordReviews:
+    """A learner's review record for one word"""
+
+    __slots__ = ("last_seen", "right", "wrong")
+
+    def __init__(self, last_seen: float):
+        self.last_seen = last_seen
+        self.right = 0
+        self.wrong = 0
+
+    def features(self) -> Tuple[float, float, float]:
+        return 1.0, math.sqrt(1 + self.right), math.sqrt(1 + self.wrong)
+
+    def update(self, ts: float, correct: bool):
+        self.last_seen = ts
+        if correct:
+            self.right += 1
+        else:
+            self.wrong += 1
+
+
+def summarize_reviews(events: Iterable[Dict]) -> Dict[str, WordReviews]:
+    """Fold a learner's answer history into per-word review records"""
+    reviews: Dict[str, WordReviews] = {}
+    for event in events:
+        if event.get("type") != "vocabulary":
+            continue
+        word = event["item"]
+        record = reviews.get(word)
+        if record is None:
+            record = reviews[word] = WordReviews(event["ts"])
+        record.update(event["ts"], bool(event.get("correct")))
+    return reviews
+
+
+class ForgettingModel:
+    def __init__(self, weights: Optional[Iterable[float]] = None):
+        self.weights = [float(weight) for weight in weights or DEFAULT_WEIGHTS]
+
+    def half_life(self, features: "np.ndarray") -> "np.ndarray":
+        """Half-lives in days for a matrix of feature rows"""
+        log_half_life = np.clip(features @ np.asarray(self.weights),
+                                math.log2(MIN_HALF_LIFE_DAYS), math.log2(MAX_HALF_LIFE_DAYS))
+        return np.exp2(log_half_life)
+
+    def predict_recall(self, features: "np.ndarray", lag_days: "np.ndarray") -> "np.ndarray":
+        """Recall probabilities after `lag_days` for a matrix of feature rows"""
+        return np.exp2(-lag_days / self.half_life(features))
+
+    def recall(self, record: WordReviews, now: float) -> float:
+        """Recall probability of one word right now"""
+        log_half_life = sum(w * x for w, x in zip(self.weights, record.features()))
+        log_half_life = min(max(log_half_life, math.log2(MIN_HALF_LIFE_DAYS)),
+                            math.log2(MAX_HALF_LIFE_DAYS))
+        lag_days = max(now - record.last_seen, 0.0) / SECONDS_PER_DAY
+        return 2.0 ** (-lag_days / 2.0 ** log_half_life)
+
+    @metrics.timed("forgetting.score")
+    def score(self, reviews: Dict[str, WordReviews],
+              now: Optional[float] = None) -> List[Tuple[str, float]]:
+        """Predict current recall for every word a learner has reviewed"""
+        now = now or time.time()
+        if np is None:
+            return [(word, self.recall(record, now)) for word, record in reviews.items()]
+        records = list(reviews.values())
+        features = np.array([record.features() for record in records], dtype=np.float64)
+        last_seen = np.fromiter((record.last_seen for record in records), dtype=np.float64,
+                                count=len(records))
+        lag_days = np.maximum(now - last_seen, 0.0) / SECONDS_PER_DAY
+        recall = self.predict_recall(features.reshape(-1, len(FEATURES)), lag_days)
+        return list(zip(reviews, recall.tolist()))
+
+    def most_forgotten(self, events: Iterable[Dict], count: int,
+                       now: Optional[float] = None) -> List[Tuple[str, float]]:
+        """The `count` words a learner is least likely to recall right now"""
+        scored = self.score(summarize_reviews(events), now)
+        return sorted(scored, key=lambda pair: pair[1])[:count]
+
+    @metrics.timed("forgetting.fit")
+    def fit(self, features: "np.ndarray", lag_days: "np.ndarray", recalled: "np.ndarray",
+            iterations: int = MAX_ITERATIONS, learning_rate: float = LEARNING_RATE) -> float:
+        """Fit the weights by gradient descent; returns the final mean squared error"""
+        n = len(recalled)
+        if n == 0:
+            return 0.0
+
+        # Target half-lives implied by each outcome, clipped to a sane range
+        target = np.clip(recalled, 0.0001, 0.9999)
+        target_log_half_life = np.clip(np.log2(-lag_days / np.log2(target)),
+                                       math.log2(MIN_HALF_LIFE_DAYS),
+                                       math.log2(MAX_HALF_LIFE_DAYS))
+
+        weights = np.asarray(self.weights, dtype=np.float64)
+        for _ in range(iterations):
+            log_half_life = features @ weights
+            half_life = np.exp2(log_half_life)
+            predicted = np.exp2(-lag_days / half_life)
+
+            recall_term = (2.0 * (predicted - recalled) * LN2 * LN2
+                           * predicted * (lag_days / half_life))
+            half_life_term = 2.0 * HALF_LIFE_WEIGHT * (log_half_life - target_log_half_life)
+            gradient = features.T @ (recall_term + half_life_term) / n
+            gradient += L2_PENALTY * weights / n
+            weights -= learning_rate * gradient
+        self.weights = weights.tolist()
+
+        predicted = self.predict_recall(features, lag_days)
+        return float(np.mean((predicted - recalled) ** 2))
+
+    def save(self, path: str):
+        """Save the weights as JSON"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"features": list(FEATURES), "weights": self.weights}, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str = "data/forgetting_model.json") -> "ForgettingModel":
+        """Load trained weights, falling back to the defaults"""
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("features") == list(FEATURES):
+                    return cls(data["weights"])
+            except (json.JSONDecodeError, IOError, KeyError):
+                pass
+        return cls()
+
+
+@metrics.timed("forgetting.training_set")
+def build_training_set(user_manager: UserManager,
+                       history: AnswerHistory) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Turn every repeat review into (features before it, days since last review, recalled)"""
+    features = array('d')
+    lags = array('d')
+    recalled = array('d')
+
+    for email in list(user_manager.users):
+        reviews: Dict[str, WordReviews] = {}
+        for event in history.iter_events(email):
+            if event.get("type") != "vocabulary":
+                continue
+            word, ts, correct = event["item"], event["ts"], bool(event.get("correct"))
+            record = reviews.get(word)
+            if record is None:
+                record = reviews[word] = WordReviews(ts)
+            else:
+                features.extend(record.features())
+                lags.append(max(ts - record.last_seen, 1.0) / SECONDS_PER_DAY)
+                recalled.append(1.0 if correct else 0.0)
+            record.update(ts, correct)
+
+    return (np.frombuffer(features, dtype=np.float64).reshape(-1, len(FEATURES)),
+            np.frombuffer(lags, dtype=np.float64),
+            np.frombuffer(recalled, dtype=np.float64))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the half-life regression forgetting model")
+    parser.add_argument("--users-file", default="data/users.json")
+    parser.add_argument("--history-dir", default="data/history")
+    parser.add_argument("--output", default="data/forgetting_model.json")
+    parser.add_argument("--iterations", type=int, default=MAX_ITERATIONS)
+    args = parser.parse_args(argv)
+
+    if np is None:
+        print("❌ Training the forgetting model needs NumPy (pip install -r requirements.txt).")
+        return
+
+    started = time.perf_counter()
+    features, lags, recalled = build_training_set(
+        UserManager(args.users_file, autosave=False), AnswerHistory(args.history_dir))
+    print(f"📥 Built {len(recalled)} review samples in {time.perf_counter() - started:.2f}s")
+    if len(recalled) == 0:
+        print("❌ No repeat reviews recorded yet; nothing to train on.")
+        return
+
+    model = ForgettingModel()
+    baseline = float(np.mean((model.predict_recall(features, lags) - recalled) ** 2))
+    started = time.perf_counter()
+    error = model.fit(features, lags, recalled, args.iterations)
+    print(f"📐 Trained in {time.perf_counter() - started:.2f}s: "
+          f"MSE {baseline:.4f} → {error:.4f}")
+    for name, weight in zip(FEATURES, model.weights):
+        print(f"   {name:<6} {weight:+.3f}")
+
+    model.save(args.output)
+    print(f"✅ Saved model to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
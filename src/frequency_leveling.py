@@ -0,0 +1,162 @@
+"""
+Frequency-Based Vocabulary Leveling for Inglês Autodidata
+
+Assigns each word a level from how common it is in a word-frequency
+table, replacing hand-sorted buckets. Ranks and levels for the whole pack
+are computed as NumPy arrays in one pass. Every entry stores its
+"frequency_rank", and each level is written out in rank order, so
+`VocabularyManager.get_random_words` can sample a frequency band by
+bisecting instead of re-sorting.
+
+The frequency table is a text file with one word per line, most common
+first, or "word<TAB or comma>count" lines in any order (a space works
+too when the count is the last field). Headwords may be several words
+("look after"). Words missing from the table keep their current level.
+
+Requires NumPy. Usage:
+    python -m src.frequency_leveling frequencies.tsv [--thresholds 2000,8000] [--dry-run]
+"""
+
+import argparse
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import metrics
+
+LEVELS = ("beginner", "intermediate", "advanced")
+# Rank cut-offs: the 2,000 most common words are beginner, up to 8,000 intermediate
+DEFAULT_THRESHOLDS = (2000, 8000)
+# Headwords may contain spaces ("look after"), so only a tab or comma separates the count
+_SEPARATOR = re.compile(r"\s*[\t,]\s*")
+
+
+def _parse_count(text: str) -> Optional[float]:
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def _parse_line(line: str, position: int) -> Optional[Tuple[str, float]]:
+    """(word, count) from one table line; bare words count down from the top"""
+    parts = _SEPARATOR.split(line)
+    if len(parts) == 1:
+        # "word count" with a space is accepted when the last field is a number
+        word, _, last = line.rpartition(" ")
+        count = _parse_count(last) if word else None
+        if count is not None:
+            return " ".join(word.split()).lower(), count
+        return " ".join(line.split()).lower(), -position
+    count = _parse_count(parts[1]) if len(parts) == 2 and parts[0] else None
+    if count is None:
+        return None
+    return " ".join(parts[0].split()).lower(), count
+
+
+@metrics.timed("leveling.load_table")
+def load_frequency_table(path: str, bad_lines: Optional[List[int]] = None) -> Dict[str, int]:
+    """Read a frequency table into {word: rank}, skipping malformed lines into `bad_lines`"""
+    words = []
+    counts = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parsed = _parse_line(line, len(counts))
+            if parsed is None:
+                if bad_lines is not None:
+                    bad_lines.append(line_number)
+                continue
+            words.append(parsed[0])
+            counts.append(parsed[1])
+
+    # Counts may be in any order; a bare word list is already ranked
+    order = np.argsort(-np.asarray(counts, dtype=np.float64), kind="stable")
+    ranks = np.empty(len(order), dtype=np.int64)
+    ranks[order] = np.arange(1, len(order) + 1)
+
+    table: Dict[str, int] = {}
+    for word, rank in zip(words, ranks.tolist()):
+        table.setdefault(word, rank)  # keep the best rank of duplicates
+    return table
+
+
+@metrics.timed("leveling.level")
+def level_vocabulary(vocabulary: Dict, table: Dict[str, int],
+                     thresholds: Sequence[int] = DEFAULT_THRESHOLDS) -> Tuple[Dict, Dict[str, int]]:
+    """Re-bucket a vocabulary by frequency; returns (new vocabulary, words moved per level)"""
+    names = list(LEVELS) + [level for level in vocabulary if level not in LEVELS]
+    entries = [word_data for level in vocabulary.values() for word_data in level]
+    current = np.fromiter((names.index(level) for level, words in vocabulary.items()
+                           for _ in words), dtype=np.int64, count=len(entries))
+
+    ranks = np.fromiter((table.get(word_data["word"].lower(), 0) for word_data in entries),
+                        dtype=np.int64, count=len(entries))
+    known = ranks > 0
+    levels = np.where(known, np.searchsorted(np.asarray(thresholds), ranks, side="left"), current)
+
+    # Unranked words sort after every ranked one within their level
+    sort_ranks = np.where(known, ranks, len(table) + 1)
+    order = np.lexsort((sort_ranks, levels))
+
+    leveled: Dict[str, list] = {name: [] for name in names}
+    rank_list = ranks.tolist()
+    level_list = levels.tolist()
+    for position in order.tolist():
+        word_data = entries[position]
+        if rank_list[position]:
+            word_data["frequency_rank"] = rank_list[position]
+        else:
+            word_data.pop("frequency_rank", None)
+        leveled[names[level_list[position]]].append(word_data)
+
+    moved: Dict[str, int] = {}
+    for name, count in zip(names, np.bincount(levels[levels != current],
+                                              minlength=len(names)).tolist()):
+        if count:
+            moved[name] = count
+    return {name: words for name, words in leveled.items() if words or name in LEVELS}, moved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Level vocabulary by word frequency")
+    parser.add_argument("frequency_table")
+    parser.add_argument("--vocabulary-file", default="data/vocabulary.json")
+    parser.add_argument("--thresholds", default=",".join(map(str, DEFAULT_THRESHOLDS)),
+                        help="rank cut-offs between levels, e.g. 2000,8000")
+    parser.add_argument("--dry-run", action="store_true", help="report without saving")
+    args = parser.parse_args(argv)
+
+    thresholds = [int(value) for value in args.thresholds.split(",")]
+    if len(thresholds) != len(LEVELS) - 1 or thresholds != sorted(thresholds):
+        parser.error(f"--thresholds needs {len(LEVELS) - 1} increasing ranks")
+
+    from .vocabulary_manager import VocabularyManager
+
+    bad_lines: List[int] = []
+    table = load_frequency_table(args.frequency_table, bad_lines)
+    if bad_lines:
+        shown = ", ".join(map(str, bad_lines[:10]))
+        print(f"⚠️  Skipped {len(bad_lines)} malformed lines (line {shown}"
+              f"{', ...' if len(bad_lines) > 10 else ''})")
+    vocabulary_manager = VocabularyManager(args.vocabulary_file)
+    leveled, moved = level_vocabulary(vocabulary_manager.vocabulary, table, thresholds)
+
+    ranked = sum(1 for words in leveled.values() for w in words if "frequency_rank" in w)
+    total = sum(len(words) for words in leveled.values())
+    print(f"📊 Ranked {ranked}/{total} words against {len(table)} table entries")
+    for level, words in leveled.items():
+        print(f"   {level:<14}{len(words):>9} words ({moved.get(level, 0)} moved in)")
+
+    if args.dry_run:
+        return
+    vocabulary_manager.vocabulary = leveled
+    vocabulary_manager._save_vocabulary()
+    print(f"✅ Saved {args.vocabulary_file}")
+
+
+if __name__ == "__main__":
+    main()
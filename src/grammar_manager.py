@@ -4,13 +4,59 @@ Grammar Management System for Inglês Autodidata
 
 import json
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional
+from .content_loader import BackgroundLoader
+from .normalization import normalize_answer, option_keys
+from .near_duplicates import NearDuplicateIndex
+from . import metrics
 
 class GrammarManager:
-    def __init__(self, data_file: str = "data/grammar.json"):
+    def __init__(self, data_file: str = "data/grammar.json", background: bool = False):
         self.data_file = data_file
-        self.grammar_exercises = self._load_exercises()
+        self._loader: Optional[BackgroundLoader] = None
+        if background and os.path.exists(data_file):
+            # Stream the file on a thread; topics fill in as exercises are decoded
+            self._loader = BackgroundLoader(data_file).start()
+            self._grammar_exercises = self._loader.groups
+        else:
+            self._grammar_exercises = self._load_exercises()
+        # Question -> {normalized option: option}, computed once per exercise
+        self._option_keys: Dict[str, Dict[str, str]] = {}
+        # Content pack name -> its exercises, merged after the main file's
+        self._packs: Dict[str, Dict] = {}
+        self._near_duplicate_index: Optional[NearDuplicateIndex] = None
+        # Question -> exercise, built on the first lookup
+        self._by_question: Optional[Dict[str, Dict]] = None
     
+    @property
+    def grammar_exercises(self) -> Dict:
+        """All topics, waiting for a background load to finish first"""
+        if self._loader is not None:
+            self._loader.wait()
+            if self._loader.error is not None:
+                self._grammar_exercises = self._create_default_exercises()
+            self._loader = None
+            for pack in self._packs.values():
+                self._merge_pack(pack)
+        return self._grammar_exercises
+    
+    @grammar_exercises.setter
+    def grammar_exercises(self, grammar_exercises: Dict):
+        self._loader = None
+        self._grammar_exercises = grammar_exercises
+        self._by_question = None
+    
+    @property
+    def near_duplicate_index(self) -> NearDuplicateIndex:
+        """MinHash index over questions, built the first time an exercise is added"""
+        if self._near_duplicate_index is None:
+            self._near_duplicate_index = NearDuplicateIndex()
+            self._near_duplicate_index.build(
+                (exercise, exercise["question"])
+                for exercises in self.grammar_exercises.values() for exercise in exercises)
+        return self._near_duplicate_index
+    
+    @metrics.timed("grammar.load")
     def _load_exercises(self) -> Dict:
         """Load grammar exercises from JSON file"""
         if os.path.exists(self.data_file):
@@ -156,8 +202,14 @@ class GrammarManager:
             ]
         }
     
-    def get_exercises_by_topic(self, topic: str) -> List[Dict]:
-        """Get grammar exercises by topic"""
+    @metrics.timed("grammar.by_topic")
+    def get_exercises_by_topic(self, topic: str, minimum: int = None) -> List[Dict]:
+        """Get grammar exercises by topic, or the first `minimum` of them while still loading"""
+        if minimum is not None and self._loader is not None and topic != "mixed":
+            self._loader.wait_for(topic, minimum)
+            if self._loader.error is None:
+                return list(self._loader.groups.get(topic, []))
+        
         if topic == "mixed":
             # Return exercises from all topics for mixed practice
             all_exercises = []
@@ -179,9 +231,28 @@ class GrammarManager:
             all_exercises.extend(exercises)
         return all_exercises
     
+    def get_exercise(self, question: str) -> Optional[Dict]:
+        """The exercise with this question, if it is in the bank"""
+        if self._by_question is None:
+            self._by_question = {exercise["question"]: exercise
+                                 for exercises in self.grammar_exercises.values()
+                                 for exercise in exercises}
+        return self._by_question.get(question)
+    
+    def match_option(self, exercise: Dict, answer: str) -> Optional[str]:
+        """The option a typed answer refers to, ignoring case, accents and punctuation"""
+        answer = answer.strip()
+        if answer in exercise["options"]:
+            return answer
+        keys = self._option_keys.get(exercise["question"])
+        if keys is None:
+            keys = self._option_keys[exercise["question"]] = option_keys(exercise["options"])
+        return keys.get(normalize_answer(answer))
+    
     def add_exercise(self, topic: str, question: str, options: List[str], 
-                    correct: str, explanation: str = ""):
-        """Add a new grammar exercise"""
+                    correct: str, explanation: str = "") -> List[Dict]:
+        """Add a new grammar exercise; returns existing exercises with near-identical questions"""
+        near_duplicates = self.near_duplicate_index  # built before the new exercise joins the bank
         if topic not in self.grammar_exercises:
             self.grammar_exercises[topic] = []
         
@@ -193,13 +264,69 @@ class GrammarManager:
         }
         
         self.grammar_exercises[topic].append(exercise)
+        if self._by_question is not None:
+            self._by_question[question] = exercise
+        duplicates = [entry for entry, _ in near_duplicates.add(exercise, question)]
         self._save_exercises()
+        return duplicates
+    
+    def add_pack(self, name: str, grammar_exercises: Dict):
+        """Merge a content pack's exercises, once the main file has finished loading"""
+        self._packs[name] = grammar_exercises
+        if self._loader is None:
+            self._merge_pack(grammar_exercises)
+    
+    def _merge_pack(self, grammar_exercises: Dict):
+        for topic, exercises in grammar_exercises.items():
+            self._grammar_exercises.setdefault(topic, []).extend(exercises)
+            self._forget_option_keys(exercises)
+            if self._by_question is not None:
+                for exercise in exercises:
+                    self._by_question[exercise["question"]] = exercise
+            if self._near_duplicate_index is not None:
+                for exercise in exercises:
+                    self._near_duplicate_index.add(exercise, exercise["question"])
+    
+    def remove_pack(self, name: str):
+        """Take a content pack's exercises back out"""
+        pack = self._packs.pop(name, None)
+        if pack is None or self._loader is not None:
+            return  # never merged
+        for topic, pack_exercises in pack.items():
+            self._forget_option_keys(pack_exercises)
+            pack_ids = {id(exercise) for exercise in pack_exercises}
+            exercises = [exercise for exercise in self._grammar_exercises.get(topic, [])
+                         if id(exercise) not in pack_ids]
+            if exercises:
+                self._grammar_exercises[topic][:] = exercises
+            else:
+                self._grammar_exercises.pop(topic, None)
+        self._near_duplicate_index = self._by_question = None  # rebuilt on next use
+    
+    def _forget_option_keys(self, exercises: List[Dict]):
+        """Drop memoized option keys for questions whose options may have changed"""
+        for exercise in exercises:
+            self._option_keys.pop(exercise.get("question"), None)
+    
+    def _own_exercises(self) -> Dict:
+        """The exercises without content pack ones, as stored in the main file"""
+        if not self._packs:
+            return self.grammar_exercises
+        pack_ids = {id(exercise) for pack in self._packs.values()
+                    for exercises in pack.values() for exercise in exercises}
+        own = {}
+        for topic, exercises in self.grammar_exercises.items():
+            kept = [exercise for exercise in exercises if id(exercise) not in pack_ids]
+            if kept or len(kept) == len(exercises):
+                own[topic] = kept
+        return own
     
+    @metrics.timed("grammar.save")
     def _save_exercises(self):
         """Save exercises to JSON file"""
         os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
         with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(self.grammar_exercises, f, indent=2, ensure_ascii=False)
+            json.dump(self._own_exercises(), f, indent=2, ensure_ascii=False)
     
     def get_topics(self) -> List[str]:
         """Get all available grammar topics"""
@@ -0,0 +1,251 @@
+"""
+Item Difficulty Calibration for Inglês Autodidata
+
+Fits a Rasch (one-parameter IRT) model to every recorded answer: each
+learner gets an ability θ and each vocabulary word or grammar exercise a
+difficulty b, with P(correct) = 1 / (1 + exp(-(θ - b))). The fit runs
+alternating Newton steps over all responses at once with NumPy, so each
+iteration is a handful of vectorized passes over flat response arrays
+and millions of answers calibrate in seconds.
+
+The calibrated difficulty is written back onto the items as
+"irt_difficulty" (in logits; higher is harder) alongside "irt_responses".
+
+Requires NumPy. Usage:
+    python -m src.irt_calibration [--dry-run] [--min-responses 20]
+"""
+
+import argparse
+import time
+from array import array
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from .user_manager import UserManager
+from .answer_history import AnswerHistory
+from . import metrics
+
+CALIBRATED_TYPES = ("vocabulary", "grammar")
+MAX_ITERATIONS = 100
+TOLERANCE = 1e-4
+# Ridge penalty keeps all-correct or all-wrong learners and items finite
+REGULARIZATION = 0.05
+MAX_STEP = 1.0
+
+ItemKey = Tuple[str, str]
+
+
+class ResponseMatrix:
+    """Answers as parallel flat arrays of (learner index, item index, correct)"""
+
+    __slots__ = ("learners", "items", "learner_ids", "item_ids", "correct")
+
+    def __init__(self, learners: List[str], items: List[ItemKey],
+                 learner_ids: np.ndarray, item_ids: np.ndarray, correct: np.ndarray):
+        self.learners = learners
+        self.items = items
+        self.learner_ids = learner_ids
+        self.item_ids = item_ids
+        self.correct = correct
+
+    def __len__(self) -> int:
+        return len(self.correct)
+
+
+class Calibration:
+    """The result of a Rasch fit"""
+
+    __slots__ = ("responses", "ability", "difficulty", "iterations", "converged",
+                 "log_likelihood")
+
+    def __init__(self, responses: ResponseMatrix, ability: np.ndarray, difficulty: np.ndarray,
+                 iterations: int, converged: bool, log_likelihood: float):
+        self.responses = responses
+        self.ability = ability
+        self.difficulty = difficulty
+        self.iterations = iterations
+        self.converged = converged
+        self.log_likelihood = log_likelihood
+
+    def item_difficulties(self) -> Dict[ItemKey, float]:
+        """Map each item to its calibrated difficulty"""
+        return dict(zip(self.responses.items, self.difficulty.tolist()))
+
+    def learner_abilities(self) -> Dict[str, float]:
+        """Map each learner to their estimated ability"""
+        return dict(zip(self.responses.learners, self.ability.tolist()))
+
+    def item_counts(self) -> np.ndarray:
+        """How many responses each item has"""
+        return np.bincount(self.responses.item_ids, minlength=len(self.responses.items))
+
+
+def iter_responses(user_manager: UserManager,
+                   history: AnswerHistory) -> Iterator[Tuple[str, ItemKey, bool]]:
+    """Stream every calibratable answer as (email, (type, item), correct)"""
+    for email in list(user_manager.users):
+        for event in history.iter_events(email):
+            kind = event.get("type")
+            if kind in CALIBRATED_TYPES and "item" in event:
+                yield email, (kind, event["item"]), bool(event.get("correct"))
+
+
+@metrics.timed("irt.collect")
+def collect_responses(responses: Iterator[Tuple[str, ItemKey, bool]]) -> ResponseMatrix:
+    """Index learners and items and pack answers into compact typed arrays"""
+    learner_index: Dict[str, int] = {}
+    item_index: Dict[ItemKey, int] = {}
+    learner_ids = array('i')
+    item_ids = array('i')
+    correct = array('b')
+
+    for email, item, is_correct in responses:
+        learner_ids.append(learner_index.setdefault(email, len(learner_index)))
+        item_ids.append(item_index.setdefault(item, len(item_index)))
+        correct.append(is_correct)
+
+    return ResponseMatrix(
+        list(learner_index), list(item_index),
+        np.frombuffer(learner_ids, dtype=np.intc).astype(np.intp),
+        np.frombuffer(item_ids, dtype=np.intc).astype(np.intp),
+        np.frombuffer(correct, dtype=np.int8).astype(np.float64)
+    )
+
+
+def _log_likelihood(logits: np.ndarray, correct: np.ndarray) -> float:
+    """Bernoulli log-likelihood of the answers under the given logits"""
+    return float(np.sum(correct * logits - np.logaddexp(0.0, logits)))
+
+
+@metrics.timed("irt.fit")
+def fit_rasch(responses: ResponseMatrix, max_iterations: int = MAX_ITERATIONS,
+              tolerance: float = TOLERANCE,
+              regularization: float = REGULARIZATION) -> Calibration:
+    """Fit learner abilities and item difficulties by alternating Newton steps"""
+    n_learners, n_items = len(responses.learners), len(responses.items)
+    learner_ids, item_ids, y = responses.learner_ids, responses.item_ids, responses.correct
+
+    ability = np.zeros(n_learners)
+    difficulty = np.zeros(n_items)
+    if len(responses) == 0:
+        return Calibration(responses, ability, difficulty, 0, True, 0.0)
+
+    iterations = 0
+    converged = False
+    for iterations in range(1, max_iterations + 1):
+        # Ability step: gradient and curvature summed per learner
+        p = 1.0 / (1.0 + np.exp(difficulty[item_ids] - ability[learner_ids]))
+        information = p * (1.0 - p)
+        gradient = np.bincount(learner_ids, weights=y - p, minlength=n_learners)
+        gradient -= regularization * ability
+        curvature = np.bincount(learner_ids, weights=information, minlength=n_learners)
+        curvature += regularization
+        ability_step = np.clip(gradient / curvature, -MAX_STEP, MAX_STEP)
+        ability += ability_step
+
+        # Difficulty step with the refreshed abilities
+        p = 1.0 / (1.0 + np.exp(difficulty[item_ids] - ability[learner_ids]))
+        information = p * (1.0 - p)
+        gradient = np.bincount(item_ids, weights=p - y, minlength=n_items)
+        gradient -= regularization * difficulty
+        curvature = np.bincount(item_ids, weights=information, minlength=n_items)
+        curvature += regularization
+        difficulty_step = np.clip(gradient / curvature, -MAX_STEP, MAX_STEP)
+        difficulty += difficulty_step
+
+        # The model only identifies θ - b, so anchor the mean item at zero
+        shift = difficulty.mean()
+        difficulty -= shift
+        ability -= shift
+
+        # Converged once the anchored parameters stop moving; the raw steps can
+        # settle at a constant that the shift cancels every iteration
+        change = max(np.abs(ability_step - shift).max(), np.abs(difficulty_step - shift).max())
+        if change < tolerance:
+            converged = True
+            break
+
+    logits = ability[learner_ids] - difficulty[item_ids]
+    return Calibration(responses, ability, difficulty, iterations, converged,
+                       _log_likelihood(logits, y))
+
+
+def apply_difficulties(calibration: Calibration, vocabulary_manager, grammar_manager,
+                       min_responses: int = 1) -> int:
+    """Write calibrated difficulties onto vocabulary words and grammar exercises"""
+    counts = calibration.item_counts()
+    calibrated = {
+        item: (round(float(b), 3), int(n))
+        for item, b, n in zip(calibration.responses.items, calibration.difficulty, counts)
+        if n >= min_responses
+    }
+
+    updated = 0
+    for level in vocabulary_manager.vocabulary.values():
+        for word_data in level:
+            fitted = calibrated.get(("vocabulary", word_data["word"]))
+            if fitted:
+                word_data["irt_difficulty"], word_data["irt_responses"] = fitted
+                updated += 1
+
+    for exercises in grammar_manager.grammar_exercises.values():
+        for exercise in exercises:
+            fitted = calibrated.get(("grammar", exercise["question"]))
+            if fitted:
+                exercise["irt_difficulty"], exercise["irt_responses"] = fitted
+                updated += 1
+
+    return updated
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calibrate item difficulty from recorded answers")
+    parser.add_argument("--users-file", default="data/users.json")
+    parser.add_argument("--history-dir", default="data/history")
+    parser.add_argument("--vocabulary-file", default="data/vocabulary.json")
+    parser.add_argument("--grammar-file", default="data/grammar.json")
+    parser.add_argument("--min-responses", type=int, default=20,
+                        help="only write difficulties for items with at least this many answers")
+    parser.add_argument("--iterations", type=int, default=MAX_ITERATIONS)
+    parser.add_argument("--dry-run", action="store_true", help="fit and report without saving")
+    args = parser.parse_args(argv)
+
+    from .vocabulary_manager import VocabularyManager
+    from .grammar_manager import GrammarManager
+
+    started = time.perf_counter()
+    responses = collect_responses(iter_responses(
+        UserManager(args.users_file, autosave=False), AnswerHistory(args.history_dir)))
+    loaded = time.perf_counter()
+    print(f"📥 Loaded {len(responses)} answers from {len(responses.learners)} learners "
+          f"on {len(responses.items)} items in {loaded - started:.2f}s")
+
+    calibration = fit_rasch(responses, args.iterations)
+    elapsed = time.perf_counter() - loaded
+    if calibration.converged:
+        print(f"📐 Fit converged after {calibration.iterations} iterations in {elapsed:.2f}s "
+              f"(log-likelihood {calibration.log_likelihood:.1f})")
+    else:
+        print(f"⚠️  Fit did not converge within {calibration.iterations} iterations "
+              f"({elapsed:.2f}s, log-likelihood {calibration.log_likelihood:.1f}); "
+              f"try a larger --iterations")
+
+    hardest = sorted(calibration.item_difficulties().items(), key=lambda kv: -kv[1])[:5]
+    for (kind, item), b in hardest:
+        print(f"   {b:+.2f}  {kind:<10} {item}")
+
+    if args.dry_run:
+        return
+
+    vocabulary_manager = VocabularyManager(args.vocabulary_file)
+    grammar_manager = GrammarManager(args.grammar_file)
+    updated = apply_difficulties(calibration, vocabulary_manager, grammar_manager,
+                                 args.min_responses)
+    vocabulary_manager._save_vocabulary()
+    grammar_manager._save_exercises()
+    print(f"✅ Wrote calibrated difficulty onto {updated} items")
+
+
+if __name__ == "__main__":
+    main()
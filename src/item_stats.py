@@ -0,0 +1,272 @@
+"""
+Cross-Learner Item Difficulty for Inglês Autodidata
+
+Every finished (or recovered) session adds its graded answers to a tally
+per item: total attempts and errors, plus an error rate whose weights
+halve every week so the ranking follows recent learners. Items are
+numbered once and their numbers index parallel `array` buffers.
+
+Decay scales an item's weighted errors and its weight by the same factor,
+so its rate only changes when it is answered. Once an item has
+MIN_ATTEMPTS answers, each answer pushes its new rate onto a per-kind
+heap, and the "hardest items" query pops the top k, dropping superseded
+entries, in O(k log n) instead of re-scoring every item. Nothing reads
+user profiles.
+
+Snapshots are kept in data/item_stats.json and shared by every process:
+a save takes a lock, reloads the file and replays only the answers this
+process counted since its last save, so concurrent writers add up
+instead of overwriting each other. To rebuild from every learner's
+answer history:
+    python -m src.item_stats --rebuild
+"""
+
+import argparse
+import heapq
+import json
+import os
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+from . import metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves are not serialized between processes
+    fcntl = None
+
+HALF_LIFE_SECONDS = 7 * 24 * 3600
+# Every item starts as if it had a few answers at a typical error rate
+PRIOR_WEIGHT = 3.0
+PRIOR_ERROR_RATE = 0.2
+MIN_ATTEMPTS = 5
+
+
+class ItemStats:
+    def __init__(self, data_file: str = "data/item_stats.json", autosave: bool = True):
+        self.data_file = data_file
+        self.autosave = autosave
+        self.dirty = False
+        self.slots: Dict[Tuple[str, str], int] = {}
+        self.keys: List[Tuple[str, str]] = []
+        self.attempts = array('I')
+        self.errors = array('I')
+        self.weight = array('d')
+        self.weighted_errors = array('d')
+        self.updated = array('d')
+        # Bumped on every answer; heap entries carrying an older version are stale
+        self.versions = array('I')
+        # Only items with MIN_ATTEMPTS answers are ranked
+        self.heaps: Dict[str, List[Tuple[float, int, int]]] = {}
+        self.ranked_counts: Dict[str, int] = {}
+        # (kind, item, correct, ts) counted here but not saved yet
+        self.pending: List[Tuple[str, str, bool, float]] = []
+        self._load()
+
+    def _slot(self, kind: str, item: str, ts: float) -> int:
+        """Number an item the first time it is answered"""
+        key = (kind, item)
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self.slots[key] = len(self.keys)
+            self.keys.append(key)
+            self.attempts.append(0)
+            self.errors.append(0)
+            self.weight.append(PRIOR_WEIGHT)
+            self.weighted_errors.append(PRIOR_WEIGHT * PRIOR_ERROR_RATE)
+            self.updated.append(ts)
+            self.versions.append(0)
+        return slot
+
+    def error_rate(self, slot: int) -> float:
+        return self.weighted_errors[slot] / self.weight[slot]
+
+    def observe(self, kind: str, item: str, correct: bool, ts: Optional[float] = None):
+        """Count one graded answer"""
+        ts = time.time() if ts is None else ts
+        self.pending.append((kind, item, correct, ts))
+        self._apply(kind, item, correct, ts)
+
+    def _apply(self, kind: str, item: str, correct: bool, ts: float):
+        slot = self._slot(kind, item, ts)
+        age = ts - self.updated[slot]
+        if age >= 0:
+            decay = 0.5 ** (age / HALF_LIFE_SECONDS)
+            self.weight[slot] *= decay
+            self.weighted_errors[slot] *= decay
+            self.updated[slot] = ts
+            contribution = 1.0
+        else:
+            # An older answer arriving late (e.g. during a rebuild) counts as already decayed
+            contribution = 0.5 ** (-age / HALF_LIFE_SECONDS)
+        self.attempts[slot] += 1
+        self.weight[slot] += contribution
+        if not correct:
+            self.errors[slot] += 1
+            self.weighted_errors[slot] += contribution
+
+        self.versions[slot] += 1
+        if self.attempts[slot] < MIN_ATTEMPTS:
+            return
+        if self.attempts[slot] == MIN_ATTEMPTS:
+            self.ranked_counts[kind] = self.ranked_counts.get(kind, 0) + 1
+        heap = self.heaps.setdefault(kind, [])
+        heapq.heappush(heap, (-self.error_rate(slot), slot, self.versions[slot]))
+        if len(heap) > 2 * self.ranked_counts[kind] + 64:
+            self._rebuild_heap(kind)
+
+    def _rebuild_heap(self, kind: str):
+        """Drop stale entries once they outnumber the live ones"""
+        heap = [(-self.error_rate(slot), slot, self.versions[slot])
+                for (item_kind, _), slot in self.slots.items()
+                if item_kind == kind and self.attempts[slot] >= MIN_ATTEMPTS]
+        heapq.heapify(heap)
+        self.heaps[kind] = heap
+        self.ranked_counts[kind] = len(heap)
+
+    def _row(self, slot: int) -> Dict:
+        kind, item = self.keys[slot]
+        return {
+            "kind": kind,
+            "item": item,
+            "attempts": self.attempts[slot],
+            "errors": self.errors[slot],
+            "error_rate": round(self.error_rate(slot), 3)
+        }
+
+    @metrics.timed("item_stats.hardest")
+    def hardest(self, kind: str, limit: int = 10) -> List[Dict]:
+        """The items of a kind with the highest recent error rate, once answered MIN_ATTEMPTS times"""
+        heap = self.heaps.get(kind, [])
+        taken = []
+        while heap and len(taken) < limit:
+            entry = heapq.heappop(heap)
+            _, slot, version = entry
+            if version == self.versions[slot]:  # else superseded by a later answer
+                taken.append(entry)
+        for entry in taken:
+            heapq.heappush(heap, entry)
+        return [self._row(slot) for _, slot, _ in taken]
+
+    def _load(self):
+        """Load the last snapshot, if there is one"""
+        if not os.path.exists(self.data_file):
+            return
+        try:
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                items = json.load(f).get("items", [])
+        except (json.JSONDecodeError, IOError):
+            return
+        for kind, item, attempts, errors, weight, weighted_errors, updated in items:
+            slot = self._slot(kind, item, updated)
+            self.attempts[slot] = attempts
+            self.errors[slot] = errors
+            self.weight[slot] = weight
+            self.weighted_errors[slot] = weighted_errors
+        for kind in {kind for kind, _ in self.keys}:
+            self._rebuild_heap(kind)
+
+    def _write(self):
+        """Write a snapshot atomically"""
+        items = [[kind, item, self.attempts[slot], self.errors[slot], self.weight[slot],
+                  self.weighted_errors[slot], self.updated[slot]]
+                 for slot, (kind, item) in enumerate(self.keys)]
+        temp_path = self.data_file + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"items": items}, ensure_ascii=False, separators=(",", ":")))
+        os.replace(temp_path, self.data_file)
+
+    def take_pending(self) -> List[Tuple[str, str, bool, float]]:
+        """Hand over the answers counted since the last save"""
+        pending, self.pending = self.pending, []
+        self.dirty = False
+        return pending
+
+    def restore_pending(self, pending: List[Tuple[str, str, bool, float]]):
+        """Put back answers whose save failed, ahead of any counted since"""
+        self.pending[:0] = pending
+        self.dirty = True
+
+    def write_merged(self, pending: List[Tuple[str, str, bool, float]]) -> "ItemStats":
+        """Replay answers onto the snapshot on disk and save it; touches nothing in self"""
+        directory = os.path.dirname(self.data_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.data_file + ".lock", 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)  # released when the file closes
+            merged = ItemStats(self.data_file, autosave=self.autosave)
+            for answer in pending:
+                merged._apply(*answer)
+            merged._write()
+        return merged
+
+    def adopt(self, merged: "ItemStats"):
+        """Take over a merged snapshot, keeping answers counted while it was written"""
+        for name in ("slots", "keys", "attempts", "errors", "weight", "weighted_errors",
+                     "updated", "versions", "heaps", "ranked_counts"):
+            setattr(self, name, getattr(merged, name))
+        for answer in self.pending:
+            self._apply(*answer)
+
+    @metrics.timed("item_stats.save")
+    def save(self):
+        """Merge this process's new answers into the shared snapshot"""
+        pending = self.take_pending()
+        try:
+            merged = self.write_merged(pending)
+        except Exception:
+            self.restore_pending(pending)
+            raise
+        self.adopt(merged)
+
+    def commit(self):
+        """Save now, or leave it for flush() when autosave is off"""
+        if self.autosave:
+            self.save()
+        else:
+            self.dirty = True
+
+    def flush(self):
+        """Write pending changes to disk"""
+        if self.dirty:
+            self.save()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show or rebuild cross-learner item error rates")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="recount from every learner's answer history")
+    parser.add_argument("--kind", default=None, help="vocabulary, grammar or conversation")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--stats-file", default="data/item_stats.json")
+    parser.add_argument("--users-file", default="data/users.json")
+    parser.add_argument("--history-dir", default="data/history")
+    args = parser.parse_args(argv)
+
+    if args.rebuild:
+        from .user_manager import UserManager
+        from .answer_history import AnswerHistory
+
+        if os.path.exists(args.stats_file):
+            os.remove(args.stats_file)
+        stats = ItemStats(args.stats_file)
+        history = AnswerHistory(args.history_dir)
+        answers = 0
+        for email in UserManager(args.users_file, autosave=False).users:
+            for event in history.iter_events(email):
+                stats.observe(event["type"], event["item"], event["correct"], event.get("ts"))
+                answers += 1
+        stats.save()
+        print(f"✅ Counted {answers} answers over {len(stats.keys)} items")
+    else:
+        stats = ItemStats(args.stats_file)
+
+    for kind in [args.kind] if args.kind else sorted(stats.heaps):
+        print(f"\n🧩 Hardest {kind} items:")
+        for row in stats.hardest(kind, args.limit):
+            print(f"   {row['error_rate']:>6.1%}  {row['errors']:>6}/{row['attempts']:<6} {row['item']}")
+
+
+if __name__ == "__main__":
+    main()
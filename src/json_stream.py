@@ -0,0 +1,141 @@
+"""
+Streaming JSON Reading for Inglês Autodidata
+
+Content files share one shape: a top-level object whose values are lists
+of items ({"beginner": [word, ...]}, {"verbs": [exercise, ...]}, ...).
+`iter_grouped_items` walks that shape incrementally, decoding one item at
+a time from a fixed-size read buffer, so a pack of any size can be
+processed without holding the whole document in memory.
+`iter_grouped_spans` also returns each item's source text, and
+`iter_object_items` walks a flat {key: value} object such as users.json.
+"""
+
+import json
+from typing import Iterator, Tuple
+
+READ_SIZE = 1 << 16
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+_decoder = json.JSONDecoder()
+
+
+class _Buffer:
+    """A sliding window over a text file"""
+
+    def __init__(self, f, read_size: int):
+        self.f = f
+        self.read_size = read_size
+        self.text = ""
+        self.pos = 0
+        self.start = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read more text, discarding what has been consumed; False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.read_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """The next non-whitespace character, or "" at end of file"""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str):
+        """Consume a structural character"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def decode(self):
+        """Decode the next complete JSON value, reading more text as needed"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number cut at the buffer edge ("12" of "123", "-0" of "-0.5e3") decodes
+            # fine, so read on while nothing but number characters follow it
+            if (isinstance(value, (int, float)) and not self.text[end:].strip(_NUMBER_CHARS)
+                    and self.fill()):
+                continue
+            self.start, self.pos = self.pos, end
+            return value
+
+    def last_text(self) -> str:
+        """The source text of the value just decoded"""
+        return self.text[self.start:self.pos]
+
+
+def iter_grouped_items(path: str, read_size: int = READ_SIZE) -> Iterator[Tuple[str, int, object]]:
+    """Yield (group, index, item) for every item of a {group: [items]} JSON file"""
+    for group, index, item, _ in iter_grouped_spans(path, read_size):
+        yield group, index, item
+
+
+def iter_object_items(path: str, read_size: int = READ_SIZE) -> Iterator[Tuple[str, object]]:
+    """Yield (key, value) for every member of a top-level JSON object, one value at a time"""
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = _Buffer(f, read_size)
+        buffer.expect("{")
+        if buffer.peek() == "}":
+            return
+
+        while True:
+            key = buffer.decode()
+            if not isinstance(key, str):
+                raise ValueError("Expected a key")
+            buffer.expect(":")
+            yield key, buffer.decode()
+            if buffer.peek() == "}":
+                return
+            buffer.expect(",")
+
+
+def iter_grouped_spans(path: str,
+                       read_size: int = READ_SIZE) -> Iterator[Tuple[str, int, object, str]]:
+    """Yield (group, index, item, item source text) for a {group: [items]} JSON file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = _Buffer(f, read_size)
+        buffer.expect("{")
+        if buffer.peek() == "}":
+            return
+
+        while True:
+            group = buffer.decode()
+            if not isinstance(group, str):
+                raise ValueError("Expected a group name")
+            buffer.expect(":")
+            buffer.expect("[")
+
+            index = 0
+            if buffer.peek() == "]":
+                buffer.pos += 1
+            else:
+                while True:
+                    item = buffer.decode()
+                    yield group, index, item, buffer.last_text()
+                    index += 1
+                    if buffer.peek() == "]":
+                        buffer.pos += 1
+                        break
+                    buffer.expect(",")
+
+            if buffer.peek() == "}":
+                return
+            buffer.expect(",")
@@ -0,0 +1,93 @@
+"""
+Response-Time Histograms for Inglês Autodidata
+
+How long a learner takes to answer is kept as fixed-bucket histograms, one
+per session category and topic, under user["latency"][category][topic].
+Every histogram shares the same bucket bounds, so merging topics or
+learners is an element-wise sum of counts and the profile grows by a
+short list per topic, not by one number per answer. Percentiles are read
+back by walking the cumulative counts and interpolating inside the bucket.
+Once a learner has enough answers, their own pace also decides when a
+correct answer counts as hesitant in adaptive selection.
+"""
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional
+
+# Upper bounds of each bucket in milliseconds; a final bucket holds anything slower
+BUCKET_BOUNDS_MS = (500, 1000, 1500, 2000, 3000, 4000, 5000, 7000,
+                    10000, 15000, 20000, 30000, 60000)
+DEFAULT_TOPIC = "general"
+# Answers needed before a learner's own pace replaces the fixed hesitation cut-off
+MIN_PACE_SAMPLES = 30
+HESITATION_PERCENTILE = 0.8
+
+
+class LatencyHistogram:
+    __slots__ = ("counts",)
+
+    def __init__(self, counts: Optional[List[int]] = None):
+        self.counts = list(counts) if counts else [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def record(self, latency_ms: int):
+        self.counts[bisect_left(BUCKET_BOUNDS_MS, latency_ms)] += 1
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add another histogram's counts into this one"""
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        return self
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+
+    def percentile(self, q: float) -> Optional[int]:
+        """Estimated latency in ms below which a fraction `q` of answers fall"""
+        total = self.total
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if i == len(BUCKET_BOUNDS_MS):
+                    return BUCKET_BOUNDS_MS[-1]  # open-ended: report the last bound
+                lower = BUCKET_BOUNDS_MS[i - 1] if i else 0
+                return round(lower + (BUCKET_BOUNDS_MS[i] - lower) * (rank - seen) / count)
+            seen += count
+        return BUCKET_BOUNDS_MS[-1]
+
+
+def record_latencies(profile: Dict, category: str, topic: Optional[str],
+                     latencies_ms: Iterable[int]):
+    """Add a session's answer times to the profile's histogram for its topic"""
+    topics = profile.setdefault("latency", {}).setdefault(category, {})
+    histogram = LatencyHistogram(topics.get(topic or DEFAULT_TOPIC))
+    for latency_ms in latencies_ms:
+        histogram.record(latency_ms)
+    topics[topic or DEFAULT_TOPIC] = histogram.counts
+
+
+def category_histograms(profile: Dict, category: str) -> Dict[str, LatencyHistogram]:
+    """A category's histograms by topic"""
+    return {topic: LatencyHistogram(counts)
+            for topic, counts in profile.get("latency", {}).get(category, {}).items()}
+
+
+def hesitation_ms(profile: Dict, category: str, default: int) -> int:
+    """How slow a correct answer has to be to count as hesitant for this learner"""
+    histogram = merged_histogram(profile, category)
+    if histogram.total < MIN_PACE_SAMPLES:
+        return default
+    return max(histogram.percentile(HESITATION_PERCENTILE), BUCKET_BOUNDS_MS[0])
+
+
+def merged_histogram(profile: Dict, category: Optional[str] = None) -> LatencyHistogram:
+    """One histogram over every topic of a category, or over everything"""
+    categories = [category] if category else list(profile.get("latency", {}))
+    merged = LatencyHistogram()
+    for name in categories:
+        for histogram in category_histograms(profile, name).values():
+            merged.merge(histogram)
+    return merged
@@ -4,83 +4,341 @@ Learning Session Management for Inglês Autodidata
 
 import time
 import random
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional
 from .utils import (
-    clear_screen, print_separator, get_user_input, 
-    print_colored_text, animate_text, format_score, shuffle_list
+    clear_screen, screen_frame, print_separator, get_user_input, 
+    print_colored_text, print_below, animate_text, format_score, shuffle_list, pause_for_user
 )
-from .vocabulary_manager import VocabularyManager
-from .grammar_manager import GrammarManager
-from .conversation_manager import ConversationManager
+from .dialog_engine import END, DialogCompileError
+from .answer_history import AnswerHistory
+from .adaptive_engine import AdaptiveEngine, SLOW_ANSWER_MS
+from .latency_histogram import hesitation_ms
+from .session_plans import SessionPlans
+from .session_journal import SessionJournal
+from .content_packs import ContentPacks
+from .item_stats import ItemStats
+from .normalization import normalize_answer
+from .startup import trace
+from . import metrics
+
+VOCABULARY_SESSION_SIZE = 10
+GRAMMAR_SESSION_SIZE = 8
+# While content streams in, start once this many sessions' worth of items is loaded
+STARTUP_POOL_FACTOR = 5
+ADAPTIVE = "adaptive"
+REVIEW = "review"
 
 class LearningSession:
-    def __init__(self, user: Dict, user_manager):
+    def __init__(self, user: Dict, user_manager, vocabulary_manager=None,
+                 grammar_manager=None, conversation_manager=None,
+                 answer_history: AnswerHistory = None, session_plans: SessionPlans = None,
+                 journal: SessionJournal = None, content_packs: ContentPacks = None,
+                 item_stats: ItemStats = None):
         self.user = user
         self.user_manager = user_manager
-        self.vocabulary_manager = VocabularyManager()
-        self.grammar_manager = GrammarManager()
-        self.conversation_manager = ConversationManager()
-        
-    def start_vocabulary_session(self, difficulty: str):
-        """Start a vocabulary learning session"""
+        self.answer_history = answer_history or AnswerHistory()
+        self.session_plans = session_plans or SessionPlans()
+        self.journal = journal or SessionJournal()
+        self.content_packs = content_packs or ContentPacks()
+        self.session_answers: List[Dict] = []
+        # Content managers are imported and loaded on first use
+        self._vocabulary_manager = vocabulary_manager
+        self._grammar_manager = grammar_manager
+        self._conversation_manager = conversation_manager
+        self._item_stats = item_stats
+        self._vocabulary_engine: Optional[AdaptiveEngine] = None
+    
+    @property
+    def vocabulary_manager(self):
+        """Vocabulary content, loaded the first time it is needed"""
+        if self._vocabulary_manager is None:
+            with trace.phase("load vocabulary"):
+                from .vocabulary_manager import VocabularyManager
+                self._vocabulary_manager = VocabularyManager(background=True)
+                self.content_packs.sync({"vocabulary": self._vocabulary_manager})
+            with trace.phase("build distractor index"):
+                # Built here so the first multiple-choice question doesn't wait for it
+                self._vocabulary_manager.build_distractor_index()
+        return self._vocabulary_manager
+    
+    @property
+    def grammar_manager(self):
+        """Grammar content, loaded the first time it is needed"""
+        if self._grammar_manager is None:
+            with trace.phase("load grammar"):
+                from .grammar_manager import GrammarManager
+                self._grammar_manager = GrammarManager(background=True)
+                self.content_packs.sync({"grammar": self._grammar_manager})
+        return self._grammar_manager
+    
+    @property
+    def conversation_manager(self):
+        """Conversation content, loaded the first time it is needed"""
+        if self._conversation_manager is None:
+            with trace.phase("load conversations"):
+                from .conversation_manager import ConversationManager
+                self._conversation_manager = ConversationManager()
+        return self._conversation_manager
+    
+    @property
+    def item_stats(self) -> ItemStats:
+        """Error rates of every item across learners, loaded the first time they are needed"""
+        if self._item_stats is None:
+            self._item_stats = ItemStats()
+        return self._item_stats
+    
+    def sync_content_packs(self):
+        """Apply pack changes to the content that has been loaded so far"""
+        managers = {}
+        if self._vocabulary_manager is not None:
+            managers["vocabulary"] = self._vocabulary_manager
+        if self._grammar_manager is not None:
+            managers["grammar"] = self._grammar_manager
+        return self.content_packs.sync(managers)
+    
+    @property
+    def vocabulary_engine(self) -> AdaptiveEngine:
+        """Adaptive selection over the whole vocabulary, rebuilt when the words change"""
+        bank = self.vocabulary_manager.adaptive_bank
+        if self._vocabulary_engine is None or self._vocabulary_engine.bank is not bank:
+            self._vocabulary_engine = AdaptiveEngine(
+                self.user, "vocabulary", bank, self.user["level"],
+                slow_answer_ms=hesitation_ms(self.user, "vocabulary", SLOW_ANSWER_MS))
+        return self._vocabulary_engine
+    
+    def planned_items(self, kind: str, label: str) -> Optional[List[Dict]]:
+        """Take the next precomputed session of this kind and label, if there is one"""
+        keys = self.session_plans.take(self.user["email"], kind, label)
+        if not keys:
+            return None
+        
+        lookup = (self.vocabulary_manager.get_word if kind == "vocabulary"
+                  else self.grammar_manager.get_exercise)
+        # Items removed since the plan was made are dropped; so are old [group, index] refs
+        items = [lookup(key) for key in keys if isinstance(key, str)]
+        return [item for item in items if item is not None] or None
+    
+    def select_vocabulary_words(self, difficulty: str) -> List[Dict]:
+        """Pick the words for a vocabulary session; adaptive ones come from adaptive_words()"""
+        planned = self.planned_items("vocabulary", difficulty)
+        if planned:
+            return planned
+        if difficulty == REVIEW:
+            return self.select_review_words(VOCABULARY_SESSION_SIZE)
+        words = self.vocabulary_manager.get_words_by_difficulty(
+            difficulty, minimum=VOCABULARY_SESSION_SIZE * STARTUP_POOL_FACTOR)
+        return shuffle_list(words)[:VOCABULARY_SESSION_SIZE]
+    
+    def select_review_words(self, count: int) -> List[Dict]:
+        """Pick the practised words the learner is most likely to have forgotten"""
+        from .forgetting_model import ForgettingModel
+        model = ForgettingModel.load()
+        forgotten = model.most_forgotten(self.answer_history.iter_events(self.user["email"]), count)
+        words = [self.vocabulary_manager.get_word(word) for word, _ in forgotten]
+        return [word_data for word_data in words if word_data is not None]
+    
+    def adaptive_words(self, count: int = VOCABULARY_SESSION_SIZE) -> Iterator[Dict]:
+        """Yield up to `count` words, choosing each one after the previous answer"""
+        engine = self.vocabulary_engine
+        engine.start_session()
+        for _ in range(count):
+            word_data = engine.next_item()
+            if word_data is None:
+                return
+            yield word_data
+    
+    def select_grammar_exercises(self, topic: str) -> List[Dict]:
+        """Pick the exercises for a grammar session"""
+        planned = self.planned_items("grammar", topic)
+        if planned:
+            return planned
+        exercises = self.grammar_manager.get_exercises_by_topic(
+            topic, minimum=GRAMMAR_SESSION_SIZE * STARTUP_POOL_FACTOR)
+        return shuffle_list(exercises)[:GRAMMAR_SESSION_SIZE]
+    
+    def record_answer(self, kind: str, item: str, answer: str, correct: bool,
+                      latency_ms: Optional[int] = None):
+        """Remember a graded answer until the session is finished, journaling it right away"""
+        event = {
+            "ts": round(time.time(), 3),
+            "type": kind,
+            "item": item,
+            "answer": answer,
+            "correct": correct
+        }
+        if latency_ms is not None:
+            event["latency_ms"] = latency_ms
+        self.session_answers.append(event)
+        self.journal.write(self.user["email"], kind, event)
+        metrics.increment("answers.correct" if correct else "answers.incorrect")
+    
+    def check_vocabulary_answer(self, word_data: Dict, answer: str,
+                                latency_ms: Optional[int] = None) -> bool:
+        """Check a vocabulary answer against the expected word"""
+        correct = normalize_answer(answer) == self.vocabulary_manager.answer_key(word_data["word"])
+        self._record_vocabulary(word_data["word"], answer, correct, latency_ms)
+        return correct
+    
+    def check_cloze_answer(self, cloze: Dict, answer: str,
+                           latency_ms: Optional[int] = None) -> bool:
+        """Check a fill-in-the-blank answer against the form used in the sentence"""
+        correct = normalize_answer(answer) == self.vocabulary_manager.answer_key(cloze["answer"])
+        self._record_vocabulary(cloze["word"], answer, correct, latency_ms)
+        return correct
+    
+    def _record_vocabulary(self, word: str, answer: str, correct: bool,
+                           latency_ms: Optional[int]):
+        """Record a vocabulary answer and feed it to the adaptive engine"""
+        self.record_answer("vocabulary", word, answer, correct, latency_ms)
+        if self._vocabulary_engine is not None:
+            self._vocabulary_engine.record(word, correct, latency_ms)
+    
+    def check_grammar_answer(self, exercise: Dict, answer: str,
+                             latency_ms: Optional[int] = None) -> bool:
+        """Check a grammar answer against the correct option"""
+        correct = self.grammar_manager.match_option(exercise, answer) == exercise["correct"]
+        self.record_answer("grammar", exercise["question"], answer, correct, latency_ms)
+        return correct
+    
+    @metrics.timed("session.finish")
+    def finish_session(self, category: str, correct: int, total: int,
+                       session_time: int, new_words: int = 0, topic: Optional[str] = None):
+        """Record a finished session in the user's stats"""
+        session_stats = {
+            "correct": correct,
+            "total": total,
+            "time_seconds": session_time,
+            "new_words": new_words,
+            "category": category,
+            "topic": topic,
+            "latencies_ms": [event["latency_ms"] for event in self.session_answers
+                             if event.get("latency_ms") is not None]
+        }
+        self.user_manager.update_user_stats(self.user, session_stats)
+        self.answer_history.append(self.user["email"], self.session_answers)
+        # Counted here rather than per answer so recovered sessions are counted too
+        for event in self.session_answers:
+            self.item_stats.observe(event["type"], event["item"], event["correct"], event["ts"])
+        self.session_answers = []
+        self.item_stats.commit()
+        self.journal.close(self.user["email"])
+    
+    def recover_interrupted_session(self) -> Optional[Dict]:
+        """Fold the journaled answers of a session that never finished into the profile"""
+        recovered = self.journal.read(self.user["email"])
+        if recovered is None:
+            return None
+        header, events = recovered
+        if not events:
+            self.journal.close(self.user["email"])
+            return None
+        
+        category = header["category"]
+        correct = sum(1 for event in events if event.get("correct"))
+        session_time = max(0, int(events[-1]["ts"] - header["started"]))
+        # Vocabulary sessions count every correct answer as a word learned
+        new_words = correct if category == "vocabulary" else 0
+        self.session_answers = events + self.session_answers
+        self.finish_session(category, correct, len(events), session_time, new_words)
+        return {"category": category, "correct": correct, "total": len(events)}
+        
+    @metrics.timed("session.vocabulary")
+    def start_vocabulary_session(self, difficulty: str, mode: str = "typing"):
+        """Start a vocabulary learning session ("typing", "choice" or "cloze" mode)"""
         clear_screen()
         print(f"📖 VOCABULARY PRACTICE - {difficulty.upper()}")
         print_separator()
         
-        # Get vocabulary words for the session
-        words = self.vocabulary_manager.get_words_by_difficulty(difficulty)
-        if not words:
-            print_colored_text("❌ No vocabulary available for this difficulty level.", "red")
+        # Adaptive sessions choose each word after the previous answer;
+        # otherwise take a shuffled selection up front
+        if difficulty == ADAPTIVE:
+            total_questions = min(VOCABULARY_SESSION_SIZE, len(self.vocabulary_engine.items))
+            session_words = self.adaptive_words(total_questions)
+        else:
+            session_words = self.select_vocabulary_words(difficulty)
+            total_questions = len(session_words)
+        if not total_questions:
+            if difficulty == REVIEW:
+                print_colored_text("❌ Nothing to review yet. Practise some words first!", "red")
+            else:
+                print_colored_text("❌ No vocabulary available for this difficulty level.", "red")
             return
         
-        # Shuffle and limit to session size
-        session_words = shuffle_list(words)[:10]  # 10 words per session
-        
-        print(f"📚 Starting vocabulary session with {len(session_words)} words...")
-        print("You'll be shown definitions and need to guess the word!")
-        input("\\nPress Enter to start...")
+        print(f"📚 Starting vocabulary session with {total_questions} words...")
+        if mode == "choice":
+            print("You'll be shown definitions and need to pick the matching word!")
+        elif mode == "cloze":
+            print("You'll fill in the missing word in example sentences!")
+        else:
+            print("You'll be shown definitions and need to guess the word!")
+        pause_for_user("Press Enter to start...")
         
         # Session tracking
         correct_answers = 0
-        total_questions = len(session_words)
         session_start = time.time()
         new_words_learned = 0
         
         for i, word_data in enumerate(session_words, 1):
-            clear_screen()
-            
-            # Show progress
-            print(f"📖 VOCABULARY PRACTICE - Question {i}/{total_questions}")
-            print_separator()
-            
             word = word_data["word"]
             definition = word_data["definition"]
             examples = word_data.get("examples", [])
+            options = []
+            cloze = None
+            if mode == "choice":
+                options = self.vocabulary_manager.get_multiple_choice_question(word_data)["options"]
+            elif mode == "cloze":
+                # Words without a usable example fall back to the definition
+                cloze = self.vocabulary_manager.get_cloze_question(word_data)
             
-            # Show definition
-            print("🎯 DEFINITION:")
-            print(f"   {definition}")
-            
-            if examples:
-                print("\\n📝 EXAMPLE:")
-                print(f"   {random.choice(examples)}")
-            
-            print(f"\\n💭 What word matches this definition?")
+            with screen_frame():
+                # Show progress
+                print(f"📖 VOCABULARY PRACTICE - Question {i}/{total_questions}")
+                print_separator()
+                
+                if cloze:
+                    print("✍️  FILL IN THE BLANK:")
+                    print(f"   {cloze['sentence']}")
+                    print(f"\\n💡 HINT: {definition}")
+                else:
+                    # Show definition
+                    print("🎯 DEFINITION:")
+                    print(f"   {definition}")
+                    
+                    if examples:
+                        print("\\n📝 EXAMPLE:")
+                        print(f"   {random.choice(examples)}")
+                    
+                    print(f"\\n💭 What word matches this definition?")
+                for j, option in enumerate(options, 1):
+                    print(f"   {j}. {option}")
             
             # Get user answer
-            user_answer = get_user_input("Your answer").lower().strip()
+            asked_at = time.perf_counter_ns()
+            if mode == "choice":
+                user_choice = get_user_input(f"Choose option (1-{len(options)})", 
+                                           [str(j) for j in range(1, len(options) + 1)])
+                user_answer = options[int(user_choice) - 1]
+            else:
+                user_answer = get_user_input("Your answer")
+            latency_ms = (time.perf_counter_ns() - asked_at) // 1_000_000
             
             # Check answer
-            if user_answer == word.lower():
+            if cloze:
+                correct = self.check_cloze_answer(cloze, user_answer, latency_ms)
+            else:
+                correct = self.check_vocabulary_answer(word_data, user_answer, latency_ms)
+            
+            if correct:
                 print_colored_text("✅ Correct! Well done!", "green")
                 correct_answers += 1
                 new_words_learned += 1
             else:
-                print_colored_text(f"❌ Incorrect. The answer was: {word}", "red")
-                print(f"💡 Remember: {word} - {definition}")
+                expected = cloze["answer"] if cloze else word
+                print_colored_text(f"❌ Incorrect. The answer was: {expected}", "red")
+                print_below(f"💡 Remember: {word} - {definition}")
             
             if i < total_questions:
-                input("\\nPress Enter for next question...")
+                pause_for_user("Press Enter for next question...")
         
         # Session summary
         session_end = time.time()
@@ -96,33 +354,27 @@ class LearningSession:
         )
         
         # Update user stats
-        session_stats = {
-            "correct": correct_answers,
-            "total": total_questions,
-            "time_minutes": session_time // 60,
-            "new_words": new_words_learned,
-            "category": "vocabulary"
-        }
-        self.user_manager.update_user_stats(self.user, session_stats)
+        self.finish_session("vocabulary", correct_answers, total_questions,
+                            session_time, new_words_learned, difficulty)
     
-    def start_grammar_session(self, topic: str):
-        """Start a grammar practice session"""
+    @metrics.timed("session.grammar")
+    def start_grammar_session(self, topic: str, time_limit: Optional[int] = None):
+        """Start a grammar practice session, optionally with seconds per question"""
         clear_screen()
         print(f"📝 GRAMMAR PRACTICE - {topic.upper()}")
         print_separator()
         
-        # Get grammar exercises
-        exercises = self.grammar_manager.get_exercises_by_topic(topic)
-        if not exercises:
+        # Get a shuffled selection of grammar exercises
+        session_exercises = self.select_grammar_exercises(topic)
+        if not session_exercises:
             print_colored_text("❌ No grammar exercises available for this topic.", "red")
             return
         
-        # Shuffle and limit to session size
-        session_exercises = shuffle_list(exercises)[:8]  # 8 exercises per session
-        
         print(f"📝 Starting grammar session: {topic}")
         print("You'll complete sentences or choose the correct grammar!")
-        input("\\nPress Enter to start...")
+        if time_limit:
+            print(f"⏱️  Timed mode: {time_limit} seconds per question!")
+        pause_for_user("Press Enter to start...")
         
         # Session tracking
         correct_answers = 0
@@ -130,44 +382,49 @@ class LearningSession:
         session_start = time.time()
         
         for i, exercise in enumerate(session_exercises, 1):
-            clear_screen()
-            
-            # Show progress
-            print(f"📝 GRAMMAR PRACTICE - Question {i}/{total_questions}")
-            print_separator()
-            
             question = exercise["question"]
             options = exercise["options"]
             correct_answer = exercise["correct"]
             explanation = exercise.get("explanation", "")
             
-            # Show question
-            print("🎯 QUESTION:")
-            print(f"   {question}")
-            print()
-            
-            # Show options
-            print("📋 OPTIONS:")
-            for j, option in enumerate(options, 1):
-                print(f"   {j}. {option}")
+            with screen_frame():
+                # Show progress
+                print(f"📝 GRAMMAR PRACTICE - Question {i}/{total_questions}")
+                print_separator()
+                
+                # Show question
+                print("🎯 QUESTION:")
+                print(f"   {question}")
+                print()
+                
+                # Show options
+                print("📋 OPTIONS:")
+                for j, option in enumerate(options, 1):
+                    print(f"   {j}. {option}")
             
             # Get user answer
+            asked_at = time.perf_counter_ns()
             user_choice = get_user_input(f"Choose option (1-{len(options)})", 
-                                       [str(i) for i in range(1, len(options) + 1)])
-            user_answer = options[int(user_choice) - 1]
+                                       [str(i) for i in range(1, len(options) + 1)],
+                                       timeout=time_limit)
+            user_answer = options[int(user_choice) - 1] if user_choice else None
+            latency_ms = (time.perf_counter_ns() - asked_at) // 1_000_000
             
             # Check answer
-            if user_answer == correct_answer:
+            if user_answer is None:
+                self.record_answer("grammar", question, "", False, latency_ms)
+                print_colored_text(f"⏰ Time's up! The correct answer was: {correct_answer}", "yellow")
+            elif self.check_grammar_answer(exercise, user_answer, latency_ms):
                 print_colored_text("✅ Correct! Great job!", "green")
                 correct_answers += 1
             else:
                 print_colored_text(f"❌ Incorrect. The correct answer was: {correct_answer}", "red")
             
             if explanation:
-                print(f"💡 Explanation: {explanation}")
+                print_below(f"💡 Explanation: {explanation}")
             
             if i < total_questions:
-                input("\\nPress Enter for next question...")
+                pause_for_user("Press Enter for next question...")
         
         # Session summary
         session_end = time.time()
@@ -183,15 +440,10 @@ class LearningSession:
         )
         
         # Update user stats
-        session_stats = {
-            "correct": correct_answers,
-            "total": total_questions,
-            "time_minutes": session_time // 60,
-            "new_words": 0,
-            "category": "grammar"
-        }
-        self.user_manager.update_user_stats(self.user, session_stats)
+        self.finish_session("grammar", correct_answers, total_questions, session_time,
+                            topic=topic)
     
+    @metrics.timed("session.conversation")
     def start_conversation_session(self, scenario: str):
         """Start a conversation practice session"""
         clear_screen()
@@ -204,62 +456,78 @@ class LearningSession:
             print_colored_text("❌ No conversations available for this scenario.", "red")
             return
         
-        # Select a conversation
+        # Select a conversation and fetch its compiled dialog graph
         conversation = random.choice(conversations)
+        try:
+            dialog = self.conversation_manager.get_compiled_dialog(conversation)
+        except DialogCompileError as e:
+            print_colored_text("❌ This scenario is unavailable right now: its dialog is malformed.", "red")
+            print(f"   {e}")
+            return
         
-        print(f"💬 Scenario: {conversation['title']}")
-        print(f"📍 Setting: {conversation['setting']}")
+        print(f"💬 Scenario: {dialog.title}")
+        print(f"📍 Setting: {dialog.setting}")
         print("\\nYou'll practice responding in different conversation situations!")
-        input("\\nPress Enter to start...")
+        pause_for_user("Press Enter to start...")
         
         # Session tracking
         correct_answers = 0
-        total_questions = len(conversation["interactions"])
+        total_questions = 0
         session_start = time.time()
+        node = dialog.start
         
-        for i, interaction in enumerate(conversation["interactions"], 1):
-            clear_screen()
+        while node != END:
+            options = dialog.get_responses(node)
             
-            # Show progress
-            print(f"💬 CONVERSATION PRACTICE - Part {i}/{total_questions}")
-            print_separator()
+            with screen_frame():
+                # Show progress
+                print(f"💬 CONVERSATION PRACTICE - Part {total_questions + 1}")
+                print_separator()
+                
+                # Show conversation context
+                print("🎭 SITUATION:")
+                print(f"   {dialog.situations[node]}")
+                print()
+                print(f"🗣️  {dialog.speakers[node]}:")
+                print(f"   \\\"{dialog.prompts[node]}\\\"")
+                print()
+                
+                # Show response options
+                if options:
+                    print("💭 HOW DO YOU RESPOND?")
+                for j, option in enumerate(options, 1):
+                    print(f"   {j}. \\\"{option}\\\"")
             
-            situation = interaction["situation"]
-            speaker = interaction["speaker"]
-            options = interaction["responses"]
-            correct_response = interaction["correct"]
-            
-            # Show conversation context
-            print("🎭 SITUATION:")
-            print(f"   {situation}")
-            print()
-            print(f"🗣️  {speaker}:")
-            print(f"   \\\"{interaction['prompt']}\\\"")
-            print()
-            
-            # Show response options
-            print("💭 HOW DO YOU RESPOND?")
-            for j, option in enumerate(options, 1):
-                print(f"   {j}. \\\"{option}\\\"")
+            if dialog.is_end(node):
+                # Leave the closing line on screen until the summary replaces it
+                pause_for_user("Press Enter to see your results...")
+                break
             
             # Get user choice
+            asked_at = time.perf_counter_ns()
             user_choice = get_user_input(f"Choose response (1-{len(options)})", 
                                        [str(i) for i in range(1, len(options) + 1)])
-            user_response = options[int(user_choice) - 1]
+            latency_ms = (time.perf_counter_ns() - asked_at) // 1_000_000
+            next_node, score, feedback = dialog.choose(node, int(user_choice) - 1)
+            total_questions += 1
+            self.record_answer("conversation", f"{dialog.title}#{dialog.node_ids[node]}",
+                               options[int(user_choice) - 1], score > 0, latency_ms)
             
             # Check answer
-            if user_response == correct_response:
+            if score > 0:
                 print_colored_text("✅ Excellent response! Very natural!", "green")
                 correct_answers += 1
             else:
                 print_colored_text(f"❌ Good try! A better response would be:", "yellow")
-                print(f"   \\\"{correct_response}\\\"")
+                print_below(f"   \\\"{dialog.best_response(node)}\\\"")
+                if feedback:
+                    print_below(f"   {feedback}")
             
-            if interaction.get("explanation"):
-                print(f"\\n💡 {interaction['explanation']}")
+            if dialog.explanations[node]:
+                print_below(f"\\n💡 {dialog.explanations[node]}")
             
-            if i < total_questions:
-                input("\\nPress Enter to continue...")
+            node = next_node
+            pause_for_user()
         
         # Session summary
         session_end = time.time()
@@ -275,14 +543,8 @@ class LearningSession:
         )
         
         # Update user stats
-        session_stats = {
-            "correct": correct_answers,
-            "total": total_questions,
-            "time_minutes": session_time // 60,
-            "new_words": 0,
-            "category": "conversation"
-        }
-        self.user_manager.update_user_stats(self.user, session_stats)
+        self.finish_session("conversation", correct_answers, total_questions, session_time,
+                            topic=scenario)
     
     def _show_session_summary(self, session_type: str, correct: int, total: int, 
                              time_seconds: int, new_words: int, topic: str):
@@ -0,0 +1,78 @@
+"""
+Line Input for Inglês Autodidata
+
+Every prompt, timed or not, reads stdin through one buffer over the raw
+file descriptor. Lines typed ahead of a prompt wait in that buffer for
+the next one, whichever reader asks, instead of being split between
+Python's buffered stdin and direct descriptor reads. End of input is
+reported as EOFError.
+"""
+
+import codecs
+import os
+import sys
+from typing import Optional
+
+
+class LineInput:
+    def __init__(self, stdin=None):
+        self.stdin = stdin or sys.stdin
+        self.pending = ""
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def fileno(self) -> Optional[int]:
+        """The stdin file descriptor, if there is one"""
+        try:
+            return self.stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    def read_available(self) -> Optional[str]:
+        """Read what stdin has ready, blocking until something arrives; None at EOF"""
+        fd = self.fileno()
+        if fd is None:
+            return self.stdin.readline() or None
+        data = os.read(fd, 4096)
+        if not data:
+            return None
+        return self._decoder.decode(data)
+
+    def take_line(self) -> Optional[str]:
+        """Remove a complete line from the buffer, if one was typed ahead"""
+        if "\n" not in self.pending:
+            return None
+        line, self.pending = self.pending.split("\n", 1)
+        return line.rstrip("\r")
+
+    def read_line(self, prompt: str = "") -> str:
+        """Block until a whole line is typed; raises EOFError once stdin is closed"""
+        if prompt:
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+        while True:
+            line = self.take_line()
+            if line is not None:
+                return line
+            chunk = self.read_available()
+            if chunk is None:
+                if not self.pending:
+                    raise EOFError
+                line, self.pending = self.pending, ""
+                return line
+            self.pending += chunk
+
+
+_input: Optional[LineInput] = None
+
+
+def get_line_input() -> LineInput:
+    """Get the shared reader bound to the process stdin"""
+    global _input
+    if _input is None or _input.stdin is not sys.stdin:
+        _input = LineInput()
+    return _input
+
+
+def read_line(prompt: str = "") -> str:
+    """Read one line from the shared reader"""
+    return get_line_input().read_line(prompt)
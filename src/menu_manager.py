@@ -4,21 +4,31 @@ Menu Management System for Inglês Autodidata
 
 from typing import Dict
 from .utils import (
-    clear_screen, print_separator, get_user_input, 
+    clear_screen, print_separator, get_user_input, get_yes_no_input,
     print_colored_text, pause_for_user, get_difficulty_emoji
 )
-from .learning_session import LearningSession
-from .vocabulary_manager import VocabularyManager
+from .startup import trace
+
+TIMED_QUESTION_SECONDS = 15
 
 class MenuManager:
     def __init__(self, user: Dict, user_manager):
         self.user = user
         self.user_manager = user_manager
-        self.learning_session = LearningSession(user, user_manager)
-        self.vocabulary_manager = VocabularyManager()
+        self._learning_session = None
+    
+    @property
+    def learning_session(self):
+        """Import and create the learning session the first time a module is opened"""
+        if self._learning_session is None:
+            with trace.phase("import learning_session"):
+                from .learning_session import LearningSession
+            self._learning_session = LearningSession(self.user, self.user_manager)
+        return self._learning_session
         
     def run(self):
         """Main menu loop"""
+        self.recover_interrupted_session()
         while True:
             self.show_main_menu()
             choice = self.get_menu_choice()
@@ -43,6 +53,18 @@ class MenuManager:
                 print_colored_text("❌ Invalid option. Please try again.", "red")
                 pause_for_user()
     
+    def recover_interrupted_session(self):
+        """Keep the answers of a session the app closed in the middle of"""
+        from .session_journal import SessionJournal
+        if not SessionJournal().exists(self.user["email"]):
+            return
+        recovered = self.learning_session.recover_interrupted_session()
+        if recovered:
+            print_colored_text(
+                f"♻️  Saved {recovered['correct']}/{recovered['total']} answers from your "
+                f"unfinished {recovered['category']} session.", "green")
+            pause_for_user()
+    
     def show_main_menu(self):
         """Display the main menu"""
         clear_screen()
@@ -74,6 +96,7 @@ class MenuManager:
         print("8. 🚪 Exit")
         
         print_separator()
+        trace.mark_once("first menu rendered")
     
     def get_menu_choice(self) -> str:
         """Get user's menu choice"""
@@ -92,20 +115,30 @@ class MenuManager:
         print("2. 🟡 Intermediate (Common words)")
         print("3. 🔴 Advanced (Complex words)")
         print("4. 🎯 Adaptive (Based on your level)")
+        print("5. 🔁 Review (Words you're starting to forget)")
         
-        difficulty_choice = get_user_input("Select difficulty (1-4)", ["1", "2", "3", "4"])
+        difficulty_choice = get_user_input("Select difficulty (1-5)", ["1", "2", "3", "4", "5"])
         
         difficulty_map = {
             "1": "beginner",
             "2": "intermediate", 
             "3": "advanced",
-            "4": self.user["level"]  # Use user's current level
+            "4": "adaptive",  # Chosen question by question from your results
+            "5": "review"
         }
         
         difficulty = difficulty_map[difficulty_choice]
         
+        print("\nChoose answer mode:")
+        print("1. ⌨️  Type the word")
+        print("2. 🔘 Multiple choice")
+        print("3. ✍️  Fill in the blank")
+        
+        mode_choice = get_user_input("Select mode (1-3)", ["1", "2", "3"])
+        mode = {"1": "typing", "2": "choice", "3": "cloze"}[mode_choice]
+        
         # Start session
-        self.learning_session.start_vocabulary_session(difficulty)
+        self.learning_session.start_vocabulary_session(difficulty, mode)
         pause_for_user()
     
     def start_grammar_practice(self):
@@ -133,8 +166,12 @@ class MenuManager:
         
         topic = topic_map[topic_choice]
         
+        time_limit = None
+        if get_yes_no_input(f"⏱️  Timed mode ({TIMED_QUESTION_SECONDS}s per question)?"):
+            time_limit = TIMED_QUESTION_SECONDS
+        
         # Start session
-        self.learning_session.start_grammar_session(topic)
+        self.learning_session.start_grammar_session(topic, time_limit)
         pause_for_user()
     
     def start_conversation_practice(self):
@@ -199,9 +236,48 @@ class MenuManager:
                     emoji = get_difficulty_emoji(level)
                     print(f"     {emoji} {level.title()}: {points} points")
             print()
+            
+            self.show_response_times(self.user_manager.users[email])
         
+        self.show_hardest_items()
         pause_for_user()
     
+    def show_response_times(self, profile: Dict):
+        """Print answer-time percentiles per category and topic"""
+        from .latency_histogram import category_histograms, merged_histogram
+        if not profile.get("latency"):
+            return
+        
+        print("⚡ RESPONSE TIMES (median / 90th percentile):")
+        for category in profile["latency"]:
+            overall = merged_histogram(profile, category)
+            if not overall.total:
+                continue
+            print(f"   {category.title()}: {overall.percentile(0.5) / 1000:.1f}s / "
+                  f"{overall.percentile(0.9) / 1000:.1f}s ({overall.total} answers)")
+            for topic, histogram in sorted(category_histograms(profile, category).items()):
+                if histogram.total:
+                    print(f"     {get_difficulty_emoji(topic)} {topic.title()}: "
+                          f"{histogram.percentile(0.5) / 1000:.1f}s / "
+                          f"{histogram.percentile(0.9) / 1000:.1f}s")
+        print()
+    
+    def show_hardest_items(self, limit: int = 5):
+        """Print the words and exercises learners get wrong most often"""
+        item_stats = self.learning_session.item_stats
+        sections = [(kind, item_stats.hardest(kind, limit)) for kind in ("vocabulary", "grammar")]
+        if not any(rows for _, rows in sections):
+            return
+        
+        print("🧩 WHAT LEARNERS MISS MOST:")
+        for kind, rows in sections:
+            if not rows:
+                continue
+            print(f"   {kind.title()}:")
+            for row in rows:
+                print(f"     ❌ {row['error_rate']:.0%} wrong - {row['item']}")
+        print()
+    
     def show_profile(self):
         """Show user profile information"""
         clear_screen()
@@ -300,9 +376,10 @@ class MenuManager:
         print("1. Reset Progress")
         print("2. Export Data")
         print("3. Delete Account")
-        print("4. Back to Main Menu")
+        print("4. Content Packs")
+        print("5. Back to Main Menu")
         
-        choice = get_user_input("Choose option (1-4)", ["1", "2", "3", "4"])
+        choice = get_user_input("Choose option (1-5)", ["1", "2", "3", "4", "5"])
         
         if choice == "1":
             from .utils import get_yes_no_input
@@ -315,22 +392,79 @@ class MenuManager:
                     "correct_answers": 0,
                     "total_answers": 0,
                     "study_time_minutes": 0,
+                    "study_time_seconds": 0,
                     "streak_days": 0,
                     "last_study_date": None
                 }
                 self.user_manager._save_users()
                 print_colored_text("✅ Progress reset successfully!", "green")
                 
+        elif choice == "2":
+            self.export_data()
+        
+        elif choice == "4":
+            self.manage_content_packs()
+            
         elif choice == "3":
             from .utils import get_yes_no_input
             if get_yes_no_input("⚠️  Are you sure you want to delete your account?"):
                 if get_yes_no_input("⚠️  This action cannot be undone. Continue?"):
                     self.user_manager.delete_user(self.user["email"])
+                    from .answer_history import AnswerHistory
+                    AnswerHistory().delete(self.user["email"])
+                    from .session_journal import SessionJournal
+                    SessionJournal().close(self.user["email"])
                     print_colored_text("✅ Account deleted. Goodbye!", "green")
                     exit()
         
         pause_for_user()
     
+    def export_data(self):
+        """Export the user's profile, stats, progress and answer history"""
+        from .data_export import export_filename, export_user
+        
+        print("\n📤 Export format:")
+        print("1. JSON Lines (one record per line)")
+        print("2. CSV (spreadsheet)")
+        fmt = "jsonl" if get_user_input("Choose format (1-2)", ["1", "2"]) == "1" else "csv"
+        compress = get_yes_no_input("Compress with gzip?")
+        
+        path = export_filename(self.user["email"], fmt, compress)
+        try:
+            count = export_user(self.user, path, fmt, compress)
+        except OSError as e:
+            print_colored_text(f"❌ Export failed: {e}", "red")
+            return
+        print_colored_text(f"✅ Exported {count} records to {path}", "green")
+    
+    def manage_content_packs(self):
+        """List installed content packs and switch them on or off"""
+        content_packs = self.learning_session.content_packs
+        names = content_packs.discover()
+        if not names:
+            print(f"\n📦 No content packs installed. Add them under {content_packs.pack_dir}/.")
+            return
+        
+        disabled = set(content_packs.disabled())
+        print("\n📦 CONTENT PACKS:")
+        for i, name in enumerate(names, 1):
+            status = "⬜ off" if name in disabled else "✅ on"
+            print(f"   {i}. {name} ({status})")
+        
+        choice = get_user_input(f"Toggle a pack (1-{len(names)}, or 0 to go back)",
+                                [str(i) for i in range(len(names) + 1)])
+        if choice == "0":
+            return
+        name = names[int(choice) - 1]
+        content_packs.set_enabled(name, name in disabled)
+        self.learning_session.sync_content_packs()
+        state = "enabled" if name in disabled else "disabled"
+        print_colored_text(f"✅ {name} {state}.", "green")
+        for path in content_packs.failed:
+            print_colored_text(f"❌ Could not read {path}", "red")
+        for message in content_packs.skipped:
+            print_colored_text(f"⚠️  Skipped invalid item in {message}", "yellow")
+    
     def show_help(self):
         """Show help information"""
         clear_screen()
@@ -0,0 +1,150 @@
+"""
+Lightweight Instrumentation for Inglês Autodidata
+
+Timers and counters for the load/save paths, searches, screen drawing and
+session steps. Everything is off by default; a disabled timer costs a
+single attribute check per call. Enable with `metrics.enable()` (the
+`--profile` flag does this) and read the numbers back as a summary table
+or in Prometheus text format.
+"""
+
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, List
+
+
+class _Timer:
+    __slots__ = ("count", "total_ns", "max_ns")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, elapsed_ns: int):
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.enabled = False
+        self.timers: Dict[str, _Timer] = {}
+        self.counters: Dict[str, int] = {}
+
+    def record_time(self, name: str, elapsed_ns: int):
+        """Add one timing sample"""
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = _Timer()
+        timer.record(elapsed_ns)
+
+    def increment(self, name: str, amount: int = 1):
+        """Bump a counter"""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def reset(self):
+        """Forget every recorded sample"""
+        self.timers.clear()
+        self.counters.clear()
+
+    def summary(self) -> str:
+        """Format the recorded timers and counters as a table"""
+        lines = [f"{'timer':<36}{'calls':>8}{'total ms':>12}{'avg ms':>10}{'max ms':>10}"]
+        for name, timer in sorted(self.timers.items(), key=lambda item: -item[1].total_ns):
+            lines.append(
+                f"{name:<36}{timer.count:>8}{timer.total_ns / 1e6:>12.2f}"
+                f"{timer.total_ns / timer.count / 1e6:>10.3f}{timer.max_ns / 1e6:>10.3f}")
+        if self.counters:
+            lines.append("")
+            lines.append(f"{'counter':<36}{'value':>8}")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"{name:<36}{value:>8}")
+        return "\n".join(lines)
+
+    def prometheus_text(self, prefix: str = "ingles") -> str:
+        """Render the metrics in the Prometheus text exposition format"""
+        lines: List[str] = []
+
+        if self.timers:
+            name = f"{prefix}_operation_seconds"
+            lines.append(f"# HELP {name} Time spent in instrumented operations.")
+            lines.append(f"# TYPE {name} summary")
+            for op, timer in sorted(self.timers.items()):
+                op = _label_value(op)
+                lines.append(f'{name}_count{{op="{op}"}} {timer.count}')
+                lines.append(f'{name}_sum{{op="{op}"}} {timer.total_ns / 1e9:.9f}')
+            max_name = f"{prefix}_operation_max_seconds"
+            lines.append(f"# HELP {max_name} Slowest observed call per operation.")
+            lines.append(f"# TYPE {max_name} gauge")
+            for op, timer in sorted(self.timers.items()):
+                lines.append(f'{max_name}{{op="{_label_value(op)}"}} {timer.max_ns / 1e9:.9f}')
+
+        if self.counters:
+            name = f"{prefix}_events_total"
+            lines.append(f"# HELP {name} Counted application events.")
+            lines.append(f"# TYPE {name} counter")
+            for event, value in sorted(self.counters.items()):
+                lines.append(f'{name}{{event="{_label_value(event)}"}} {value}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _label_value(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+registry = MetricsRegistry()
+
+
+def enable():
+    """Start recording metrics"""
+    registry.enabled = True
+
+
+def disable():
+    """Stop recording metrics"""
+    registry.enabled = False
+
+
+def is_enabled() -> bool:
+    return registry.enabled
+
+
+def increment(name: str, amount: int = 1):
+    """Bump a counter if metrics are enabled"""
+    registry.increment(name, amount)
+
+
+def timed(name: str):
+    """Decorator that times every call to the wrapped function"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                registry.record_time(name, time.perf_counter_ns() - start)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def timer(name: str):
+    """Context manager that times a block"""
+    if not registry.enabled:
+        yield
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        registry.record_time(name, time.perf_counter_ns() - start)
@@ -0,0 +1,222 @@
+"""
+Near-Duplicate Detection for Inglês Autodidata
+
+Imported banks fill up with grammar questions and word definitions that
+differ only in wording. Each text is normalized and cut into character
+shingles, and a MinHash signature estimates how much two shingle sets
+overlap. Locality-sensitive hashing splits the signatures into bands, so
+only texts that share a whole band are ever compared; finding every
+near-duplicate cluster is roughly linear in the bank size rather than
+quadratic. Candidates are confirmed with the exact Jaccard similarity of
+their shingles.
+
+Batch report (NumPy computes the signatures in bulk):
+    python -m src.near_duplicates [--vocabulary-file PATH] [--grammar-file PATH]
+                                  [--threshold 0.6]
+
+The managers keep the same index to check `add_word` and `add_exercise`.
+"""
+
+import argparse
+import random
+import zlib
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Set, Tuple
+from .normalization import normalize_answer
+from . import metrics
+
+SHINGLE_SIZE = 3
+# 20 bands of 3 values: a pair at 0.6 similarity shares a band 99% of the time, at 0.2 only 15%
+BANDS = 20
+ROWS = 3
+NUM_PERM = BANDS * ROWS
+PRIME = (1 << 31) - 1
+DEFAULT_THRESHOLD = 0.6
+# Buckets bigger than this are chained instead of compared pairwise
+MAX_PAIRWISE_BUCKET = 50
+SIGNATURE_BATCH_VALUES = 1 << 22
+
+_rng = random.Random(0x5EED)
+PERMUTATIONS = [(_rng.randrange(1, PRIME), _rng.randrange(PRIME)) for _ in range(NUM_PERM)]
+
+
+def shingles(text: str) -> Set[int]:
+    """Hashed character shingles of a normalized text"""
+    text = normalize_answer(text)
+    if len(text) <= SHINGLE_SIZE:
+        return {zlib.crc32(text.encode()) & PRIME}
+    return {zlib.crc32(text[i:i + SHINGLE_SIZE].encode()) & PRIME
+            for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def signature(shingle_set: Set[int]) -> List[int]:
+    """MinHash signature of one shingle set"""
+    return [min((a * x + b) % PRIME for x in shingle_set) for a, b in PERMUTATIONS]
+
+
+def _batch_signatures(shingle_sets: List[Set[int]]) -> List[List[int]]:
+    """MinHash signatures of many shingle sets at once"""
+    import numpy as np  # only bulk builds need NumPy
+
+    a = np.array([a for a, _ in PERMUTATIONS], dtype=np.int64)[:, None]
+    b = np.array([b for _, b in PERMUTATIONS], dtype=np.int64)[:, None]
+    limit = SIGNATURE_BATCH_VALUES // NUM_PERM
+    signatures: List[List[int]] = []
+    start = 0
+    while start < len(shingle_sets):
+        # Take as many sets as fit in one NUM_PERM x shingles block
+        end, values = start + 1, len(shingle_sets[start])
+        while end < len(shingle_sets) and values + len(shingle_sets[end]) <= limit:
+            values += len(shingle_sets[end])
+            end += 1
+        chunk = shingle_sets[start:end]
+        flat = np.fromiter(chain.from_iterable(chunk), dtype=np.int64, count=values)
+        lengths = np.fromiter(map(len, chunk), dtype=np.int64, count=len(chunk))
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        hashed = (a * flat[None, :] + b) % PRIME
+        signatures.extend(np.minimum.reduceat(hashed, offsets, axis=1).T.tolist())
+        start = end
+    return signatures
+
+
+def jaccard(first: Set[int], second: Set[int]) -> float:
+    return len(first & second) / len(first | second)
+
+
+class NearDuplicateIndex:
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.keys: List[Any] = []
+        self.texts: List[str] = []
+        # One {band values: [doc ids]} table per band
+        self.buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(BANDS)]
+
+    @metrics.timed("dedup.build")
+    def build(self, entries: Iterable[Tuple[Any, str]]):
+        """Index (key, text) pairs, computing signatures in bulk when NumPy is available"""
+        entries = list(entries)
+        shingle_sets = [shingles(text) for _, text in entries]
+        try:
+            signatures = _batch_signatures(shingle_sets)
+        except ImportError:
+            signatures = [signature(shingle_set) for shingle_set in shingle_sets]
+        for (key, text), sig in zip(entries, signatures):
+            self._insert(key, text, sig)
+
+    def _insert(self, key: Any, text: str, sig: List[int]):
+        doc = len(self.keys)
+        self.keys.append(key)
+        self.texts.append(text)
+        for band, table in enumerate(self.buckets):
+            table.setdefault(tuple(sig[band * ROWS:(band + 1) * ROWS]), []).append(doc)
+
+    def _candidates(self, sig: List[int]) -> Set[int]:
+        found: Set[int] = set()
+        for band, table in enumerate(self.buckets):
+            found.update(table.get(tuple(sig[band * ROWS:(band + 1) * ROWS]), ()))
+        return found
+
+    def _matches(self, shingle_set: Set[int], sig: List[int]) -> List[Tuple[Any, float]]:
+        """Confirmed near-duplicates among the LSH candidates, most similar first"""
+        matches = []
+        for doc in self._candidates(sig):
+            similarity = jaccard(shingle_set, shingles(self.texts[doc]))
+            if similarity >= self.threshold:
+                matches.append((self.keys[doc], similarity))
+        matches.sort(key=lambda match: -match[1])
+        return matches
+
+    def find(self, text: str) -> List[Tuple[Any, float]]:
+        """Indexed entries at least `threshold` similar to a text"""
+        shingle_set = shingles(text)
+        return self._matches(shingle_set, signature(shingle_set))
+
+    def add(self, key: Any, text: str) -> List[Tuple[Any, float]]:
+        """Index one new entry; returns the near-duplicates it already had"""
+        shingle_set = shingles(text)
+        sig = signature(shingle_set)
+        matches = self._matches(shingle_set, sig)
+        self._insert(key, text, sig)
+        return matches
+
+    @metrics.timed("dedup.clusters")
+    def clusters(self) -> List[List[Any]]:
+        """Groups of near-duplicate entries, largest first"""
+        parent = list(range(len(self.keys)))
+
+        def root(doc: int) -> int:
+            while parent[doc] != doc:
+                parent[doc] = parent[parent[doc]]
+                doc = parent[doc]
+            return doc
+
+        cache: Dict[int, Set[int]] = {}
+        checked: Set[Tuple[int, int]] = set()
+
+        def shingles_of(doc: int) -> Set[int]:
+            if doc not in cache:
+                cache[doc] = shingles(self.texts[doc])
+            return cache[doc]
+
+        def compare(first: int, second: int):
+            pair = (first, second) if first < second else (second, first)
+            if pair in checked or root(first) == root(second):
+                return
+            checked.add(pair)
+            if jaccard(shingles_of(first), shingles_of(second)) >= self.threshold:
+                parent[root(first)] = root(second)
+
+        for table in self.buckets:
+            for docs in table.values():
+                if len(docs) <= 1:
+                    continue
+                if len(docs) <= MAX_PAIRWISE_BUCKET:
+                    for i, first in enumerate(docs):
+                        for second in docs[i + 1:]:
+                            compare(first, second)
+                else:
+                    for first, second in zip(docs, docs[1:]):
+                        compare(first, second)
+
+        groups: Dict[int, List[Any]] = {}
+        for doc in range(len(self.keys)):
+            groups.setdefault(root(doc), []).append(self.keys[doc])
+        return sorted((group for group in groups.values() if len(group) > 1), key=len, reverse=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report near-duplicate words and exercises")
+    parser.add_argument("--vocabulary-file", default="data/vocabulary.json")
+    parser.add_argument("--grammar-file", default="data/grammar.json")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="minimum shingle similarity, 0-1")
+    parser.add_argument("--max-clusters", type=int, default=50,
+                        help="how many clusters to list per bank (all are counted)")
+    args = parser.parse_args(argv)
+
+    from .vocabulary_manager import VocabularyManager
+    from .grammar_manager import GrammarManager
+
+    banks = {
+        "vocabulary": [((level, word_data["word"]), word_data["definition"])
+                       for level, words in VocabularyManager(args.vocabulary_file).vocabulary.items()
+                       for word_data in words],
+        "grammar": [((topic, exercise["question"]), exercise["question"])
+                    for topic, exercises in GrammarManager(args.grammar_file).grammar_exercises.items()
+                    for exercise in exercises],
+    }
+    for kind, entries in banks.items():
+        index = NearDuplicateIndex(args.threshold)
+        index.build(entries)
+        clusters = index.clusters()
+        duplicates = sum(len(cluster) - 1 for cluster in clusters)
+        print(f"🔁 {kind}: {len(clusters)} clusters, {duplicates} near-duplicates "
+              f"in {len(entries)} entries")
+        for cluster in clusters[:args.max_clusters]:
+            print("   " + "  ~  ".join(f"{label} ({group})" for group, label in cluster))
+        if len(clusters) > args.max_clusters:
+            print(f"   ... and {len(clusters) - args.max_clusters} more")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Answer Normalization for Inglês Autodidata
+
+Typed answers are compared by key rather than by exact text: accents are
+stripped (NFKD), case is folded, curly and backtick apostrophes become
+a plain "'", other punctuation becomes a space and runs of whitespace
+collapse. "Café", "cafe" and " CAFE. " all grade the same, which spares
+learners typing on Portuguese keyboards, while "it's" and "its" stay
+apart. Keys for content are computed once and kept; grading an answer
+normalizes only the learner's input.
+"""
+
+import string
+import unicodedata
+from typing import Dict, Iterable
+
+_APOSTROPHES = "'‘’`´"
+_PUNCTUATION = "".join(c for c in string.punctuation if c not in _APOSTROPHES) + "¿¡«»“”–—…"
+_TRANSLATION = str.maketrans(_PUNCTUATION + _APOSTROPHES,
+                             " " * len(_PUNCTUATION) + "'" * len(_APOSTROPHES))
+
+
+def normalize_answer(text: str) -> str:
+    """The comparison key of an answer or headword"""
+    if not text.isascii():
+        # NFKD would turn "´" into a space and a combining accent, so map it first
+        text = "".join(c for c in unicodedata.normalize("NFKD", text.replace("´", "'"))
+                       if not unicodedata.combining(c))
+    return " ".join(text.casefold().translate(_TRANSLATION).split())
+
+
+def option_keys(options: Iterable[str]) -> Dict[str, str]:
+    """Map each option's key back to the option, leaving out keys shared by different options"""
+    keys: Dict[str, str] = {}
+    ambiguous = set()
+    for option in options:
+        key = normalize_answer(option)
+        if keys.setdefault(key, option) != option:
+            ambiguous.add(key)
+    for key in ambiguous:
+        del keys[key]
+    return keys
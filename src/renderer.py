@@ -0,0 +1,161 @@
+"""
+Buffered Screen Renderer for Inglês Autodidata
+
+Screens are built in memory and written to the terminal in a single call,
+using ANSI escapes instead of spawning a `clear` process. When the previous
+frame is still on screen, only the lines that changed are rewritten.
+
+Diffing addresses rows by absolute position, so it is only safe while the
+frame has not scrolled. Prompts, input echoes and feedback written below a
+frame go through `echo` and `track`, which count the rows they take; once
+they reach the bottom of the terminal the next frame is drawn in full.
+Anything else printed between two frames must call `invalidate` first.
+"""
+
+import io
+import os
+import shutil
+import sys
+import unicodedata
+from contextlib import contextmanager, redirect_stdout
+from typing import List, Optional, TextIO
+from . import metrics
+
+CLEAR = "\033[H\033[2J\033[3J"
+CLEAR_BELOW = "\033[J"
+CLEAR_LINE = "\033[K"
+
+def _move_to(row: int) -> str:
+    """ANSI escape that moves the cursor to the start of a 1-based row"""
+    return f"\033[{row};1H"
+
+
+def display_width(text: str) -> int:
+    """Approximate the number of terminal columns a line occupies"""
+    width = 0
+    for char in text:
+        if unicodedata.combining(char) or char == "\ufe0f":
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+    return width
+
+
+class FrameRenderer:
+    def __init__(self, stream: Optional[TextIO] = None, ansi: Optional[bool] = None):
+        self.stream = stream or sys.stdout
+        if ansi is None:
+            ansi = os.name != "nt" and hasattr(self.stream, "isatty") and self.stream.isatty()
+        self.ansi = ansi
+        self.previous: Optional[List[str]] = None
+        # Rows used below the previous frame, and the cursor column on the last one
+        self.below = 0
+        self.column = 0
+        self.capturing = False
+        self.frames_drawn = 0
+        self.lines_written = 0
+
+    @metrics.timed("screen.clear")
+    def clear(self):
+        """Clear the terminal and forget the previous frame"""
+        self.invalidate()
+        if self.ansi:
+            self.stream.write(CLEAR)
+            self.stream.flush()
+        elif os.name == "nt":
+            os.system("cls")
+
+    def invalidate(self):
+        """Forget the previous frame so the next one is fully redrawn"""
+        self.previous = None
+
+    def track(self, text: str):
+        """Account for text that reached the terminal below the frame, such as an input echo"""
+        if self.previous is None:
+            return
+        columns = shutil.get_terminal_size()[0]
+        for i, part in enumerate(text.split("\n")):
+            if i:
+                self.below += 1
+                self.column = 0
+            # A line exactly as wide as the terminal counts as wrapped, which only errs safe
+            wrapped, self.column = divmod(self.column + display_width(part), columns)
+            self.below += wrapped
+
+    def echo(self, text: str = ""):
+        """Print a line, below the frame unless a frame is being captured"""
+        if self.capturing:
+            print(text)
+            return
+        self.stream.write(text + "\n")
+        self.stream.flush()
+        self.track(text + "\n")
+
+    @metrics.timed("screen.present")
+    def present(self, text: str):
+        """Draw a complete frame, diffing against the previous one if possible"""
+        lines = text.split("\n")
+        if lines and lines[-1] == "":
+            lines.pop()
+
+        if not self.ansi:
+            if os.name == "nt":
+                os.system("cls")
+            self._emit("\n".join(lines) + "\n", len(lines))
+            return
+
+        columns, rows = shutil.get_terminal_size()
+        previous = self.previous
+
+        # Both frames end with the cursor on the row below them; nothing may have scrolled
+        if previous is not None and len(previous) + self.below < rows and len(lines) < rows:
+            changed = [row for row, line in enumerate(lines)
+                       if row >= len(previous) or previous[row] != line]
+            if all(display_width(lines[row]) < columns for row in changed):
+                parts = [_move_to(row + 1) + lines[row] + CLEAR_LINE for row in changed]
+                parts.append(_move_to(len(lines) + 1) + CLEAR_BELOW)
+                self._emit("".join(parts), len(changed))
+                self._remember(lines)
+                return
+
+        self._emit(CLEAR + "\n".join(lines) + "\n", len(lines))
+
+        # Only remember frames whose lines map one-to-one onto terminal rows
+        if len(lines) < rows and all(display_width(line) < columns for line in lines):
+            self._remember(lines)
+        else:
+            self.previous = None
+
+    def _remember(self, lines: List[str]):
+        self.previous = lines
+        self.below = 0
+        self.column = 0
+
+    @contextmanager
+    def frame(self):
+        """Capture everything printed inside the block and present it as one frame"""
+        buffer = io.StringIO()
+        self.capturing = True
+        try:
+            with redirect_stdout(buffer):
+                yield buffer
+        finally:
+            self.capturing = False
+        self.present(buffer.getvalue())
+
+    def _emit(self, data: str, lines: int):
+        """Write a frame in a single call"""
+        self.stream.write(data)
+        self.stream.flush()
+        self.frames_drawn += 1
+        self.lines_written += lines
+
+
+_renderer: Optional[FrameRenderer] = None
+
+
+def get_renderer() -> FrameRenderer:
+    """Get the shared renderer bound to the current stdout"""
+    global _renderer
+    if _renderer is None or (_renderer.stream is not sys.stdout and not _renderer.capturing):
+        _renderer = FrameRenderer(sys.stdout)
+    return _renderer
@@ -0,0 +1,81 @@
+"""
+Session Journal for Inglês Autodidata
+
+While a session is running, each graded answer is appended to a small
+per-user journal file as one JSON line and flushed straight away. The
+file is held open, so a write costs a few microseconds. When the session
+finishes, its answers go into the profile and the journal is removed. If
+the process dies first, the journal survives and the answers are folded
+into the profile the next time the learner starts the app.
+"""
+
+import json
+import os
+import time
+from typing import Dict, IO, List, Optional, Tuple
+from .answer_history import user_filename
+
+
+class SessionJournal:
+    def __init__(self, data_dir: str = "data/journal"):
+        self.data_dir = data_dir
+        self._files: Dict[str, IO] = {}
+
+    def _path(self, email: str) -> str:
+        """Get the journal file for a user"""
+        return os.path.join(self.data_dir, user_filename(email) + ".jsonl")
+
+    def write(self, email: str, category: str, event: Dict):
+        """Append one answer, starting the journal on the session's first answer"""
+        f = self._files.get(email)
+        if f is None:
+            os.makedirs(self.data_dir, exist_ok=True)
+            f = self._files[email] = open(self._path(email), 'a', encoding='utf-8')
+            if f.tell() == 0:
+                f.write(json.dumps({"category": category,
+                                    "started": round(time.time(), 3)}) + "\n")
+        f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        # Flushed to the OS, not fsynced: survives a crashed process, not a power cut
+        f.flush()
+
+    def exists(self, email: str) -> bool:
+        """Whether a user has a journal on disk"""
+        return os.path.exists(self._path(email))
+
+    def release(self, email: str):
+        """Stop writing a user's journal but keep it, e.g. for an abandoned session"""
+        f = self._files.pop(email, None)
+        if f is not None:
+            f.close()
+
+    def close(self, email: str):
+        """End a user's journal once its answers are safely in the profile"""
+        f = self._files.pop(email, None)
+        if f is not None:
+            f.close()
+        path = self._path(email)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def read(self, email: str) -> Optional[Tuple[Dict, List[Dict]]]:
+        """Return (header, answer events) of a left-over journal, if there is one"""
+        path = self._path(email)
+        if email in self._files or not os.path.exists(path):
+            return None
+
+        header = None
+        events = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # A torn last line from the crash
+                if header is None:
+                    header = record
+                else:
+                    events.append(record)
+        if header is None:
+            os.remove(path)
+            return None
+        return header, events
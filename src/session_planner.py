@@ -0,0 +1,204 @@
+"""
+Batch Session Planner for Inglês Autodidata
+
+Precomputes each learner's next few sessions so that starting one is a
+constant-time read of a small plan file. Meant to run nightly:
+
+    python -m src.session_planner [--workers 8] [--new-word-sessions 2]
+
+Profiles are split into chunks and planned in a process pool. Each worker
+loads the content and forgetting model once, then for every learner streams
+their answer history a single time to find:
+
+  * due reviews    - practised words whose predicted recall has dropped
+  * new words      - words at the learner's level they have never answered
+  * weak topics    - grammar topics with the lowest accuracy, missed and
+                     unseen exercises first
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from .user_manager import UserManager
+from .vocabulary_manager import VocabularyManager
+from .grammar_manager import GrammarManager
+from .answer_history import AnswerHistory
+from .forgetting_model import ForgettingModel, WordReviews
+from .session_plans import SessionPlans
+from .learning_session import VOCABULARY_SESSION_SIZE, GRAMMAR_SESSION_SIZE, REVIEW
+from . import metrics
+
+DUE_RECALL = 0.9
+NEW_WORD_SESSIONS = 2
+USERS_PER_CHUNK = 200
+WEAK_TOPICS = 2
+
+
+class SessionPlanner:
+    def __init__(self, vocabulary: Dict, grammar: Dict, model: ForgettingModel,
+                 history: AnswerHistory, plans: SessionPlans,
+                 new_word_sessions: int = NEW_WORD_SESSIONS):
+        self.vocabulary = vocabulary
+        self.grammar = grammar
+        self.model = model
+        self.history = history
+        self.plans = plans
+        self.new_word_sessions = new_word_sessions
+
+        # Plans refer to items by the same keys the answer history uses
+        self.known_words = {word_data["word"] for words in vocabulary.values()
+                            for word_data in words}
+        self.exercise_topics = {exercise["question"]: topic
+                                for topic, exercises in grammar.items()
+                                for exercise in exercises}
+
+    def plan_user(self, email: str, level: str, now: Optional[float] = None) -> Dict:
+        """Build the upcoming sessions for one learner"""
+        now = now or time.time()
+        reviews: Dict[str, WordReviews] = {}
+        missed: Dict[str, bool] = {}
+        topic_answers: Dict[str, List[int]] = {}
+
+        for event in self.history.iter_events(email):
+            kind, item = event.get("type"), event.get("item")
+            correct = bool(event.get("correct"))
+            if kind == "vocabulary":
+                record = reviews.get(item)
+                if record is None:
+                    record = reviews[item] = WordReviews(event["ts"])
+                record.update(event["ts"], correct)
+            elif kind == "grammar" and item in self.exercise_topics:
+                missed[item] = not correct
+                totals = topic_answers.setdefault(self.exercise_topics[item], [0, 0])
+                totals[0] += correct
+                totals[1] += 1
+
+        sessions = []
+
+        due = [(recall, word) for word, recall in self.model.score(reviews, now)
+               if recall < DUE_RECALL and word in self.known_words]
+        if due:
+            due.sort()
+            items = [word for _, word in due[:VOCABULARY_SESSION_SIZE]]
+            sessions.append({"type": "vocabulary", "label": REVIEW, "items": items})
+
+        rng = random.Random(email)
+        unseen = [word_data["word"] for word_data in self.vocabulary.get(level, [])
+                  if word_data["word"] not in reviews]
+        rng.shuffle(unseen)
+        planned_new = min(len(unseen), self.new_word_sessions * VOCABULARY_SESSION_SIZE)
+        for start in range(0, planned_new, VOCABULARY_SESSION_SIZE):
+            sessions.append({"type": "vocabulary", "label": level,
+                             "items": unseen[start:start + VOCABULARY_SESSION_SIZE]})
+
+        weak = self._weak_topic_exercises(topic_answers, missed, rng)
+        if weak:
+            sessions.append({"type": "grammar", "label": "mixed", "items": weak})
+
+        return {"generated": round(now), "sessions": sessions}
+
+    def _weak_topic_exercises(self, topic_answers: Dict[str, List[int]],
+                              missed: Dict[str, bool], rng: random.Random) -> List[str]:
+        """Exercises from the learner's weakest topics, missed and unseen ones first"""
+        def accuracy(topic: str) -> float:
+            right, total = topic_answers.get(topic, (0, 0))
+            return right / total if total else 0.5
+
+        topics = sorted((t for t in self.grammar if t != "mixed"), key=accuracy)[:WEAK_TOPICS]
+        candidates = []
+        for topic in topics:
+            for exercise in self.grammar[topic]:
+                # 0 = missed last time, 1 = never seen, 2 = answered correctly
+                last_missed = missed.get(exercise["question"])
+                rank = 1 if last_missed is None else 0 if last_missed else 2
+                candidates.append((rank, rng.random(), exercise["question"]))
+
+        candidates.sort()
+        return [question for _, _, question in candidates[:GRAMMAR_SESSION_SIZE]]
+
+    def plan_and_save(self, email: str, level: str) -> int:
+        """Plan one learner and write their plan file; returns the number of sessions"""
+        plan = self.plan_user(email, level)
+        self.plans.save(email, plan)
+        return len(plan["sessions"])
+
+
+_planner: Optional[SessionPlanner] = None
+
+
+def _init_worker(vocabulary_file: str, grammar_file: str, model_file: str,
+                 history_dir: str, plans_dir: str, new_word_sessions: int):
+    """Load content and the model once per worker process"""
+    global _planner
+    _planner = SessionPlanner(
+        VocabularyManager(vocabulary_file).vocabulary,
+        GrammarManager(grammar_file).grammar_exercises,
+        ForgettingModel.load(model_file),
+        AnswerHistory(history_dir),
+        SessionPlans(plans_dir),
+        new_word_sessions
+    )
+
+
+def _plan_chunk(users: List[Tuple[str, str]]) -> Tuple[int, int]:
+    """Plan a chunk of learners in a worker; returns (learners, sessions)"""
+    sessions = sum(_planner.plan_and_save(email, level) for email, level in users)
+    return len(users), sessions
+
+
+@metrics.timed("planner.run")
+def plan_all(user_manager: UserManager, workers: Optional[int] = None,
+             vocabulary_file: str = "data/vocabulary.json",
+             grammar_file: str = "data/grammar.json",
+             model_file: str = "data/forgetting_model.json",
+             history_dir: str = "data/history", plans_dir: str = "data/plans",
+             new_word_sessions: int = NEW_WORD_SESSIONS,
+             on_progress: Callable[[int, int], None] = None) -> Tuple[int, int]:
+    """Plan every learner across a process pool; returns (learners, sessions)"""
+    users = [(email, user.get("level", "beginner")) for email, user in user_manager.users.items()]
+    chunks = [users[i:i + USERS_PER_CHUNK] for i in range(0, len(users), USERS_PER_CHUNK)]
+
+    planned = sessions = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(vocabulary_file, grammar_file, model_file,
+                                       history_dir, plans_dir, new_word_sessions)) as pool:
+        for chunk_users, chunk_sessions in pool.map(_plan_chunk, chunks):
+            planned += chunk_users
+            sessions += chunk_sessions
+            if on_progress:
+                on_progress(planned, len(users))
+
+    return planned, sessions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute upcoming sessions for every learner")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--new-word-sessions", type=int, default=NEW_WORD_SESSIONS)
+    parser.add_argument("--users-file", default="data/users.json")
+    parser.add_argument("--vocabulary-file", default="data/vocabulary.json")
+    parser.add_argument("--grammar-file", default="data/grammar.json")
+    parser.add_argument("--model-file", default="data/forgetting_model.json")
+    parser.add_argument("--history-dir", default="data/history")
+    parser.add_argument("--plans-dir", default="data/plans")
+    args = parser.parse_args(argv)
+
+    def report(done: int, total: int):
+        print(f"\r🗓️  Planned {done}/{total} learners", end="", file=sys.stderr, flush=True)
+
+    started = time.perf_counter()
+    learners, sessions = plan_all(
+        UserManager(args.users_file, autosave=False), args.workers,
+        args.vocabulary_file, args.grammar_file, args.model_file,
+        args.history_dir, args.plans_dir, args.new_word_sessions, on_progress=report)
+    print(file=sys.stderr)
+    print(f"✅ Planned {sessions} sessions for {learners} learners "
+          f"in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
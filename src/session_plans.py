@@ -0,0 +1,55 @@
+"""
+Precomputed Session Plans for Inglês Autodidata
+
+A plan is a short queue of upcoming sessions for one learner, written by
+the batch planner (src/session_planner.py) and consumed at session start.
+Items are stored by their stable keys (a word's headword, an exercise's
+question), so resolving a planned session is a few dictionary lookups
+instead of a fresh selection over the whole bank, and content edited
+after planning cannot shift a plan onto the wrong items.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+from .answer_history import user_filename
+
+
+class SessionPlans:
+    def __init__(self, data_dir: str = "data/plans"):
+        self.data_dir = data_dir
+
+    def _path(self, email: str) -> str:
+        """Get the plan file for a user"""
+        return os.path.join(self.data_dir, user_filename(email) + ".json")
+
+    def load(self, email: str) -> Dict:
+        """Load a user's plan, or an empty one"""
+        path = self._path(email)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+    def save(self, email: str, plan: Dict):
+        """Replace a user's plan atomically"""
+        os.makedirs(self.data_dir, exist_ok=True)
+        path = self._path(email)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(plan, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    def take(self, email: str, kind: str, label: str) -> Optional[List[str]]:
+        """Remove and return the item keys of the next matching planned session"""
+        plan = self.load(email)
+        sessions = plan.get("sessions", [])
+        for position, session in enumerate(sessions):
+            if session["type"] == kind and session["label"] == label:
+                del sessions[position]
+                self.save(email, plan)
+                return session["items"]
+        return None
@@ -0,0 +1,60 @@
+"""
+Startup Tracing for Inglês Autodidata
+
+Records how long each startup phase takes (imports, loading users, first
+menu) and the lazy content loads that happen when a learner first opens a
+module. Enabled by `--startup-trace`; when off, phases cost a flag check.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+
+class StartupTrace:
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.phases: List[Tuple[str, float, float]] = []
+        self.marks: List[Tuple[str, float]] = []
+
+    def enable(self, origin: Optional[float] = None):
+        """Start tracing, measuring offsets from `origin` (perf_counter seconds)"""
+        self.enabled = True
+        if origin is not None:
+            self.origin = origin
+
+    def record(self, name: str, start: float, end: float):
+        """Add a phase measured elsewhere"""
+        if self.enabled:
+            self.phases.append((name, start - self.origin, end - start))
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block as a named phase"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def mark_once(self, name: str):
+        """Record a point in time, the first time it is reached"""
+        if self.enabled and all(mark != name for mark, _ in self.marks):
+            self.marks.append((name, time.perf_counter() - self.origin))
+
+    def report(self) -> str:
+        """Format the trace as a timeline"""
+        events = [(offset, f"{name:<36}{offset * 1000:>10.1f}{duration * 1000:>12.2f}")
+                  for name, offset, duration in self.phases]
+        events += [(offset, f"▶ {name:<34}{offset * 1000:>10.1f}{'':>12}")
+                   for name, offset in self.marks]
+        lines = [f"{'phase':<36}{'at ms':>10}{'took ms':>12}"]
+        lines += [line for _, line in sorted(events)]
+        return "\n".join(lines)
+
+
+trace = StartupTrace()
@@ -7,12 +7,17 @@ import os
 from datetime import datetime
 from typing import Dict, List, Optional
 from .utils import get_user_input, get_yes_no_input, validate_email, print_colored_text
+from .latency_histogram import record_latencies
+from . import metrics
 
 class UserManager:
-    def __init__(self, data_file: str = "data/users.json"):
+    def __init__(self, data_file: str = "data/users.json", autosave: bool = True):
         self.data_file = data_file
+        self.autosave = autosave
+        self.dirty = False
         self.users = self._load_users()
     
+    @metrics.timed("users.load")
     def _load_users(self) -> Dict:
         """Load users from JSON file"""
         if os.path.exists(self.data_file):
@@ -23,11 +28,38 @@ class UserManager:
                 return {}
         return {}
     
+    def encode_profile(self, email: str) -> str:
+        """One "email": {profile} entry of users.json, indented as in the file"""
+        profile = json.dumps(self.users[email], indent=2, ensure_ascii=False).replace("\n", "\n  ")
+        return f"  {json.dumps(email, ensure_ascii=False)}: {profile}"
+
+    @metrics.timed("users.save")
+    def write_profiles(self, entries: List[str]):
+        """Atomically write users.json from entries made by encode_profile"""
+        directory = os.path.dirname(self.data_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = self.data_file + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write("{\n" + ",\n".join(entries) + "\n}" if entries else "{}")
+        os.replace(temp_path, self.data_file)
+
     def _save_users(self):
         """Save users to JSON file"""
-        os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-        with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(self.users, f, indent=2, ensure_ascii=False)
+        self.write_profiles([self.encode_profile(email) for email in self.users])
+    
+    def _commit(self):
+        """Persist changes now, or leave them for flush() when autosave is off"""
+        if self.autosave:
+            self._save_users()
+        else:
+            self.dirty = True
+    
+    def flush(self):
+        """Write pending changes to disk"""
+        if self.dirty:
+            self._save_users()
+            self.dirty = False
     
     def has_users(self) -> bool:
         """Check if any users exist"""
@@ -99,6 +131,7 @@ class UserManager:
                 "correct_answers": 0,
                 "total_answers": 0,
                 "study_time_minutes": 0,
+                "study_time_seconds": 0,
                 "streak_days": 0,
                 "last_study_date": None
             },
@@ -118,7 +151,7 @@ class UserManager:
         
         # Save user
         self.users[email] = user_data
-        self._save_users()
+        self._commit()
         
         print_colored_text(f"\n✅ Welcome, {name}! Your profile has been created.", "green")
         return user_data
@@ -131,7 +164,6 @@ class UserManager:
         if len(self.users) == 1:
             # Auto-login if only one user
             email = list(self.users.keys())[0]
-            user = self.users[email]
         else:
             # Multiple users - show selection
             print("Select your profile:")
@@ -143,14 +175,22 @@ class UserManager:
             choice = get_user_input(f"Choose profile (1-{len(emails)})", 
                                   [str(i) for i in range(1, len(emails) + 1)])
             email = emails[int(choice) - 1]
-            user = self.users[email]
+        
+        return self.login_by_email(email)
+    
+    def login_by_email(self, email: str) -> Optional[Dict]:
+        """Login a user without prompting"""
+        user = self.users.get(email)
+        if user is None:
+            return None
         
         # Update last login
         user["last_login"] = datetime.now().isoformat()
-        self._save_users()
+        self._commit()
         
         return user
     
+    @metrics.timed("users.update_stats")
     def update_user_stats(self, user: Dict, session_stats: Dict):
         """Update user statistics after a learning session"""
         email = user["email"]
@@ -163,7 +203,11 @@ class UserManager:
         stats["total_sessions"] += 1
         stats["correct_answers"] += session_stats.get("correct", 0)
         stats["total_answers"] += session_stats.get("total", 0)
-        stats["study_time_minutes"] += session_stats.get("time_minutes", 0)
+        # Seconds are summed so short sessions still count; minutes follow from them
+        seconds = stats.get("study_time_seconds", stats["study_time_minutes"] * 60)
+        seconds += session_stats.get("time_seconds", session_stats.get("time_minutes", 0) * 60)
+        stats["study_time_seconds"] = seconds
+        stats["study_time_minutes"] = seconds // 60
         stats["words_learned"] += session_stats.get("new_words", 0)
         
         # Update streak
@@ -190,6 +234,10 @@ class UserManager:
         
         stats["last_study_date"] = today
         
+        if session_stats.get("latencies_ms"):
+            record_latencies(self.users[email], session_stats.get("category") or "general",
+                             session_stats.get("topic"), session_stats["latencies_ms"])
+        
         # Update progress based on session type and performance
         if session_stats.get("category"):
             category = session_stats["category"]
@@ -200,8 +248,9 @@ class UserManager:
                 points_earned = session_stats.get("correct", 0)
                 self.users[email]["progress"][category][level] = current_progress + points_earned
         
-        self._save_users()
+        self._commit()
     
+    @metrics.timed("users.get_stats")
     def get_user_stats(self, user: Dict) -> Dict:
         """Get formatted user statistics"""
         email = user["email"]
@@ -229,6 +278,6 @@ class UserManager:
         """Delete a user"""
         if email in self.users:
             del self.users[email]
-            self._save_users()
+            self._commit()
             return True
         return False
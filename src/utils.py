@@ -2,14 +2,20 @@
 Utility functions for Inglês Autodidata
 """
 
-import os
 import time
 import random
-from typing import List, Dict
+from typing import List, Dict, Optional
+from .renderer import get_renderer
+from .normalization import normalize_answer, option_keys
+from .line_input import read_line
 
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    get_renderer().clear()
+
+def screen_frame():
+    """Buffer everything printed in a `with` block and draw it as one frame"""
+    return get_renderer().frame()
 
 def print_banner():
     """Print the application banner"""
@@ -42,39 +48,62 @@ def print_colored_text(text: str, color: str = "white"):
     
     color_code = colors.get(color.lower(), colors["white"])
     reset_code = colors["reset"]
-    print(f"{color_code}{text}{reset_code}")
+    get_renderer().echo(f"{color_code}{text}{reset_code}")
+
+def print_below(text: str = ""):
+    """Print a line under the current screen frame"""
+    get_renderer().echo(text)
 
-def get_user_input(prompt: str, valid_options: List[str] = None) -> str:
-    """Get user input with validation"""
+def get_user_input(prompt: str, valid_options: List[str] = None,
+                   timeout: Optional[float] = None) -> Optional[str]:
+    """Get user input with validation, returning None if `timeout` seconds pass"""
+    deadline = time.monotonic() + timeout if timeout else None
+    # Option keys are computed once, not on every retry
+    choices = {option.lower(): option.lower() for option in valid_options or ()}
+    keys = option_keys(choices)
+    
     while True:
-        user_input = input(f"{prompt}: ").strip()
+        if deadline is None:
+            user_input = read_line(f"{prompt}: ")
+            # The terminal echoed the answer and the Enter below the frame
+            get_renderer().track(f"{prompt}: {user_input}\n")
+            user_input = user_input.strip()
+        else:
+            from . import async_io  # asyncio is slow to import; only timed quizzes need it
+            remaining = deadline - time.monotonic()
+            response = async_io.read_line(f"{prompt}: ", max(remaining, 0))
+            get_renderer().track(f"{prompt}: {response.text or ''}\n")
+            if response.timed_out:
+                return None
+            user_input = response.text.strip()
         
         if valid_options:
-            if user_input.lower() in [option.lower() for option in valid_options]:
-                return user_input.lower()
+            choice = choices.get(user_input.lower()) or keys.get(normalize_answer(user_input))
+            if choice is not None:
+                return choice
             else:
-                print(f"❌ Please enter one of: {', '.join(valid_options)}")
+                print_below(f"❌ Please enter one of: {', '.join(valid_options)}")
         else:
             if user_input:
                 return user_input
             else:
-                print("❌ Please enter a valid input.")
+                print_below("❌ Please enter a valid input.")
 
 def get_yes_no_input(prompt: str) -> bool:
     """Get yes/no input from user"""
     response = get_user_input(f"{prompt} (y/n)", ["y", "yes", "n", "no"])
     return response in ["y", "yes"]
 
-def pause_for_user():
+def pause_for_user(message: str = "Press Enter to continue..."):
     """Pause and wait for user to press Enter"""
-    input("\nPress Enter to continue...")
+    typed = read_line(f"\n{message}")
+    get_renderer().track(f"\n{message}{typed}\n")
 
 def animate_text(text: str, delay: float = 0.03):
-    """Animate text character by character"""
-    for char in text:
-        print(char, end='', flush=True)
-        time.sleep(delay)
-    print()
+    """Animate text character by character; any key skips to the end"""
+    from . import async_io
+    get_renderer().invalidate()
+    async_io.animate_text(text, delay)
 
 def format_score(correct: int, total: int) -> str:
     """Format score as percentage"""
@@ -88,7 +117,9 @@ def get_difficulty_emoji(level: str) -> str:
     emojis = {
         "beginner": "🟢",
         "intermediate": "🟡", 
-        "advanced": "🔴"
+        "advanced": "🔴",
+        "adaptive": "🎯",
+        "review": "🔁"
     }
     return emojis.get(level.lower(), "⚪")
 
@@ -4,13 +4,109 @@ Vocabulary Management System for Inglês Autodidata
 
 import json
 import os
-from typing import List, Dict
+import random
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Optional, Tuple
+from .distractor_index import DistractorIndex
+from .cloze_index import ClozeIndex
+from .search_index import SearchIndex
+from .adaptive_engine import ItemBank, base_difficulty
+from .near_duplicates import NearDuplicateIndex
+from .content_loader import BackgroundLoader
+from .normalization import normalize_answer
+from . import metrics
 
 class VocabularyManager:
-    def __init__(self, data_file: str = "data/vocabulary.json"):
+    def __init__(self, data_file: str = "data/vocabulary.json", background: bool = False):
         self.data_file = data_file
-        self.vocabulary = self._load_vocabulary()
+        self._loader: Optional[BackgroundLoader] = None
+        if background and os.path.exists(data_file):
+            # Stream the file on a thread; levels fill in as entries are decoded
+            self._loader = BackgroundLoader(data_file).start()
+            self._vocabulary = self._loader.groups
+        else:
+            self._vocabulary = self._load_vocabulary()
+        self._distractor_index: Optional[DistractorIndex] = None
+        self._cloze_index: Optional[ClozeIndex] = None
+        self._search_index: Optional[SearchIndex] = None
+        self._near_duplicate_index: Optional[NearDuplicateIndex] = None
+        self._adaptive_bank: Optional[ItemBank] = None
+        # Level (None for all) -> (ranks ascending, entries in the same order)
+        self._by_rank: Dict[Optional[str], Tuple[List[int], List[Dict]]] = {}
+        # Headword -> normalized answer key, computed once per word
+        self._answer_keys: Dict[str, str] = {}
+        # Headword -> entry, built on the first lookup
+        self._by_word: Optional[Dict[str, Dict]] = None
+        # Content pack name -> its vocabulary, merged after the main file's words
+        self._packs: Dict[str, Dict] = {}
+    
+    @property
+    def vocabulary(self) -> Dict:
+        """All levels, waiting for a background load to finish first"""
+        if self._loader is not None:
+            self._loader.wait()
+            if self._loader.error is not None:
+                self._vocabulary = self._create_default_vocabulary()
+            self._loader = None
+            for pack in self._packs.values():
+                self._merge_pack(pack)
+        return self._vocabulary
+    
+    @vocabulary.setter
+    def vocabulary(self, vocabulary: Dict):
+        self._loader = None
+        self._vocabulary = vocabulary
+        self._by_word = self._adaptive_bank = None
+    
+    @property
+    def distractor_index(self) -> DistractorIndex:
+        """Distractor index, built the first time a multiple-choice question needs it"""
+        if self._distractor_index is None:
+            self.build_distractor_index()
+        return self._distractor_index
+    
+    def build_distractor_index(self):
+        """Build the distractor index now instead of on the first multiple-choice question"""
+        self._distractor_index = DistractorIndex()
+        self._distractor_index.build(self.vocabulary)
+    
+    @property
+    def cloze_index(self) -> ClozeIndex:
+        """Tokenized example sentences, indexed the first time a cloze question is needed"""
+        if self._cloze_index is None:
+            self._cloze_index = ClozeIndex()
+            self._cloze_index.build(self.vocabulary)
+        return self._cloze_index
+    
+    @property
+    def adaptive_bank(self) -> ItemBank:
+        """Every word by calibrated difficulty, shared by all learners' adaptive engines"""
+        if self._adaptive_bank is None:
+            self._adaptive_bank = ItemBank(
+                (word_data["word"], word_data, base_difficulty(word_data, level))
+                for level, words in self.vocabulary.items()
+                for word_data in words)
+        return self._adaptive_bank
     
+    @property
+    def search_index(self) -> SearchIndex:
+        """Full-text index, built on the first search"""
+        if self._search_index is None:
+            self._search_index = SearchIndex()
+            self._search_index.build(self.vocabulary)
+        return self._search_index
+    
+    @property
+    def near_duplicate_index(self) -> NearDuplicateIndex:
+        """MinHash index over definitions, built the first time a word is added"""
+        if self._near_duplicate_index is None:
+            self._near_duplicate_index = NearDuplicateIndex()
+            self._near_duplicate_index.build(
+                (word_data, word_data["definition"])
+                for level in self.vocabulary.values() for word_data in level)
+        return self._near_duplicate_index
+    
+    @metrics.timed("vocabulary.load")
     def _load_vocabulary(self) -> Dict:
         """Load vocabulary from JSON file"""
         if os.path.exists(self.data_file):
@@ -182,10 +278,15 @@ class VocabularyManager:
             ]
         }
     
-    def get_words_by_difficulty(self, difficulty: str) -> List[Dict]:
-        """Get words by difficulty level"""
+    def get_words_by_difficulty(self, difficulty: str, minimum: int = None) -> List[Dict]:
+        """Get words by difficulty level, or the first `minimum` of them while still loading"""
+        if minimum is not None and self._loader is not None:
+            self._loader.wait_for(difficulty, minimum)
+            if self._loader.error is None:
+                return list(self._loader.groups.get(difficulty, []))
         return self.vocabulary.get(difficulty, [])
     
+    @metrics.timed("vocabulary.by_category")
     def get_words_by_category(self, category: str, difficulty: str = None) -> List[Dict]:
         """Get words by category and optionally by difficulty"""
         words = []
@@ -199,11 +300,25 @@ class VocabularyManager:
         
         return words
     
-    def get_random_words(self, count: int, difficulty: str = None) -> List[Dict]:
-        """Get random words, optionally filtered by difficulty"""
-        import random
-        
-        if difficulty:
+    def _ranked_words(self, difficulty: Optional[str]) -> Tuple[List[int], List[Dict]]:
+        """Words that have a frequency rank, ordered by it (computed once per level)"""
+        if difficulty not in self._by_rank:
+            levels = [self.vocabulary.get(difficulty, [])] if difficulty else self.vocabulary.values()
+            ranked = [(word_data["frequency_rank"], word_data)
+                      for level in levels for word_data in level if "frequency_rank" in word_data]
+            # Leveled packs are stored in rank order already, so this sort is linear
+            ranked.sort(key=lambda pair: pair[0])
+            self._by_rank[difficulty] = ([rank for rank, _ in ranked], [w for _, w in ranked])
+        return self._by_rank[difficulty]
+    
+    @metrics.timed("vocabulary.random_words")
+    def get_random_words(self, count: int, difficulty: str = None,
+                         band: Tuple[int, int] = None) -> List[Dict]:
+        """Get random words, optionally filtered by difficulty and frequency rank band"""
+        if band:
+            ranks, ranked = self._ranked_words(difficulty)
+            words = ranked[bisect_left(ranks, band[0]):bisect_right(ranks, band[1])]
+        elif difficulty:
             words = self.vocabulary.get(difficulty, [])
         else:
             words = []
@@ -215,23 +330,16 @@ class VocabularyManager:
         
         return random.sample(words, count)
     
-    def search_words(self, query: str) -> List[Dict]:
-        """Search for words containing the query"""
-        results = []
-        query_lower = query.lower()
-        
-        for level in self.vocabulary.values():
-            for word_data in level:
-                if (query_lower in word_data["word"].lower() or 
-                    query_lower in word_data["definition"].lower()):
-                    results.append(word_data)
-        
-        return results
+    @metrics.timed("vocabulary.search")
+    def search_words(self, query: str, limit: int = 20) -> List[Dict]:
+        """Search words, definitions and examples, best matches first"""
+        return [word_data for _, word_data in self.search_index.search(query, limit)]
     
     def add_word(self, word: str, definition: str, difficulty: str, 
                 pronunciation: str = "", examples: List[str] = None, 
-                category: str = "general"):
-        """Add a new word to the vocabulary"""
+                category: str = "general") -> List[Dict]:
+        """Add a new word to the vocabulary; returns existing words with near-identical definitions"""
+        duplicates = [entry for entry, _ in self.near_duplicate_index.find(definition)]
         if difficulty not in self.vocabulary:
             self.vocabulary[difficulty] = []
         
@@ -244,13 +352,108 @@ class VocabularyManager:
         }
         
         self.vocabulary[difficulty].append(word_data)
+        self._index_word(word_data)
         self._save_vocabulary()
+        return duplicates
+    
+    def _index_word(self, word_data: Dict):
+        """Add a new entry to every index that has been built"""
+        self._by_rank.clear()
+        self._adaptive_bank = None  # read-only once built; rebuilt on next use
+        if self._by_word is not None:
+            self._by_word[word_data["word"]] = word_data
+        if self._distractor_index is not None:
+            self._distractor_index.add(word_data)
+        if self._cloze_index is not None:
+            self._cloze_index.add(word_data)
+        if self._search_index is not None:
+            self._search_index.add(word_data)
+        if self._near_duplicate_index is not None:
+            self._near_duplicate_index.add(word_data, word_data["definition"])
+    
+    def add_pack(self, name: str, vocabulary: Dict):
+        """Merge a content pack's words, once the main file has finished loading"""
+        self._packs[name] = vocabulary
+        if self._loader is None:
+            self._merge_pack(vocabulary)
+    
+    def _merge_pack(self, vocabulary: Dict):
+        for level, words in vocabulary.items():
+            self._vocabulary.setdefault(level, []).extend(words)
+            for word_data in words:
+                self._index_word(word_data)
+    
+    def remove_pack(self, name: str):
+        """Take a content pack's words back out"""
+        pack = self._packs.pop(name, None)
+        if pack is None or self._loader is not None:
+            return  # never merged
+        for level, pack_words in pack.items():
+            pack_ids = {id(word_data) for word_data in pack_words}
+            words = [word_data for word_data in self._vocabulary.get(level, [])
+                     if id(word_data) not in pack_ids]
+            if words:
+                self._vocabulary[level][:] = words
+            else:
+                self._vocabulary.pop(level, None)
+        # Indexes cannot drop entries; they are rebuilt on next use
+        self._distractor_index = self._cloze_index = self._search_index = None
+        self._near_duplicate_index = self._by_word = self._adaptive_bank = None
+        self._by_rank.clear()
+    
+    def _own_vocabulary(self) -> Dict:
+        """The vocabulary without content pack words, as stored in the main file"""
+        if not self._packs:
+            return self.vocabulary
+        pack_ids = {id(word_data) for pack in self._packs.values()
+                    for words in pack.values() for word_data in words}
+        own = {}
+        for level, words in self.vocabulary.items():
+            kept = [word_data for word_data in words if id(word_data) not in pack_ids]
+            if kept or len(kept) == len(words):
+                own[level] = kept
+        return own
+    
+    def get_word(self, word: str) -> Optional[Dict]:
+        """The entry for a headword, if it is in the vocabulary"""
+        if self._by_word is None:
+            self._by_word = {word_data["word"]: word_data
+                             for words in self.vocabulary.values() for word_data in words}
+        return self._by_word.get(word)
+    
+    def answer_key(self, word: str) -> str:
+        """The normalized key a typed answer must match for this word"""
+        key = self._answer_keys.get(word)
+        if key is None:
+            key = self._answer_keys[word] = normalize_answer(word)
+        return key
+    
+    def get_multiple_choice_question(self, word_data: Dict, choices: int = 4) -> Dict:
+        """Build a multiple-choice question from precomputed distractors"""
+        neighbours = self.distractor_index.get_distractors(word_data["word"], choices * 2)
+        distractors = [n["word"] for n in neighbours]
+        if len(distractors) > choices - 1:
+            distractors = random.sample(distractors, choices - 1)
+        
+        options = distractors + [word_data["word"]]
+        random.shuffle(options)
+        
+        return {
+            "definition": word_data["definition"],
+            "options": options,
+            "correct": word_data["word"]
+        }
+    
+    def get_cloze_question(self, word_data: Dict) -> Optional[Dict]:
+        """Build a fill-in-the-blank question from one of the word's examples"""
+        return self.cloze_index.get_question(word_data)
     
+    @metrics.timed("vocabulary.save")
     def _save_vocabulary(self):
         """Save vocabulary to JSON file"""
         os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
         with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(self.vocabulary, f, indent=2, ensure_ascii=False)
+            json.dump(self._own_vocabulary(), f, indent=2, ensure_ascii=False)
     
     def get_categories(self, difficulty: str = None) -> List[str]:
         """Get all available categories"""
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from src import adaptive_engine
+from src.adaptive_engine import AdaptiveEngine, ItemBank, SortedBuckets
+
+
+def make_bank(count=300, seed=0):
+    rng = random.Random(seed)
+    return ItemBank((f"w{i}", {"word": f"w{i}"}, rng.uniform(-3.0, 3.0)) for i in range(count))
+
+
+def test_sorted_buckets_match_a_sorted_list(monkeypatch):
+    monkeypatch.setattr(adaptive_engine, "BUCKET_SIZE", 4)
+    rng = random.Random(1)
+    buckets, reference = SortedBuckets(), []
+    for step in range(2000):
+        if reference and rng.random() < 0.4:
+            entry = reference.pop(rng.randrange(len(reference)))
+            buckets.remove(entry)
+        else:
+            entry = (rng.uniform(-5, 5), f"k{step}")
+            buckets.add(entry)
+            reference.append(entry)
+    reference.sort()
+    assert [entry for bucket in buckets.buckets for entry in bucket] == reference
+    assert all(len(bucket) <= 8 for bucket in buckets.buckets)
+
+    probe = (0.0, "")
+    assert list(buckets.walk_up(probe)) == [entry for entry in reference if entry >= probe]
+    assert list(buckets.walk_down(probe)) == [entry for entry in reversed(reference)
+                                              if entry < probe]
+
+
+def closest_unasked(engine):
+    target = engine.target_difficulty()
+    candidates = [(abs(engine.difficulty_of(key) - target), key)
+                  for key in engine.bank.base if key not in engine.asked]
+    return min(candidates)[0] if candidates else None
+
+
+def test_next_item_is_closest_to_target_after_every_answer():
+    bank = make_bank()
+    engine = AdaptiveEngine({}, "vocabulary", bank)
+    rng = random.Random(2)
+    for _ in range(150):
+        best_distance = closest_unasked(engine)
+        item = engine.next_item()
+        key = item["word"]
+        assert abs(engine.difficulty_of(key) - engine.target_difficulty()) == pytest.approx(
+            best_distance)
+        engine.record(key, rng.random() < 0.7, rng.choice([None, 1500, 12000]))
+        if rng.random() < 0.1:
+            engine.start_session()
+
+
+def test_answers_move_the_learner_and_the_item():
+    bank = make_bank()
+    profile = {}
+    engine = AdaptiveEngine(profile, "vocabulary", bank)
+    ability = engine.ability
+    engine.record("w0", False)
+    assert engine.ability < ability
+    assert engine.difficulty_of("w0") > bank.base["w0"]
+    assert profile["adaptive"]["vocabulary"]["items"]["w0"]["attempts"] == 1
+
+    # A new engine over the same profile picks the personal difficulty back up
+    again = AdaptiveEngine(profile, "vocabulary", bank)
+    assert again.difficulty_of("w0") == engine.difficulty_of("w0")
+
+
+def test_learners_share_the_bank():
+    bank = make_bank()
+    first = AdaptiveEngine({}, "vocabulary", bank)
+    second = AdaptiveEngine({}, "vocabulary", bank, level="advanced")
+    first.record("w1", True)
+    assert first.items is second.items is bank.items
+    assert second.difficulty == {}
+    assert bank.ordered == sorted(bank.ordered)
+
+
+def test_every_item_is_asked_once_per_session():
+    engine = AdaptiveEngine({}, "vocabulary", make_bank(20))
+    asked = [engine.next_item()["word"] for _ in range(20)]
+    assert len(set(asked)) == 20
+    assert engine.next_item() is None
@@ -0,0 +1,38 @@
+import pytest
+
+from src.answer_history import AnswerHistory, migrate_user_files, user_filename
+
+
+@pytest.mark.parametrize("first, second", [
+    ("a+b@x.com", "a_b@x.com"),
+    ("Ana@x.com", "ana@x.com"),
+    ("josé@x.com", "jos_@x.com"),
+])
+def test_distinct_emails_get_distinct_files(first, second):
+    assert user_filename(first) != user_filename(second)
+    assert user_filename(first).lower() != user_filename(second).lower()
+
+
+def test_plain_emails_keep_their_name():
+    assert user_filename("ana.silva-2@example.com") == "ana.silva-2@example.com"
+    assert "/" not in user_filename("../a/b@x.com")
+
+
+def test_legacy_files_are_renamed(tmp_path):
+    (tmp_path / "a_b@x.com.jsonl").write_text('{"item": "cat"}\n')
+    shared = migrate_user_files(["a+b@x.com"], [str(tmp_path)])
+
+    assert shared == []
+    assert not (tmp_path / "a_b@x.com.jsonl").exists()
+    events = list(AnswerHistory(str(tmp_path)).iter_events("a+b@x.com"))
+    assert events == [{"item": "cat"}]
+
+
+def test_shared_legacy_files_are_left_alone(tmp_path):
+    legacy = tmp_path / "a_b@x.com.jsonl"
+    legacy.write_text('{"item": "cat"}\n')
+    shared = migrate_user_files(["a+b@x.com", "a b@x.com", "c@x.com"], [str(tmp_path)])
+
+    assert shared == [str(legacy)]
+    assert legacy.exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a_b@x.com.jsonl"]
@@ -0,0 +1,144 @@
+import asyncio
+import json
+
+import pytest
+
+from src import api_server
+from src.answer_history import AnswerHistory
+from src.api_server import ApiServer, LearnerService
+from src.content_packs import ContentPacks
+from src.conversation_manager import ConversationManager
+from src.grammar_manager import GrammarManager
+from src.item_stats import ItemStats
+from src.session_journal import SessionJournal
+from src.user_manager import UserManager
+from src.vocabulary_manager import VocabularyManager
+
+EMAIL = "ana@example.com"
+
+
+@pytest.fixture
+def service(tmp_path):
+    users = UserManager(str(tmp_path / "users.json"), autosave=False)
+    users.users[EMAIL] = {
+        "name": "Ana", "email": EMAIL, "level": "beginner", "goals": [],
+        "stats": {"total_sessions": 0, "words_learned": 0, "correct_answers": 0,
+                  "total_answers": 0, "study_time_minutes": 0, "study_time_seconds": 0,
+                  "streak_days": 0, "last_study_date": None},
+        "progress": {kind: {"beginner": 0, "intermediate": 0, "advanced": 0}
+                     for kind in ("vocabulary", "grammar")},
+    }
+    return LearnerService(users, VocabularyManager(str(tmp_path / "vocabulary.json")),
+                          GrammarManager(str(tmp_path / "grammar.json")),
+                          ConversationManager(str(tmp_path / "conversations.json")),
+                          AnswerHistory(str(tmp_path / "history")),
+                          SessionJournal(str(tmp_path / "journal")),
+                          ContentPacks(str(tmp_path / "packs")),
+                          ItemStats(str(tmp_path / "item_stats.json")))
+
+
+async def exchange(server, raw: bytes) -> bytes:
+    """Send raw bytes to a running server and read until it closes the connection"""
+    listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    async with listener:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(raw)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        return response
+
+
+def test_login_issues_a_token(service):
+    async def run():
+        server = ApiServer(service)
+        body = json.dumps({"email": EMAIL}).encode()
+        return await exchange(server, b"POST /login HTTP/1.1\r\nContent-Length: "
+                              + str(len(body)).encode() + b"\r\nConnection: close\r\n\r\n" + body)
+
+    response = asyncio.run(run())
+    assert response.startswith(b"HTTP/1.1 200 OK")
+    assert b'"token"' in response
+
+
+@pytest.mark.parametrize("header, status", [
+    (b"Content-Length: abc", b"400"),
+    (b"Content-Length: -5", b"400"),
+    (b"Content-Length: 999999999", b"413"),
+])
+def test_framing_errors_close_the_connection(service, header, status):
+    smuggled = b"GET /metrics HTTP/1.1\r\n\r\n"
+    request = b"POST /login HTTP/1.1\r\n" + header + b"\r\n\r\n" + smuggled
+    response = asyncio.run(exchange(ApiServer(service), request))
+    assert response.startswith(b"HTTP/1.1 " + status)
+    assert b"Connection: close" in response
+    assert response.count(b"HTTP/1.1") == 1  # the trailing bytes were not served
+
+
+def test_unexpected_errors_hide_details(service, monkeypatch, capsys):
+    def explode(*args):
+        raise RuntimeError("secret internals")
+
+    monkeypatch.setattr(service, "route", explode)
+    request = b"GET /progress HTTP/1.1\r\n\r\n"
+    response = asyncio.run(exchange(ApiServer(service), request))
+    assert response.startswith(b"HTTP/1.1 500")
+    assert b"secret internals" not in response
+    assert b"Internal Server Error" in response
+    assert "secret internals" in capsys.readouterr().err
+
+
+def test_flush_loop_survives_failing_steps(service, monkeypatch, capsys):
+    monkeypatch.setattr(api_server, "FLUSH_INTERVAL_SECONDS", 0)
+    service.item_stats.observe("vocabulary", "cat", False, 1.0)
+    service.item_stats.commit()
+
+    def broken_write(pending):
+        raise OSError("disk full")
+
+    def broken_read(kinds):
+        raise ValueError("bad pack")
+
+    monkeypatch.setattr(service.item_stats, "write_merged", broken_write)
+    monkeypatch.setattr(service.content_packs, "read_changes", broken_read)
+    expired = []
+    monkeypatch.setattr(service, "expire_idle", lambda: expired.append(True))
+
+    async def run():
+        task = asyncio.create_task(ApiServer(service)._flush_periodically())
+        while len(expired) < 3:
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+    asyncio.run(run())
+    assert service.item_stats.pending == [("vocabulary", "cat", False, 1.0)]
+    assert service.item_stats.dirty
+    err = capsys.readouterr().err
+    assert "Could not save item stats" in err and "Could not sync content packs" in err
+
+
+def test_adaptive_session_picks_each_word_after_the_last_answer(service):
+    token = service.login(EMAIL)["token"]
+    session = service.get_learner(token).session
+    engine = session.vocabulary_engine
+    picks = []
+    next_item = engine.next_item
+
+    def spy():
+        picks.append(dict(session.user["adaptive"]["vocabulary"]["items"]))
+        return next_item()
+
+    engine.next_item = spy
+    first = service.start_session(token, {"type": "vocabulary", "difficulty": "adaptive"})
+    assert len(picks) == 1
+    total = first["question"]["total"]
+
+    for answered in range(1, total):
+        service.answer(token, {"answer": "wrong"})
+        # Each pick happens after the previous answer has been recorded
+        assert len(picks) == answered + 1
+        assert len(picks[-1]) == answered
+    result = service.answer(token, {"answer": "wrong"})
+    assert result["summary"]["total"] == total
+    assert len(picks) == total
@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from src.cloze_index import BLANK, ClozeIndex
+
+
+def blanks(word, *examples, **fields):
+    index = ClozeIndex()
+    index.add({"word": word, "definition": "-", "examples": list(examples), **fields})
+    return [sentence[start:end] for sentence, start, end in index.blanks.get(word.lower(), [])]
+
+
+@pytest.mark.parametrize("word, sentence, answer", [
+    ("accomplish", "She accomplished her goal.", "accomplished"),
+    ("study", "He studies every night.", "studies"),
+    ("stop", "The bus stopped here.", "stopped"),
+    ("hope", "We are hoping for rain.", "hoping"),
+    ("happy", "She looks happier today.", "happier"),
+    ("go", "They went home early.", "went"),
+    ("child", "The children are playing.", "children"),
+    ("Book", "Two books were on the table.", "books"),
+])
+def test_inflected_forms_are_blanked(word, sentence, answer):
+    assert blanks(word, sentence) == [answer]
+
+
+@pytest.mark.parametrize("word, sentence", [
+    ("car", "She cares a lot."),
+    ("hop", "I am hoping to see you."),
+    ("a", "As it turns out, yes."),
+    ("mat", "It does not matter."),
+    ("see", "Plant the seed."),
+    ("cat", "Concatenate the lists."),
+])
+def test_unrelated_words_are_not_blanked(word, sentence):
+    assert blanks(word, sentence) == []
+
+
+def test_multi_word_entries_match_whole_tokens():
+    assert blanks("give up", "Never give up!") == ["give up"]
+    assert blanks("give up", "She gave up early.") == ["gave up"]
+    assert blanks("give up", "Please forgive up front.") == []
+    assert blanks("look after", "I look. After that, I left.") == []
+
+
+def test_listed_inflections_replace_the_rules():
+    assert blanks("octopus", "Two octopi swam by.", inflections=["octopi"]) == ["octopi"]
+    assert blanks("octopus", "He octopused.", inflections=["octopi"]) == []
+
+
+def test_question_blanks_the_matched_form():
+    index = ClozeIndex()
+    index.build({"beginner": [{"word": "run", "definition": "move fast",
+                               "examples": ["She was running late."]}]})
+    question = index.get_question({"word": "run", "definition": "move fast"}, random.Random(1))
+    assert question["sentence"] == f"She was {BLANK} late."
+    assert question["answer"] == "running"
+    assert index.count() == 1
@@ -0,0 +1,88 @@
+import json
+import os
+
+import pytest
+
+from src.content_packs import ContentPacks
+from src.grammar_manager import GrammarManager
+from src.vocabulary_manager import VocabularyManager
+
+WORD = {"word": "invoice", "definition": "a list of goods sent and the money owed",
+        "examples": ["Please send the invoice."], "category": "business"}
+EXERCISE = {"question": "She ___ the report yesterday.", "options": ["sent", "send"],
+            "correct": "sent", "explanation": "Past simple."}
+
+
+def write_pack(pack_dir, name, kind, content):
+    path = pack_dir / name / f"{kind}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(content), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def managers(tmp_path):
+    return {"vocabulary": VocabularyManager(str(tmp_path / "vocabulary.json")),
+            "grammar": GrammarManager(str(tmp_path / "grammar.json"))}
+
+
+def all_words(manager):
+    return [word_data["word"] for words in manager.vocabulary.values() for word_data in words]
+
+
+def test_sync_merges_and_unmerges_packs(tmp_path, managers):
+    pack_dir = tmp_path / "packs"
+    write_pack(pack_dir, "business", "vocabulary", {"intermediate": [WORD]})
+    write_pack(pack_dir, "business", "grammar", {"past simple": [EXERCISE]})
+    packs = ContentPacks(str(pack_dir))
+
+    assert packs.sync(managers) == (2, 0)
+    assert "invoice" in all_words(managers["vocabulary"])
+    assert managers["grammar"].get_exercise(EXERCISE["question"]) is not None
+    assert packs.sync(managers) == (0, 0)  # nothing changed
+
+    packs.set_enabled("business", False)
+    assert packs.sync(managers) == (0, 2)
+    assert "invoice" not in all_words(managers["vocabulary"])
+    assert managers["grammar"].get_exercise(EXERCISE["question"]) is None
+
+
+def test_changed_pack_is_reloaded(tmp_path, managers):
+    pack_dir = tmp_path / "packs"
+    path = write_pack(pack_dir, "business", "vocabulary", {"intermediate": [WORD]})
+    packs = ContentPacks(str(pack_dir))
+    packs.sync(managers)
+
+    write_pack(pack_dir, "business", "vocabulary", {"intermediate": [dict(WORD, word="receipt")]})
+    os.utime(path, (1, 1))
+    assert packs.sync(managers) == (1, 1)
+    words = all_words(managers["vocabulary"])
+    assert "receipt" in words and "invoice" not in words
+
+
+def test_invalid_items_are_skipped_and_reported(tmp_path, managers):
+    pack_dir = tmp_path / "packs"
+    write_pack(pack_dir, "broken", "vocabulary", {
+        "beginner": [{"definition": "no word here"}, WORD],
+        "advanced": "not a list",
+    })
+    write_pack(pack_dir, "broken", "grammar", {"verbs": [{"question": "Missing options ___"}]})
+    packs = ContentPacks(str(pack_dir))
+
+    assert packs.sync(managers) == (2, 0)
+    assert "invoice" in all_words(managers["vocabulary"])
+    assert all(isinstance(word_data, dict)
+               for words in managers["vocabulary"].vocabulary.values() for word_data in words)
+    assert len(packs.skipped) == 3
+    assert any("beginner[0]" in message and "'word'" in message for message in packs.skipped)
+    assert any("advanced is not a list" in message for message in packs.skipped)
+
+
+def test_unreadable_file_is_reported(tmp_path, managers):
+    path = tmp_path / "packs" / "bad" / "vocabulary.json"
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json", encoding="utf-8")
+    packs = ContentPacks(str(tmp_path / "packs"))
+
+    assert packs.sync(managers) == (0, 0)
+    assert packs.failed == [str(path)]
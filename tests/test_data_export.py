@@ -0,0 +1,44 @@
+import csv
+import json
+
+from src.answer_history import AnswerHistory
+from src.data_export import export_all_users, export_user
+
+EMAIL = "ana@example.com"
+USER = {"email": EMAIL, "name": "Ana", "level": "beginner",
+        "stats": {"total_sessions": 2}, "progress": {"vocabulary": {"beginner": 5}}}
+
+
+def history_with_answers(tmp_path):
+    history = AnswerHistory(str(tmp_path / "history"))
+    history.append(EMAIL, [
+        {"ts": 1.0, "type": "vocabulary", "item": "cat", "answer": "gato", "correct": True,
+         "latency_ms": 1840},
+        {"ts": 2.0, "type": "vocabulary", "item": "dog", "answer": "gato", "correct": False},
+    ])
+    return history
+
+
+def test_csv_export_keeps_answer_latency(tmp_path):
+    path = tmp_path / "ana.csv"
+    export_user(USER, str(path), "csv", history=history_with_answers(tmp_path))
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    answers = [row for row in rows if row["record"] == "answer"]
+    assert [row["latency_ms"] for row in answers] == ["1840", ""]
+    progress = [row for row in rows if row["record"] == "progress"]
+    assert [(row["field"], row["value"]) for row in progress] == [("vocabulary.beginner", "5")]
+
+
+def test_export_all_streams_every_user(tmp_path):
+    users_file = tmp_path / "users.json"
+    users_file.write_text(json.dumps({EMAIL: USER, "bo@example.com": {"email": "bo@example.com"}}))
+    path = tmp_path / "all.jsonl.gz"
+    seen = []
+
+    written = export_all_users(str(users_file), str(path),
+                               history=history_with_answers(tmp_path), on_progress=seen.append)
+    assert written == 3 + 2 + 3
+    assert seen == [2]
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
@@ -0,0 +1,76 @@
+import pytest
+
+from src.dialog_engine import END, DialogCompileError, compile_dialog
+
+CAFE = {
+    "title": "At the café",
+    "setting": "A busy café",
+    "start": "greet",
+    "nodes": {
+        "greet": {
+            "speaker": "Waiter", "prompt": "What can I get you?",
+            "responses": [
+                {"text": "A coffee, please.", "next": "size", "correct": True},
+                {"text": "Give coffee.", "next": "size", "feedback": "Add 'please'."},
+                {"text": "Nothing, thanks.", "next": None},
+            ],
+        },
+        "size": {
+            "speaker": "Waiter", "prompt": "Small or large?", "explanation": "Be polite.",
+            "responses": [
+                {"text": "Large, please.", "next": "bye", "correct": True},
+                {"text": "Big.", "next": "size"},
+            ],
+        },
+        "bye": {"speaker": "Waiter", "prompt": "Enjoy!"},
+    },
+}
+
+
+def test_transitions_follow_the_graph():
+    dialog = compile_dialog(CAFE)
+    node = dialog.start
+    assert dialog.node_ids[node] == "greet"
+    assert dialog.get_responses(node)[0] == "A coffee, please."
+    assert dialog.best_response(node) == "A coffee, please."
+
+    node, score, feedback = dialog.choose(node, 1)
+    assert (dialog.node_ids[node], score, feedback) == ("size", 0, "Add 'please'.")
+
+    assert dialog.node_ids[dialog.choose(node, 1)[0]] == "size"
+    node, score, _ = dialog.choose(node, 0)
+    assert score == 1
+    assert dialog.is_end(node) and dialog.response_count(node) == 0
+
+
+def test_response_without_next_ends_the_conversation():
+    dialog = compile_dialog(CAFE)
+    assert dialog.choose(dialog.start, 2)[0] == END
+
+
+def test_linear_conversations_compile_to_a_chain():
+    dialog = compile_dialog({"title": "Hotel", "interactions": [
+        {"prompt": "Hello", "responses": ["Hi", "Yo"], "correct": "Hi"},
+        {"prompt": "Your name?", "responses": ["Ana"], "correct": "Ana"},
+    ]})
+    assert dialog.node_count == 2
+    node, score, _ = dialog.choose(dialog.start, 0)
+    assert (node, score) == (1, 1)
+    assert dialog.choose(node, 0) == (END, 1, "")
+
+
+@pytest.mark.parametrize("change, problem", [
+    (lambda c: c["nodes"]["size"]["responses"].append({"text": "?", "next": "nowhere"}),
+     "unknown node 'nowhere'"),
+    (lambda c: c["nodes"].update(lost={"prompt": "Hm?"}), "unreachable nodes: lost"),
+    (lambda c: c["nodes"]["size"]["responses"].pop(0), "never reach an ending: size"),
+    (lambda c: c.update(start="missing"), "start node 'missing' does not exist"),
+    (lambda c: c["nodes"].update(size="oops"), "node 'size' is not an object"),
+])
+def test_malformed_graphs_are_rejected(change, problem):
+    conversation = {**CAFE, "nodes": {key: dict(node, responses=list(node.get("responses", [])))
+                                      for key, node in CAFE["nodes"].items()}}
+    change(conversation)
+    with pytest.raises(DialogCompileError) as error:
+        compile_dialog(conversation)
+    assert problem in str(error.value)
@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+
+from src.distractor_index import NEIGHBOURS_PER_WORD, DistractorIndex
+from src.learning_session import LearningSession
+from src.vocabulary_manager import VocabularyManager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def vocabulary(count=200):
+    categories = ("animals", "food", "travel", "work")
+    return {"beginner": [{"word": f"word{i:03d}", "definition": f"meaning number {i % 17} of a thing",
+                          "category": categories[i % len(categories)]} for i in range(count)]}
+
+
+def test_neighbours_are_bounded_and_exclude_the_word():
+    index = DistractorIndex()
+    index.build(vocabulary())
+    for word, neighbours in index.neighbours.items():
+        assert 0 < len(neighbours) <= NEIGHBOURS_PER_WORD
+        assert word not in neighbours
+        assert len(set(neighbours)) == len(neighbours)
+
+
+def test_same_category_and_close_spelling_rank_first():
+    index = DistractorIndex()
+    index.build({"beginner": [
+        {"word": "cat", "definition": "a small pet animal", "category": "animals"},
+        {"word": "bat", "definition": "a flying animal active at night", "category": "animals"},
+        {"word": "spoon", "definition": "a tool for eating soup", "category": "kitchen"},
+    ]})
+    assert index.get_neighbour_words("Cat")[0] == "bat"
+    assert [entry["word"] for entry in index.get_distractors("cat", 1)] == ["bat"]
+
+
+def test_added_word_joins_its_neighbours_lists():
+    index = DistractorIndex()
+    index.build({"beginner": [
+        {"word": "cat", "definition": "a small pet animal", "category": "animals"},
+        {"word": "spoon", "definition": "a tool for eating soup", "category": "kitchen"},
+    ]})
+    index.add({"word": "cap", "definition": "a small hat", "category": "animals"})
+    assert index.get_neighbour_words("cat")[0] == "cap"
+    assert "cat" in index.get_neighbour_words("cap")
+
+
+def test_neighbours_do_not_depend_on_the_hash_seed():
+    script = ("from tests.test_distractor_index import vocabulary\n"
+              "from src.distractor_index import DistractorIndex\n"
+              "index = DistractorIndex(); index.build(vocabulary(500))\n"
+              "print(sorted(index.neighbours.items()))")
+    runs = {subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True,
+                           capture_output=True, text=True,
+                           env={**os.environ, "PYTHONHASHSEED": seed}).stdout
+            for seed in ("1", "2")}
+    assert len(runs) == 1
+
+
+def test_multiple_choice_question_offers_the_word_once(tmp_path):
+    manager = VocabularyManager(str(tmp_path / "vocabulary.json"))
+    manager.vocabulary = vocabulary()
+    word_data = manager.vocabulary["beginner"][5]
+    question = manager.get_multiple_choice_question(word_data)
+    assert len(question["options"]) == 4
+    assert question["options"].count(word_data["word"]) == 1
+
+
+def test_interactive_session_builds_the_index_up_front(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    session = LearningSession({"email": "ana@example.com", "level": "beginner"}, None)
+    assert session.vocabulary_manager._distractor_index is not None
@@ -0,0 +1,95 @@
+import pytest
+
+from src.forgetting_model import (
+    MAX_HALF_LIFE_DAYS, SECONDS_PER_DAY, ForgettingModel, WordReviews, summarize_reviews,
+)
+
+DAY = SECONDS_PER_DAY
+
+
+def review(word, correct, day):
+    return {"type": "vocabulary", "item": word, "correct": correct, "ts": day * DAY}
+
+
+def test_recall_halves_after_one_half_life():
+    model = ForgettingModel((1.0, 0.0, 0.0))  # h = 2^1 = 2 days for every word
+    record = WordReviews(0.0)
+    assert model.recall(record, 0.0) == pytest.approx(1.0)
+    assert model.recall(record, 2 * DAY) == pytest.approx(0.5)
+    assert model.recall(record, 4 * DAY) == pytest.approx(0.25)
+
+
+def test_half_life_is_clipped():
+    model = ForgettingModel((100.0, 0.0, 0.0))
+    record = WordReviews(0.0)
+    assert model.recall(record, MAX_HALF_LIFE_DAYS * DAY) == pytest.approx(0.5)
+
+
+def test_summarize_counts_right_and_wrong():
+    reviews = summarize_reviews([review("cat", True, 0), review("cat", False, 1),
+                                 review("cat", True, 3), review("dog", True, 2),
+                                 {"type": "grammar", "item": "q", "correct": True, "ts": 0}])
+    assert set(reviews) == {"cat", "dog"}
+    assert (reviews["cat"].right, reviews["cat"].wrong, reviews["cat"].last_seen) == (2, 1, 3 * DAY)
+
+
+def test_most_forgotten_prefers_old_and_missed_words():
+    events = [review("known", True, 9), review("known", True, 10),
+              review("missed", False, 9), review("missed", False, 10),
+              review("stale", True, 0)]
+    ranked = ForgettingModel().most_forgotten(events, 3, now=11 * DAY)
+    assert [word for word, _ in ranked] == ["stale", "missed", "known"]
+    assert len(ForgettingModel().most_forgotten(events, 1, now=11 * DAY)) == 1
+
+
+def test_recall_matches_vectorized_prediction():
+    np = pytest.importorskip("numpy")
+    model = ForgettingModel((0.5, 1.2, -0.7))
+    records = []
+    for right, wrong, age_days in [(0, 0, 1.0), (3, 1, 5.0), (10, 0, 40.0), (0, 6, 0.2)]:
+        record = WordReviews(0.0)
+        record.right, record.wrong = right, wrong
+        records.append((record, age_days))
+    features = np.array([record.features() for record, _ in records])
+    lags = np.array([age for _, age in records])
+    expected = model.predict_recall(features, lags).tolist()
+    assert [model.recall(record, age * DAY) for record, age in records] == pytest.approx(expected)
+
+
+def test_fit_lowers_error_on_simulated_reviews():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    true_model = ForgettingModel((1.5, 0.8, -0.6))
+    right = rng.integers(0, 8, 2000)
+    wrong = rng.integers(0, 4, 2000)
+    features = np.column_stack([np.ones(2000), np.sqrt(1 + right), np.sqrt(1 + wrong)])
+    lags = rng.uniform(0.1, 30.0, 2000)
+    recalled = (rng.random(2000) < true_model.predict_recall(features, lags)).astype(float)
+
+    model = ForgettingModel()
+    before = float(np.mean((model.predict_recall(features, lags) - recalled) ** 2))
+    after = model.fit(features, lags, recalled)
+    assert after < before
+    assert isinstance(model.weights, list) and len(model.weights) == 3
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "model.json")
+    ForgettingModel((0.1, 0.2, 0.3)).save(path)
+    assert ForgettingModel.load(path).weights == [0.1, 0.2, 0.3]
+    assert ForgettingModel.load(str(tmp_path / "missing.json")).weights == [1.0, 1.0, -0.5]
+
+
+def test_batched_and_pure_python_scores_agree(monkeypatch):
+    pytest.importorskip("numpy")
+    import src.forgetting_model as forgetting_model
+
+    events = [review(f"w{i % 7}", i % 3 != 0, i * 0.5) for i in range(40)]
+    reviews = summarize_reviews(events)
+    model = ForgettingModel((0.8, 1.1, -0.4))
+    batched = model.score(reviews, now=30 * DAY)
+    monkeypatch.setattr(forgetting_model, "np", None)
+    pure = model.score(reviews, now=30 * DAY)
+    assert [word for word, _ in batched] == [word for word, _ in pure]
+    assert [p for _, p in batched] == pytest.approx([p for _, p in pure])
+    assert model.score({}, now=30 * DAY) == []
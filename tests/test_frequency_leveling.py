@@ -0,0 +1,52 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.frequency_leveling import level_vocabulary, load_frequency_table  # noqa: E402
+
+
+def write_table(tmp_path, text):
+    path = tmp_path / "frequencies.txt"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_bare_word_list_is_ranked_top_down(tmp_path):
+    table = load_frequency_table(write_table(tmp_path, "# most common first\nthe\nOf\n\nlook after\n"))
+    assert table == {"the": 1, "of": 2, "look after": 3}
+
+
+def test_counts_rank_in_any_order_and_skip_bad_lines(tmp_path):
+    bad_lines = []
+    table = load_frequency_table(write_table(
+        tmp_path, "cat\t20\ndog,500\nlook  after 90\nbird\tmany\nthe\t1000\ndog\t1\n"), bad_lines)
+    assert table == {"the": 1, "dog": 2, "look after": 3, "cat": 4}
+    assert bad_lines == [4]
+
+
+def word(headword, **fields):
+    return {"word": headword, "definition": "-", **fields}
+
+
+def test_levels_follow_thresholds_and_ranks():
+    vocabulary = {
+        "beginner": [word("rare"), word("unknown", frequency_rank=7)],
+        "intermediate": [word("common")],
+        "advanced": [word("edge"), word("Usual")],
+    }
+    table = {"common": 1, "usual": 3, "edge": 10, "rare": 11}
+    leveled, moved = level_vocabulary(vocabulary, table, thresholds=(3, 10))
+
+    assert [w["word"] for w in leveled["beginner"]] == ["common", "Usual", "unknown"]
+    assert [w["word"] for w in leveled["intermediate"]] == ["edge"]
+    assert [w["word"] for w in leveled["advanced"]] == ["rare"]
+    assert moved == {"beginner": 2, "intermediate": 1, "advanced": 1}
+    assert leveled["beginner"][0]["frequency_rank"] == 1
+    assert "frequency_rank" not in leveled["beginner"][2]
+
+
+def test_custom_levels_are_kept():
+    leveled, moved = level_vocabulary({"beginner": [], "travel": [word("passport")]}, {})
+    assert [w["word"] for w in leveled["travel"]] == ["passport"]
+    assert set(leveled) == {"beginner", "intermediate", "advanced", "travel"}
+    assert moved == {}
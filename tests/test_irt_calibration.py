@@ -0,0 +1,90 @@
+import json
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.answer_history import AnswerHistory  # noqa: E402
+from src.irt_calibration import collect_responses, fit_rasch, main  # noqa: E402
+
+
+def simulate(abilities, difficulties, answers_per_pair=3, seed=1):
+    rng = random.Random(seed)
+    for learner, theta in enumerate(abilities):
+        for item, b in enumerate(difficulties):
+            p = 1.0 / (1.0 + math.exp(-(theta - b)))
+            for _ in range(answers_per_pair):
+                yield f"learner{learner}", ("vocabulary", f"item{item}"), rng.random() < p
+
+
+def test_collect_indexes_learners_and_items():
+    responses = collect_responses(iter([
+        ("a", ("vocabulary", "cat"), True),
+        ("b", ("vocabulary", "cat"), False),
+        ("a", ("grammar", "q"), True),
+    ]))
+    assert responses.learners == ["a", "b"]
+    assert responses.items == [("vocabulary", "cat"), ("grammar", "q")]
+    assert responses.learner_ids.tolist() == [0, 1, 0]
+    assert responses.item_ids.tolist() == [0, 0, 1]
+    assert responses.correct.tolist() == [1.0, 0.0, 1.0]
+
+
+def test_fit_recovers_difficulty_order():
+    rng = random.Random(3)
+    abilities = [rng.gauss(0.0, 1.0) for _ in range(200)]
+    difficulties = [-2.0, -1.0, 0.0, 1.0, 2.0]
+    calibration = fit_rasch(collect_responses(simulate(abilities, difficulties)))
+
+    fitted = calibration.item_difficulties()
+    estimates = [fitted[("vocabulary", f"item{i}")] for i in range(len(difficulties))]
+    assert estimates == sorted(estimates)
+    assert abs(sum(estimates)) < 1e-6  # anchored at a zero mean
+    for estimate, true in zip(estimates, difficulties):
+        assert estimate == pytest.approx(true, abs=0.4)
+    assert calibration.converged
+    assert calibration.iterations < 100
+
+
+def test_fit_cut_short_is_not_converged():
+    rng = random.Random(3)
+    abilities = [rng.gauss(0.0, 1.0) for _ in range(50)]
+    calibration = fit_rasch(collect_responses(simulate(abilities, [-1.0, 0.0, 1.0])),
+                            max_iterations=2)
+    assert calibration.iterations == 2
+    assert not calibration.converged
+
+
+@pytest.mark.parametrize("iterations, message", [
+    ("1", "did not converge within 1 iterations"),
+    ("200", "Fit converged after"),
+])
+def test_cli_reports_whether_the_fit_converged(tmp_path, capsys, iterations, message):
+    history = AnswerHistory(str(tmp_path / "history"))
+    users = {}
+    for learner, item, correct in simulate([-1.0, 0.0, 1.0], [-0.5, 0.5]):
+        email = f"{learner}@example.com"
+        users[email] = {"email": email}
+        history.append(email, [{"type": item[0], "item": item[1], "correct": correct}])
+    (tmp_path / "users.json").write_text(json.dumps(users))
+
+    main(["--users-file", str(tmp_path / "users.json"), "--history-dir", str(tmp_path / "history"),
+          "--iterations", iterations, "--dry-run"])
+    assert message in capsys.readouterr().out
+
+
+def test_perfect_learner_stays_finite():
+    answers = [("ace", ("grammar", f"q{i}"), True) for i in range(5)]
+    answers += [("mid", ("grammar", f"q{i}"), i % 2 == 0) for i in range(5)]
+    calibration = fit_rasch(collect_responses(iter(answers)))
+    abilities = calibration.learner_abilities()
+    assert np.isfinite(list(abilities.values())).all()
+    assert abilities["ace"] > abilities["mid"]
+
+
+def test_no_responses():
+    calibration = fit_rasch(collect_responses(iter([])))
+    assert calibration.iterations == 0
+    assert calibration.item_difficulties() == {}
@@ -0,0 +1,48 @@
+from src.item_stats import MIN_ATTEMPTS, ItemStats
+
+
+def answer(stats, item, errors, attempts, ts=1000.0, kind="vocabulary"):
+    for i in range(attempts):
+        stats.observe(kind, item, i >= errors, ts + i)
+
+
+def test_hardest_orders_by_error_rate(tmp_path):
+    stats = ItemStats(str(tmp_path / "stats.json"), autosave=False)
+    answer(stats, "easy", 0, 6)
+    answer(stats, "hard", 6, 6)
+    answer(stats, "medium", 3, 6)
+    assert [row["item"] for row in stats.hardest("vocabulary")] == ["hard", "medium", "easy"]
+
+
+def test_hardest_skips_stale_entries(tmp_path):
+    stats = ItemStats(str(tmp_path / "stats.json"), autosave=False)
+    answer(stats, "cat", 5, 5)
+    answer(stats, "dog", 2, 5)
+    # Correct answers make "cat" easier; its earlier heap entries are now stale
+    for i in range(20):
+        stats.observe("vocabulary", "cat", True, 2000.0 + i)
+    rows = stats.hardest("vocabulary", limit=5)
+    assert [row["item"] for row in rows] == ["dog", "cat"]
+    assert rows[1]["attempts"] == 25
+    # Asking again gives the same answer: live entries are pushed back
+    assert stats.hardest("vocabulary", limit=5) == rows
+
+
+def test_items_with_few_attempts_are_not_ranked(tmp_path):
+    stats = ItemStats(str(tmp_path / "stats.json"), autosave=False)
+    answer(stats, "new", MIN_ATTEMPTS - 1, MIN_ATTEMPTS - 1)
+    assert stats.hardest("vocabulary") == []
+    stats.observe("vocabulary", "new", False, 5000.0)
+    assert [row["item"] for row in stats.hardest("vocabulary")] == ["new"]
+
+
+def test_saves_from_two_processes_add_up(tmp_path):
+    path = str(tmp_path / "stats.json")
+    first, second = ItemStats(path), ItemStats(path)
+    answer(first, "cat", 3, 3)
+    first.save()
+    answer(second, "cat", 0, 3)
+    second.save()
+    reloaded = ItemStats(path)
+    row = reloaded.hardest("vocabulary")[0]
+    assert (row["attempts"], row["errors"]) == (6, 3)
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from src.content_loader import BackgroundLoader
+from src.json_stream import iter_grouped_items, iter_grouped_spans, iter_object_items
+
+CONTENT = {
+    "beginner": [{"word": "café", "examples": ["A \"quoted\" [bracket] {brace}"]}, {"word": "dog"}],
+    "empty": [],
+    "numbers": [12345, -0.5, "x", None, True],
+}
+
+
+def write(tmp_path, data, indent=None):
+    path = tmp_path / "content.json"
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=indent), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("read_size", [1, 3, 7, 1 << 16])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_items_match_a_full_parse_at_any_buffer_size(tmp_path, read_size, indent):
+    path = write(tmp_path, CONTENT, indent)
+    items = list(iter_grouped_items(path, read_size))
+    assert items == [(group, i, item) for group, group_items in CONTENT.items()
+                     for i, item in enumerate(group_items)]
+
+
+def test_spans_are_the_source_text_of_each_item(tmp_path):
+    path = write(tmp_path, CONTENT, indent=2)
+    for group, index, item, text in iter_grouped_spans(path, 5):
+        assert json.loads(text) == item
+
+
+def test_object_members_stream_one_at_a_time(tmp_path):
+    users = {"ana@example.com": {"level": "beginner"}, "bo@example.com": {"level": "advanced"}}
+    assert dict(iter_object_items(write(tmp_path, users), 4)) == users
+    assert list(iter_object_items(write(tmp_path, {}))) == []
+
+
+@pytest.mark.parametrize("text", ['{"a": [1, 2', '{"a": {"b": 1}}', '[1, 2]', '{"a": [1 2]}'])
+def test_malformed_files_raise_value_error(tmp_path, text):
+    path = tmp_path / "bad.json"
+    path.write_text(text)
+    with pytest.raises(ValueError):
+        list(iter_grouped_items(str(path), 2))
+
+
+def test_background_loader_fills_groups_in_order(tmp_path):
+    content = {"beginner": [{"word": f"w{i}"} for i in range(100)], "advanced": [{"word": "z"}]}
+    loader = BackgroundLoader(write(tmp_path, content)).start()
+    loader.wait_for("beginner", 40)
+    assert len(loader.groups["beginner"]) >= 40
+    loader.wait()
+    assert loader.done and loader.error is None
+    assert loader.groups == content
+
+
+def test_background_loader_reports_bad_files(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text('{"beginner": [{"word": "cat"}, ')
+    loader = BackgroundLoader(str(path)).start()
+    loader.wait_for("advanced", 1)  # returns once the file is done, even without the group
+    loader.wait()
+    assert isinstance(loader.error, ValueError)
+    assert loader.groups == {"beginner": [{"word": "cat"}]}
@@ -0,0 +1,48 @@
+from src.latency_histogram import (BUCKET_BOUNDS_MS, LatencyHistogram, hesitation_ms,
+                                   merged_histogram, record_latencies)
+
+
+def test_answers_land_in_their_bucket():
+    histogram = LatencyHistogram()
+    for latency_ms in (0, 500, 501, 999_999):
+        histogram.record(latency_ms)
+    assert histogram.counts[0] == 2
+    assert histogram.counts[1] == 1
+    assert histogram.counts[-1] == 1
+    assert len(histogram.counts) == len(BUCKET_BOUNDS_MS) + 1
+
+
+def test_percentiles_interpolate_inside_the_bucket():
+    histogram = LatencyHistogram()
+    for _ in range(4):
+        histogram.record(2500)
+    assert histogram.percentile(0.5) == 2500
+    assert histogram.percentile(1.0) == 3000
+    assert LatencyHistogram().percentile(0.5) is None
+
+
+def test_open_ended_bucket_reports_the_last_bound():
+    histogram = LatencyHistogram()
+    histogram.record(120_000)
+    assert histogram.percentile(0.9) == BUCKET_BOUNDS_MS[-1]
+
+
+def test_topics_merge_by_summing_counts():
+    profile = {}
+    record_latencies(profile, "vocabulary", "animals", [300, 1200])
+    record_latencies(profile, "vocabulary", None, [300])
+    record_latencies(profile, "grammar", "tenses", [4500])
+
+    assert set(profile["latency"]["vocabulary"]) == {"animals", "general"}
+    assert merged_histogram(profile, "vocabulary").total == 3
+    assert merged_histogram(profile).total == 4
+    assert merged_histogram(profile, "vocabulary").counts[0] == 2
+
+
+def test_hesitation_uses_own_pace_once_there_are_enough_answers():
+    profile = {}
+    record_latencies(profile, "vocabulary", None, [2500] * 10)
+    assert hesitation_ms(profile, "vocabulary", default=8000) == 8000
+
+    record_latencies(profile, "vocabulary", None, [2500] * 30)
+    assert hesitation_ms(profile, "vocabulary", default=8000) == 2800
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from src.near_duplicates import NearDuplicateIndex, _batch_signatures, shingles, signature
+
+
+def test_batch_signatures_match_pure_python():
+    pytest.importorskip("numpy")
+    rng = random.Random(7)
+    texts = ["a", "to go", "the quick brown fox"] + [
+        "".join(rng.choice("abcdefgh ") for _ in range(rng.randint(1, 80))) for _ in range(200)]
+    shingle_sets = [shingles(text) for text in texts]
+    assert _batch_signatures(shingle_sets) == [signature(s) for s in shingle_sets]
+
+
+def test_batch_signatures_split_into_blocks(monkeypatch):
+    pytest.importorskip("numpy")
+    import src.near_duplicates as near_duplicates
+
+    monkeypatch.setattr(near_duplicates, "SIGNATURE_BATCH_VALUES", near_duplicates.NUM_PERM * 10)
+    shingle_sets = [shingles(f"sentence number {i} about cats") for i in range(30)]
+    assert _batch_signatures(shingle_sets) == [signature(s) for s in shingle_sets]
+
+
+def test_find_matches_near_duplicates_only():
+    index = NearDuplicateIndex(threshold=0.6)
+    index.build([(1, "She has lived here since 2010."),
+                 (2, "Where did you go last weekend?")])
+    assert [key for key, _ in index.find("She has lived here since 2010!")] == [1]
+    assert index.find("Completely unrelated text about trains") == []
+
+
+def test_add_reports_existing_duplicates():
+    index = NearDuplicateIndex()
+    assert index.add("a", "I have been waiting for an hour") == []
+    matches = index.add("b", "I have been waiting for one hour")
+    assert [key for key, _ in matches] == ["a"]
+    assert 0.6 <= matches[0][1] < 1.0
+
+
+def test_clusters_group_transitive_duplicates():
+    index = NearDuplicateIndex()
+    index.build([("x", "If it rains, we will stay at home."),
+                 ("y", "If it rains we will stay at home"),
+                 ("z", "If it rains, we'll stay at home."),
+                 ("w", "My brother is taller than me.")])
+    clusters = index.clusters()
+    assert len(clusters) == 1
+    assert sorted(clusters[0]) == ["x", "y", "z"]
@@ -0,0 +1,44 @@
+import pytest
+
+from src.normalization import normalize_answer, option_keys
+
+
+@pytest.mark.parametrize("text", ["Café", "cafe", " CAFE. ", "café!", "Café"])
+def test_accents_case_and_punctuation_collapse(text):
+    assert normalize_answer(text) == "cafe"
+
+
+@pytest.mark.parametrize("text", ["it's", "it’s", "it‘s", "it`s", "it´s", "IT'S"])
+def test_apostrophes_share_one_key(text):
+    assert normalize_answer(text) == "it's"
+
+
+def test_left_quote_typed_as_apostrophe_is_not_dropped():
+    assert normalize_answer("don‘t") == normalize_answer("don't") != normalize_answer("don t")
+
+
+@pytest.mark.parametrize("first, second", [
+    ("it's", "its"),
+    ("we'll", "well"),
+    ("can't", "cant"),
+    ("look up", "lookup"),
+])
+def test_distinct_answers_keep_distinct_keys(first, second):
+    assert normalize_answer(first) != normalize_answer(second)
+
+
+def test_whitespace_runs_collapse():
+    assert normalize_answer("  give \t up\n") == "give up"
+
+
+def test_option_keys_map_back_to_options():
+    assert option_keys(["Has gone", "went"]) == {"has gone": "Has gone", "went": "went"}
+
+
+def test_option_keys_drop_colliding_options():
+    keys = option_keys(["It's", "its", "it’s!", "go"])
+    assert keys == {"its": "its", "go": "go"}
+
+
+def test_option_keys_keep_repeated_identical_option():
+    assert option_keys(["go", "go"]) == {"go": "go"}
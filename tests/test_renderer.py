@@ -0,0 +1,73 @@
+import io
+import os
+import sys
+
+import pytest
+
+from src import renderer as renderer_module
+from src.renderer import CLEAR, FrameRenderer
+
+
+@pytest.fixture
+def screen(monkeypatch):
+    monkeypatch.setattr(renderer_module.shutil, "get_terminal_size",
+                        lambda: os.terminal_size((80, 24)))
+    stream = io.StringIO()
+    return stream, FrameRenderer(stream, ansi=True)
+
+
+def take(stream):
+    data = stream.getvalue()
+    stream.seek(0)
+    stream.truncate()
+    return data
+
+
+def test_next_frame_rewrites_only_changed_lines(screen):
+    stream, renderer = screen
+    renderer.present("Question 1/5\n-----\ncat\n")
+    assert take(stream).startswith(CLEAR)
+
+    renderer.track("Your answer: gato\n")
+    renderer.echo("✅ Correct!")
+    take(stream)
+    renderer.present("Question 2/5\n-----\ndog\n")
+
+    drawn = take(stream)
+    assert CLEAR not in drawn
+    assert "Question 2/5" in drawn and "dog" in drawn
+    assert "-----" not in drawn
+    assert renderer.lines_written == 3 + 2
+
+
+def test_frame_is_redrawn_once_output_below_it_could_scroll(screen):
+    stream, renderer = screen
+    renderer.present("one\ntwo\n")
+    for _ in range(22):
+        renderer.echo("feedback")
+    take(stream)
+
+    renderer.present("one\nthree\n")
+    assert take(stream).startswith(CLEAR)
+
+
+def test_wrapped_lines_count_as_several_rows(screen):
+    _, renderer = screen
+    renderer.present("frame\n")
+    renderer.track("x" * 170 + "\n")
+    assert renderer.below == 3
+
+
+def test_stdout_is_left_alone(screen):
+    _, renderer = screen
+    stdout = sys.stdout
+    renderer.present("frame\n")
+    assert sys.stdout is stdout
+
+
+def test_frame_captures_echoes_inside_it(screen):
+    stream, renderer = screen
+    with renderer.frame():
+        print("title")
+        renderer.echo("status")
+    assert take(stream) == CLEAR + "title\nstatus\n"
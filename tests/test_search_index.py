@@ -0,0 +1,84 @@
+import math
+
+import src.search_index as search_index
+from src.search_index import B, K1, SearchIndex, tokenize
+
+VOCABULARY = {
+    "beginner": [
+        {"word": "apple", "definition": "a round red or green fruit",
+         "examples": ["I eat an apple every day."]},
+        {"word": "pear", "definition": "a sweet fruit, narrower at the top",
+         "examples": ["This pear tastes like an apple."]},
+        {"word": "car", "definition": "a road vehicle with an engine", "examples": []},
+    ],
+    "intermediate": [
+        {"word": "orchard", "definition": "a field of fruit trees such as apple trees",
+         "examples": ["We walked through the orchard."]},
+    ],
+}
+
+
+def words(results):
+    return [entry["word"] for _, entry in results]
+
+
+def bm25_scores(index, term):
+    """Exhaustive single-term BM25, for checking the index against"""
+    count = len(index.documents)
+    average_length = index.total_length / count
+    postings = index.postings[term]
+    df = len(postings.docs)
+    idf = math.log(1.0 + (count - df + 0.5) / (df + 0.5))
+    return {doc: idf * tf * (K1 + 1.0)
+            / (tf + K1 * (1.0 - B + B * index.lengths[doc] / average_length))
+            for doc, tf in zip(postings.docs, postings.freqs)}
+
+
+def test_tokenize():
+    assert tokenize("Don't STOP, 2 go!") == ["don", "t", "stop", "2", "go"]
+
+
+def test_headword_matches_rank_first():
+    index = SearchIndex()
+    index.build(VOCABULARY)
+    assert words(index.search("apple")) == ["apple", "orchard", "pear"]
+
+
+def test_prefix_expansion_and_misses():
+    index = SearchIndex()
+    index.build(VOCABULARY)
+    assert words(index.search("orch")) == ["orchard"]
+    assert index.search("zebra") == []
+    assert SearchIndex().search("apple") == []
+
+
+def test_added_words_are_searchable():
+    index = SearchIndex()
+    index.build(VOCABULARY)
+    index.add({"word": "carrot", "definition": "an orange root vegetable", "examples": []})
+    assert words(index.search("carrot")) == ["carrot"]
+    assert words(index.search("carr")) == ["carrot"]
+    assert words(index.search("vegetable")) == ["carrot"]
+
+
+def test_limit():
+    index = SearchIndex()
+    index.build(VOCABULARY)
+    assert len(index.search("fruit", limit=2)) == 2
+
+
+def test_top_tier_is_exact_for_single_terms(monkeypatch):
+    monkeypatch.setattr(search_index, "TOP_TIER", 5)
+    entries = [{"word": f"word{i}", "definition": "common " * (1 + i % 4) + f"filler{i % 7}",
+                "examples": []} for i in range(60)]
+    index = SearchIndex()
+    index.build({"all": entries[:40]})
+    for entry in entries[40:]:
+        index.add(entry)
+    assert index.postings["common"].tier is not None
+
+    expected = sorted(bm25_scores(index, "common").values(), reverse=True)[:5]
+    results = index.search("common", limit=5)
+    # Tier impacts are taken when a posting enters the tier, so allow for the drift in average length
+    for (score, _), best in zip(results, expected):
+        assert abs(score - best) < 0.05 * best
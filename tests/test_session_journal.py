@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from src.answer_history import AnswerHistory
+from src.item_stats import ItemStats
+from src.learning_session import LearningSession
+from src.session_journal import SessionJournal
+from src.user_manager import UserManager
+
+EMAIL = "ana@example.com"
+
+
+def event(item, correct, ts):
+    return {"ts": ts, "type": "vocabulary", "item": item, "answer": item, "correct": correct}
+
+
+def test_round_trip_keeps_header_and_events(tmp_path):
+    journal = SessionJournal(str(tmp_path))
+    events = [event("cat", True, 100.0), event("café", False, 101.5)]
+    for answer in events:
+        journal.write(EMAIL, "vocabulary", answer)
+    journal.release(EMAIL)
+
+    header, read_back = SessionJournal(str(tmp_path)).read(EMAIL)
+    assert header["category"] == "vocabulary"
+    assert read_back == events
+
+
+def test_open_journal_is_not_recovered(tmp_path):
+    journal = SessionJournal(str(tmp_path))
+    journal.write(EMAIL, "grammar", event("q", True, 1.0))
+    assert journal.read(EMAIL) is None
+    journal.close(EMAIL)
+    assert not journal.exists(EMAIL)
+
+
+def test_torn_last_line_is_skipped(tmp_path):
+    journal = SessionJournal(str(tmp_path))
+    journal.write(EMAIL, "vocabulary", event("cat", True, 1.0))
+    journal.release(EMAIL)
+    with open(journal._path(EMAIL), "a", encoding="utf-8") as f:
+        f.write('{"ts": 2.0, "type": "vocab')
+
+    _, events = SessionJournal(str(tmp_path)).read(EMAIL)
+    assert [answer["item"] for answer in events] == ["cat"]
+
+
+@pytest.fixture
+def session(tmp_path):
+    users = UserManager(str(tmp_path / "users.json"), autosave=False)
+    user = users.users[EMAIL] = {
+        "email": EMAIL,
+        "level": "beginner",
+        "stats": {"total_sessions": 0, "words_learned": 0, "correct_answers": 0,
+                  "total_answers": 0, "study_time_minutes": 0, "study_time_seconds": 0,
+                  "streak_days": 0, "last_study_date": None},
+        "progress": {kind: {"beginner": 0, "intermediate": 0, "advanced": 0}
+                     for kind in ("vocabulary", "grammar")},
+    }
+    return LearningSession(user, users,
+                           answer_history=AnswerHistory(str(tmp_path / "history")),
+                           journal=SessionJournal(str(tmp_path / "journal")),
+                           item_stats=ItemStats(str(tmp_path / "item_stats.json")))
+
+
+def test_recovery_folds_answers_into_profile(tmp_path, session):
+    crashed = SessionJournal(str(tmp_path / "journal"))
+    for answer in [event("cat", True, 100.0), event("dog", False, 130.0), event("cow", True, 160.0)]:
+        crashed.write(EMAIL, "vocabulary", answer)
+    crashed.release(EMAIL)
+
+    assert session.recover_interrupted_session() == {
+        "category": "vocabulary", "correct": 2, "total": 3}
+
+    stats = session.user["stats"]
+    assert (stats["total_sessions"], stats["correct_answers"], stats["total_answers"]) == (1, 2, 3)
+    assert stats["words_learned"] == 2
+    assert [answer["item"] for answer in session.answer_history.iter_events(EMAIL)] == [
+        "cat", "dog", "cow"]
+    assert session.item_stats.attempts[session.item_stats.slots[("vocabulary", "dog")]] == 1
+    assert not session.journal.exists(EMAIL)
+    assert session.recover_interrupted_session() is None
+
+
+def test_empty_journal_is_discarded(tmp_path, session):
+    (tmp_path / "journal").mkdir()
+    with open(session.journal._path(EMAIL), "w", encoding="utf-8") as f:
+        f.write(json.dumps({"category": "grammar", "started": 1.0}) + "\n")
+
+    assert session.recover_interrupted_session() is None
+    assert not session.journal.exists(EMAIL)
+    assert session.user["stats"]["total_sessions"] == 0